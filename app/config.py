@@ -31,6 +31,10 @@ class DaemonSettings(BaseSettings):
     port: int = Field(default=8001, description="Server port")
     log_level: str = Field(default="info", description="Logging level")
     reload: bool = Field(default=False, description="Enable auto-reload on code changes")
+    cors_origins: str = Field(
+        default="*",
+        description="Comma-separated list of allowed CORS origins ('*' allows any origin without credentials)"
+    )
 
     # WebSocket settings
     ws_update_rate_hz: float = Field(
@@ -39,12 +43,47 @@ class DaemonSettings(BaseSettings):
         le=100.0,
         description="WebSocket position update rate in Hz"
     )
+    ws_batch_ms: float = Field(
+        default=0.0,
+        ge=0.0,
+        le=1000.0,
+        description="Coalesce position updates over this window (ms) into one 'multi' frame (0 = send every tick immediately)"
+    )
+    ws_batch_max: int = Field(
+        default=10,
+        ge=1,
+        le=100,
+        description="Maximum number of position updates coalesced into one 'multi' frame"
+    )
+    ws_changed_only: bool = Field(
+        default=False,
+        description="Stream only axes whose state changed since the previous update (periodic full snapshots)"
+    )
+    ws_full_snapshot_ticks: int = Field(
+        default=50,
+        ge=1,
+        description="In changed-only mode, send a full position snapshot every N updates"
+    )
+    ws_send_timeout_s: float = Field(
+        default=0.5,
+        gt=0.0,
+        description="Drop a WebSocket client whose frame cannot be sent within this many seconds"
+    )
+    ws_per_message_deflate: bool = Field(
+        default=True,
+        description="Negotiate permessage-deflate compression for WebSocket frames"
+    )
 
     # Auto-connect behavior
     auto_connect_on_start: bool = Field(
         default=True,
         description="Automatically connect to the probe station during daemon startup"
     )
+    reconnect_idle_interval_s: float = Field(
+        default=5.0,
+        gt=0.0,
+        description="Seconds between connection checks while disconnected (reconnect attempts back off exponentially)"
+    )
 
     # Timeout settings
     connection_timeout_s: float = Field(
@@ -55,6 +94,11 @@ class DaemonSettings(BaseSettings):
         default=60.0,
         description="Default movement timeout in seconds"
     )
+    connection_check_ttl_s: float = Field(
+        default=0.5,
+        ge=0.0,
+        description="Seconds a successful connection check is reused by request dependencies (0 disables caching)"
+    )
 
     # Safety settings
     auto_disconnect_on_error: bool = Field(
@@ -6,7 +6,7 @@ import asyncio
 import logging
 import threading
 from pathlib import Path
-from typing import Optional, Dict, List, Tuple, Any, Callable
+from typing import Optional, Dict, List, Tuple, Any, Callable, Mapping, Sequence, Union
 from enum import Enum
 import time
 
@@ -22,10 +22,11 @@ clr.AddReference(str(dll_path / "srgmc.dll"))
 # Import the .NET namespace
 import SurugaSeiki.Motion as Motion # type: ignore
 from .config import settings
+from .task_manager import ProgressEvent
 from .models import (
     AxisStatus,
     ProfileDataResponse,
-    ProfileDataPoint,
+    ProfileArrays,
     ProfileErrorCode,
     ProfileMeasurementStatus,
     ProfileMeasurementRequest,
@@ -36,7 +37,9 @@ from .models import (
     AdjustingStatus,
     FlatAlignmentRequest,
     FocusAlignmentRequest,
-    AlignmentResponse
+    AlignmentResponse,
+    OpticalAlignmentStatus,
+    AligningStatusPhase,
 )
 
 logger = logging.getLogger(__name__)
@@ -56,6 +59,19 @@ class SurugaSeikiController:
     - Digital and analog I/O control
     """
 
+    # pythonnet marshals System.Double returns (GetActualPosition, GetPower,
+    # GetAnalogValue) to Python float, so those results are used without float()
+
+    # IO enum values resolved once; each Motion.IO attribute walk crosses pythonnet
+    _DIGITAL_OUTPUT_TYPE = Motion.IO.DigitalIOType.Output
+    _ANALOG_INPUT_TYPE = Motion.IO.AnalogIOType.Input
+    # Alignment status while an alignment is still running
+    _ALIGNMENT_ALIGNING = Motion.Alignment.Status.Aligning
+
+    # Contact sensing IO channels available on DA1000/DA1100
+    _DIGITAL_CHANNELS = frozenset((1, 2))
+    _ANALOG_CHANNELS = frozenset((5, 6))
+
     def __init__(
         self,
         ads_address: str = "5.146.68.190.1.1",
@@ -129,7 +145,7 @@ class SurugaSeikiController:
                 # Wait for connection to establish with timeout (similar to legacy daemon)
                 timeout_s = getattr(settings, "connection_timeout_s", 5.0)
                 poll_interval = 0.5
-                start_time = time.time()
+                start_time = time.perf_counter()
                 while True:
                     try:
                         if self._system.Connected:
@@ -138,7 +154,7 @@ class SurugaSeikiController:
                         # If property access throws, keep waiting until timeout
                         pass
 
-                    if time.time() - start_time > timeout_s:
+                    if time.perf_counter() - start_time > timeout_s:
                         logger.error(f"Failed to connect to probe station within {timeout_s}s")
                         return False
                     time.sleep(poll_interval)
@@ -158,8 +174,8 @@ class SurugaSeikiController:
                 # Initialize angle adjustment for both stages (DA1100 only)
                 try:
                     # AngleAdjustment requires stage argument: 1=LEFT, 2=RIGHT
-                    self._angle_adjustment_left = Motion.AngleAdjustment(AngleAdjustmentStage.LEFT.value)
-                    self._angle_adjustment_right = Motion.AngleAdjustment(AngleAdjustmentStage.RIGHT.value)
+                    self._angle_adjustment_left = Motion.AngleAdjustment(int(AngleAdjustmentStage.LEFT))
+                    self._angle_adjustment_right = Motion.AngleAdjustment(int(AngleAdjustmentStage.RIGHT))
                     logger.info("AngleAdjustment initialized for both LEFT and RIGHT stages")
                 except Exception as e:
                     logger.error(f"Failed to initialize AngleAdjustment (DA1000 model or error): {e}", exc_info=True)
@@ -395,11 +411,11 @@ class SurugaSeikiController:
             logger.error("Not connected to controller")
             return False
 
-        start_time = time.time()
+        start_time = time.perf_counter()
         pending_axes = set(axis_numbers)
 
         while pending_axes:
-            if time.time() - start_time > timeout:
+            if time.perf_counter() - start_time > timeout:
                 logger.error(f"Timeout waiting for axes to reach ready state: {pending_axes}")
                 return False
 
@@ -456,7 +472,7 @@ class SurugaSeikiController:
             # Wait for movement to complete
             time.sleep(0.1)  # Initial delay to allow movement to start
             timeout = 120  # 120 seconds timeout
-            start_time = time.time()
+            start_time = time.perf_counter()
 
             while True:
                 try:
@@ -471,7 +487,7 @@ class SurugaSeikiController:
                     logger.info(f"Axis {axis_number} movement completed")
                     return True
 
-                if time.time() - start_time > timeout:
+                if time.perf_counter() - start_time > timeout:
                     logger.error(f"Axis {axis_number} movement timed out after {timeout}s")
                     return False
 
@@ -505,7 +521,7 @@ class SurugaSeikiController:
             # Wait for movement to complete
             time.sleep(0.1)  # Initial delay to allow movement to start
             timeout = 120  # 120 seconds timeout
-            start_time = time.time()
+            start_time = time.perf_counter()
 
             while True:
                 try:
@@ -520,7 +536,7 @@ class SurugaSeikiController:
                     logger.info(f"Axis {axis_number} movement completed")
                     return True
 
-                if time.time() - start_time > timeout:
+                if time.perf_counter() - start_time > timeout:
                     logger.error(f"Axis {axis_number} movement timed out after {timeout}s")
                     return False
 
@@ -600,7 +616,7 @@ class SurugaSeikiController:
 
                 # Get initial position
                 try:
-                    initial_position = float(axis.GetActualPosition())
+                    initial_position = axis.GetActualPosition()
                 except Exception:
                     initial_position = None
 
@@ -620,7 +636,7 @@ class SurugaSeikiController:
 
                 time.sleep(0.1)  # Initial delay
                 timeout = 120
-                start_time = time.time()
+                start_time = time.perf_counter()
 
                 while True:
                     # Check cancellation FIRST
@@ -642,7 +658,7 @@ class SurugaSeikiController:
 
                     # Get current position for progress
                     try:
-                        current_position = float(axis.GetActualPosition())
+                        current_position = axis.GetActualPosition()
                     except Exception:
                         current_position = None
 
@@ -658,7 +674,7 @@ class SurugaSeikiController:
                                 "target_position": position,
                                 "current_position": current_position,
                                 "progress_percent": progress_percent,
-                                "elapsed_time": time.time() - start_time
+                                "elapsed_time": time.perf_counter() - start_time
                             })
 
                     if not is_moving:
@@ -667,11 +683,11 @@ class SurugaSeikiController:
 
                         # Re-read position after settling
                         try:
-                            current_position = float(axis.GetActualPosition())
+                            current_position = axis.GetActualPosition()
                         except Exception:
                             pass
 
-                        elapsed = time.time() - start_time
+                        elapsed = time.perf_counter() - start_time
                         logger.info(f"Axis {axis_number} movement completed in {elapsed:.2f}s")
 
                         if progress_callback:
@@ -692,7 +708,7 @@ class SurugaSeikiController:
                             "execution_time": elapsed
                         }
 
-                    if time.time() - start_time > timeout:
+                    if time.perf_counter() - start_time > timeout:
                         axis.Stop()
                         raise Exception(f"Movement timed out after {timeout}s")
 
@@ -752,7 +768,7 @@ class SurugaSeikiController:
 
                 # Get initial position
                 try:
-                    initial_position = float(axis.GetActualPosition())
+                    initial_position = axis.GetActualPosition()
                     target_position = initial_position + distance
                 except Exception:
                     initial_position = None
@@ -775,7 +791,7 @@ class SurugaSeikiController:
 
                 time.sleep(0.1)  # Initial delay
                 timeout = 120
-                start_time = time.time()
+                start_time = time.perf_counter()
 
                 while True:
                     # Check cancellation FIRST
@@ -797,7 +813,7 @@ class SurugaSeikiController:
 
                     # Get current position for progress
                     try:
-                        current_position = float(axis.GetActualPosition())
+                        current_position = axis.GetActualPosition()
                     except Exception:
                         current_position = None
 
@@ -814,7 +830,7 @@ class SurugaSeikiController:
                                 "current_position": current_position,
                                 "target_position": target_position,
                                 "progress_percent": progress_percent,
-                                "elapsed_time": time.time() - start_time
+                                "elapsed_time": time.perf_counter() - start_time
                             })
 
                     if not is_moving:
@@ -823,11 +839,11 @@ class SurugaSeikiController:
 
                         # Re-read position after settling
                         try:
-                            current_position = float(axis.GetActualPosition())
+                            current_position = axis.GetActualPosition()
                         except Exception:
                             pass
 
-                        elapsed = time.time() - start_time
+                        elapsed = time.perf_counter() - start_time
                         logger.info(f"Axis {axis_number} relative movement completed in {elapsed:.2f}s")
 
                         if progress_callback:
@@ -849,7 +865,7 @@ class SurugaSeikiController:
                             "execution_time": elapsed
                         }
 
-                    if time.time() - start_time > timeout:
+                    if time.perf_counter() - start_time > timeout:
                         axis.Stop()
                         raise Exception(f"Movement timed out after {timeout}s")
 
@@ -875,40 +891,92 @@ class SurugaSeikiController:
             return None
 
         try:
-            axis = self._axis_components[axis_number]
+            return self._read_axis_status(axis_number, self._axis_components[axis_number])
+        except Exception as e:
+            logger.error(f"Error getting position for axis {axis_number}: {e}")
+            return None
 
-            # Query actual position
-            actual_position = axis.GetActualPosition()
+    def _read_axis_status(self, axis_number: int, axis: Any) -> AxisStatus:
+        """
+        Build AxisStatus for an already validated axis component.
 
-            try:
-                is_moving = bool(axis.IsMoving())
-            except Exception:
-                try:
-                    is_moving = str(axis.GetStatus()).lower() == "moving"
-                except Exception:
-                    is_moving = False
+        Args:
+            axis_number: Axis number (1-12)
+            axis: AxisComponents instance for the axis
 
-            try:
-                is_servo_on = bool(axis.IsServoOn())
-            except Exception:
-                is_servo_on = False
+        Returns:
+            AxisStatus object
+
+        Raises:
+            Exception: If the actual position cannot be read
+        """
+        return AxisStatus(**self._read_axis_state(axis_number, axis))
+
+    def _read_axis_state(self, axis_number: int, axis: Any) -> Dict[str, Any]:
+        """
+        Read axis state as a plain dict with the same keys (and order) as AxisStatus.
+
+        Used directly by the streaming snapshot, which serializes the dict as-is
+        and has no use for a validated model.
 
+        Args:
+            axis_number: Axis number (1-12)
+            axis: AxisComponents instance for the axis
+
+        Returns:
+            Dictionary of AxisStatus fields
+
+        Raises:
+            Exception: If the actual position cannot be read
+        """
+        # Query actual position
+        actual_position = axis.GetActualPosition()
+
+        try:
+            is_moving = bool(axis.IsMoving())
+        except Exception:
             try:
-                error_code = int(axis.GetErrorCode())
+                is_moving = str(axis.GetStatus()).lower() == "moving"
             except Exception:
-                error_code = 0
-
-            return AxisStatus(
-                axis_number=axis_number,
-                actual_position=actual_position,
-                is_moving=is_moving,
-                is_servo_on=is_servo_on,
-                is_error=error_code != 0,
-                error_code=error_code
-            )
-        except Exception as e:
-            logger.error(f"Error getting position for axis {axis_number}: {e}")
-            return None
+                is_moving = False
+
+        try:
+            is_servo_on = bool(axis.IsServoOn())
+        except Exception:
+            is_servo_on = False
+
+        try:
+            error_code = int(axis.GetErrorCode())
+        except Exception:
+            error_code = 0
+
+        return {
+            "axis_number": axis_number,
+            "actual_position": actual_position,
+            "is_moving": is_moving,
+            "is_servo_on": is_servo_on,
+            "is_error": error_code != 0,
+            "error_code": error_code
+        }
+
+    def get_positions(self, axis_numbers: Sequence[int]) -> List[float]:
+        """
+        Read actual positions for several axes in one pass.
+
+        The DLL has no bulk position query, so the axis handles are resolved
+        up front and read back-to-back in a single comprehension.
+
+        Args:
+            axis_numbers: Axis numbers (1-12)
+
+        Returns:
+            Actual positions in the same order as axis_numbers
+
+        Raises:
+            KeyError: If an axis number is not initialized
+        """
+        axes = [self._axis_components[axis_number] for axis_number in axis_numbers]
+        return [axis.GetActualPosition() for axis in axes]
 
     def wait_for_axis_stop(self, axis_number: int, timeout: float = 120.0) -> bool:
         """
@@ -926,7 +994,7 @@ class SurugaSeikiController:
 
         try:
             axis = self._axis_components[axis_number]
-            start_time = time.time()
+            start_time = time.perf_counter()
 
             while True:
                 try:
@@ -939,7 +1007,7 @@ class SurugaSeikiController:
 
                 if not moving:
                     break
-                if time.time() - start_time > timeout:
+                if time.perf_counter() - start_time > timeout:
                     logger.warning(f"Timeout waiting for axis {axis_number} to stop")
                     return False
                 time.sleep(0.1)
@@ -973,7 +1041,7 @@ class SurugaSeikiController:
 
         try:
             axis = self._axis_components[axis_number]
-            start_time = time.time()
+            start_time = time.perf_counter()
             last_status = None
 
             while True:
@@ -1004,7 +1072,7 @@ class SurugaSeikiController:
                 except Exception as e:
                     logger.warning(f"Error checking axis {axis_number} status: {e}")
 
-                if time.time() - start_time > timeout:
+                if time.perf_counter() - start_time > timeout:
                     logger.warning(f"Timeout waiting for axis {axis_number} to reach InPosition (current: {last_status})")
                     return False
 
@@ -1150,7 +1218,7 @@ class SurugaSeikiController:
 
     # ========== Profile Measurement ==========
 
-    def _get_profile_error_info(self, error_str: str) -> dict:
+    def _get_profile_error_info(self, error_str: str) -> Mapping[str, Any]:
         """
         Convert profile error string to detailed error information.
         
@@ -1158,7 +1226,7 @@ class SurugaSeikiController:
             error_str: Error string from Profile.Start() (e.g., "Axis", "Parameter")
         
         Returns:
-            Dictionary with error, value, and description
+            Read-only mapping with error, value, and description
         """
         error_map = {
             "None": ProfileErrorCode.NONE,
@@ -1169,7 +1237,7 @@ class SurugaSeikiController:
         error_enum = error_map.get(error_str, ProfileErrorCode.NONE)
         return error_enum.to_dict()
 
-    def _get_profile_status_info(self, status_str: str) -> dict:
+    def _get_profile_status_info(self, status_str: str) -> Mapping[str, Any]:
         """
         Convert profile status string to detailed status information.
         
@@ -1177,7 +1245,7 @@ class SurugaSeikiController:
             status_str: Status string from Profile.GetProfileStatus()
         
         Returns:
-            Dictionary with status, value, and description
+            Read-only mapping with status, value, and description
         """
         status_map = {
             "Stopping": ProfileMeasurementStatus.STOPPING,
@@ -1297,7 +1365,7 @@ class SurugaSeikiController:
                 error_info = self._get_profile_error_info(start_error_str)
                 logger.error(f"Profile measurement Start() failed: {error_info['error']} "
                            f"(value={error_info['value']}) - {error_info['description']}")
-                return ProfileDataResponse(
+                return ProfileDataResponse.build(
                     success=False,
                     main_axis_number=request.scan_axis,
                     main_axis_initial_position=initial_position,
@@ -1324,7 +1392,7 @@ class SurugaSeikiController:
                                    "StageOnLimit", "TorqueLimit", "ProfileDataOver"]:
                     logger.error(f"Profile measurement failed: {status_info['status']} "
                                f"(value={status_info['value']}) - {status_info['description']}")
-                    return ProfileDataResponse(
+                    return ProfileDataResponse.build(
                         success=False,
                         main_axis_number=request.scan_axis,
                         main_axis_initial_position=initial_position,
@@ -1402,12 +1470,6 @@ class SurugaSeikiController:
             # Find peak position and value
             peak_index, peak_position, peak_value = self._find_peak(profile_data_tuples)
 
-            # Create data points for response (main axis only - Profile measurement scans one axis)
-            data_points = [
-                ProfileDataPoint(position=pos, signal=sig)
-                for pos, sig in profile_data_tuples
-            ]
-
             # Get final position of the scan axis after measurement
             try:
                 final_position = axis.GetActualPosition()
@@ -1419,9 +1481,10 @@ class SurugaSeikiController:
             logger.info(f"Profile measurement completed: {total_points} points, "
                        f"peak={peak_value:.6f} at position {peak_position:.3f} µm (index {peak_index})")
 
-            return ProfileDataResponse(
+            return ProfileDataResponse.build(
                 success=True,
-                data_points=data_points,
+                positions=all_main_positions,
+                signals=all_signals_ch1,
                 total_points=total_points,
                 peak_position=peak_position,
                 peak_value=peak_value,
@@ -1505,7 +1568,7 @@ class SurugaSeikiController:
                         f"Profile measurement Start() failed: {error_info['error']} "
                         f"(value={error_info['value']}) - {error_info['description']}"
                     )
-                    return ProfileDataResponse(
+                    return ProfileDataResponse.build(
                         success=False,
                         main_axis_number=request.scan_axis,
                         main_axis_initial_position=initial_position,
@@ -1532,7 +1595,7 @@ class SurugaSeikiController:
 
                 # Poll for completion with optional cancellation
                 poll_interval = 0.1
-                start_wait_time = time.time()
+                start_wait_time = time.perf_counter()
                 timeout = 120
                 last_status = None
 
@@ -1550,7 +1613,7 @@ class SurugaSeikiController:
                         # Short wait for motion halt
                         time.sleep(0.5)
 
-                        return ProfileDataResponse(
+                        return ProfileDataResponse.build(
                             success=False,
                             main_axis_number=request.scan_axis,
                             main_axis_initial_position=initial_position,
@@ -1572,7 +1635,7 @@ class SurugaSeikiController:
                             {
                                 "phase": status_info["status"],
                                 "phase_description": status_info["description"],
-                                "elapsed_time": time.time() - start_wait_time,
+                                "elapsed_time": time.perf_counter() - start_wait_time,
                             }
                         )
 
@@ -1604,19 +1667,15 @@ class SurugaSeikiController:
                             profile_data_tuples
                         )
 
-                        data_points = [
-                            ProfileDataPoint(position=pos, signal=sig)
-                            for pos, sig in profile_data_tuples
-                        ]
-
                         try:
                             final_position = axis.GetActualPosition()
                         except Exception:
                             final_position = initial_position
 
-                        return ProfileDataResponse(
+                        return ProfileDataResponse.build(
                             success=True,
-                            data_points=data_points,
+                            positions=all_main_positions,
+                            signals=all_signals_ch1,
                             total_points=total_points,
                             peak_position=peak_position,
                             peak_value=peak_value,
@@ -1641,7 +1700,7 @@ class SurugaSeikiController:
                             f"Profile measurement failed: {status_info['status']} "
                             f"(value={status_info['value']}) - {status_info['description']}"
                         )
-                        return ProfileDataResponse(
+                        return ProfileDataResponse.build(
                             success=False,
                             main_axis_number=request.scan_axis,
                             main_axis_initial_position=initial_position,
@@ -1654,9 +1713,9 @@ class SurugaSeikiController:
                         )
 
                     # Timeout
-                    if time.time() - start_wait_time > timeout:
+                    if time.perf_counter() - start_wait_time > timeout:
                         logger.error(f"Profile measurement timed out after {timeout}s")
-                        return ProfileDataResponse(
+                        return ProfileDataResponse.build(
                             success=False,
                             main_axis_number=request.scan_axis,
                             main_axis_initial_position=initial_position,
@@ -1700,7 +1759,7 @@ class SurugaSeikiController:
             logger.error(f"Error stopping profile measurement: {e}", exc_info=True)
             return False
 
-    def _get_optical_alignment_status_info(self, status_str: str) -> dict:
+    def _get_optical_alignment_status_info(self, status_str: str) -> Mapping[str, Any]:
         """
         Convert optical alignment status string to detailed status information.
 
@@ -1708,10 +1767,8 @@ class SurugaSeikiController:
             status_str: Status string from Alignment.GetStatus()
 
         Returns:
-            Dictionary with status, value, and description
+            Read-only mapping with status, value, and description
         """
-        from .models import OpticalAlignmentStatus
-
         status_map = {
             "Stopping": OpticalAlignmentStatus.STOPPING,
             "Success": OpticalAlignmentStatus.SUCCESS,
@@ -1736,7 +1793,7 @@ class SurugaSeikiController:
         status_enum = status_map.get(status_str, OpticalAlignmentStatus.STOPPING)
         return status_enum.to_dict()
 
-    def _get_aligning_phase_info(self, phase_str: str) -> dict:
+    def _get_aligning_phase_info(self, phase_str: str) -> Mapping[str, Any]:
         """
         Convert aligning phase string to detailed phase information.
 
@@ -1744,10 +1801,8 @@ class SurugaSeikiController:
             phase_str: Phase string from Alignment.GetAligningStatus()
 
         Returns:
-            Dictionary with phase, value, and description
+            Read-only mapping with phase, value, and description
         """
-        from .models import AligningStatusPhase
-
         phase_map = {
             "NotAligning": AligningStatusPhase.NOT_ALIGNING,
             "Initializing": AligningStatusPhase.INITIALIZING,
@@ -1784,7 +1839,7 @@ class SurugaSeikiController:
             return None
 
         try:
-            start_time = time.time()
+            start_time = time.perf_counter()
 
             # Create FlatParameter structure
             flat_params = Motion.Alignment.FlatParameter()
@@ -1834,8 +1889,8 @@ class SurugaSeikiController:
             self._alignment.SetMeasurementWaveLength(request.pmCh, request.wavelength)
 
             # Measure initial optical power
-            initial_power = float(self._alignment.GetPower(request.pmCh))
-            logger.info(f"Flat alignment starting - Initial power: {initial_power:.3f} dBm")
+            initial_power = self._alignment.GetPower(request.pmCh)
+            logger.info("Flat alignment starting - Initial power: %.3f dBm", initial_power)
 
             # Start flat alignment (NOT ExecuteFlat!)
             self._alignment.StartFlat()
@@ -1850,7 +1905,7 @@ class SurugaSeikiController:
                 # Log phase changes
                 if phase_str != last_phase_str:
                     phase_info = self._get_aligning_phase_info(phase_str)
-                    logger.info(f"Flat alignment phase: {phase_info['phase']} - {phase_info['description']}")
+                    logger.info("Flat alignment phase: %s - %s", phase_info['phase'], phase_info['description'])
                     last_phase_str = phase_str
 
                 # Check if completed
@@ -1859,7 +1914,7 @@ class SurugaSeikiController:
                     status_info = self._get_optical_alignment_status_info(status_str)
                     phase_info = self._get_aligning_phase_info(phase_str)
 
-                    execution_time = time.time() - start_time
+                    execution_time = time.perf_counter() - start_time
 
                     if status_str == "Success":
                         # Settling time: allow servo motors to stabilize
@@ -1867,11 +1922,15 @@ class SurugaSeikiController:
                         logger.debug("Flat alignment settling time complete")
 
                         # Measure final optical power
-                        final_power = float(self._alignment.GetPower(request.pmCh))
+                        final_power = self._alignment.GetPower(request.pmCh)
                         power_improvement = final_power - initial_power
 
-                        logger.info(f"Flat alignment SUCCESS - Final power: {final_power:.3f} dBm, "
-                                  f"Improvement: {power_improvement:+.3f} dB, Time: {execution_time:.2f}s")
+                        logger.info(
+                            "Flat alignment SUCCESS - Final power: %.3f dBm, Improvement: %+.3f dB, Time: %.2fs",
+                            final_power,
+                            power_improvement,
+                            execution_time
+                        )
 
                         # Retrieve profile data via packet-based retrieval
                         field_search_profile = self._retrieve_alignment_profile_data(
@@ -1886,10 +1945,11 @@ class SurugaSeikiController:
 
                         # Get peak positions by reading actual axis positions after alignment
                         # (alignment moves stages to optimal position, so final position = peak)
-                        peak_x = float(self._axis_components[request.mainStageNumberX].GetActualPosition())
-                        peak_y = float(self._axis_components[request.mainStageNumberY].GetActualPosition())
+                        peak_x, peak_y = self.get_positions(
+                            (request.mainStageNumberX, request.mainStageNumberY)
+                        )
 
-                        return AlignmentResponse(
+                        return AlignmentResponse.build(
                             success=True,
                             status_code=status_info['status'],
                             status_value=status_info['value'],
@@ -1911,15 +1971,23 @@ class SurugaSeikiController:
                         # Alignment failed - get error axis ID for diagnostics
                         try:
                             error_axis_id = int(self._alignment.GetErrorAxisID())
-                            logger.error(f"Flat alignment FAILED - Status: {status_info['status']} - "
-                                       f"{status_info['description']}, Error Axis ID: {error_axis_id}, "
-                                       f"Time: {execution_time:.2f}s")
+                            logger.error(
+                                "Flat alignment FAILED - Status: %s - %s, Error Axis ID: %s, Time: %.2fs",
+                                status_info['status'],
+                                status_info['description'],
+                                error_axis_id,
+                                execution_time
+                            )
                         except Exception as e:
-                            logger.error(f"Flat alignment FAILED - Status: {status_info['status']} - "
-                                       f"{status_info['description']}, Time: {execution_time:.2f}s "
-                                       f"(Could not get error axis ID: {e})")
+                            logger.error(
+                                "Flat alignment FAILED - Status: %s - %s, Time: %.2fs (Could not get error axis ID: %s)",
+                                status_info['status'],
+                                status_info['description'],
+                                execution_time,
+                                e
+                            )
 
-                        return AlignmentResponse(
+                        return AlignmentResponse.build(
                             success=False,
                             status_code=status_info['status'],
                             status_value=status_info['value'],
@@ -1935,10 +2003,10 @@ class SurugaSeikiController:
                 time.sleep(0.5)
 
         except Exception as e:
-            logger.error(f"Error during flat alignment: {e}", exc_info=True)
+            logger.error("Error during flat alignment: %s", e, exc_info=True)
             return None
 
-    def _retrieve_alignment_profile_data(self, profile_type) -> Optional[List]:
+    def _retrieve_alignment_profile_data(self, profile_type) -> Optional[ProfileArrays]:
         """
         Retrieve alignment profile data using packet-based retrieval.
 
@@ -1946,20 +2014,19 @@ class SurugaSeikiController:
             profile_type: ProfileDataType enum (FieldSearch, PeakSearchX, PeakSearchY, PeakSearchZ)
 
         Returns:
-            List of ProfileDataPoint objects, or None if no data available
+            ProfileArrays with parallel positions/signals, or None if no data available
         """
-        from .models import ProfileDataPoint
-
         try:
             # Get total number of packets for this profile type
             packet_sum_index = self._alignment.GetProfilePacketSumIndex(profile_type)
             
-            logger.info(f"Profile type {profile_type}: {packet_sum_index} packet(s)")
+            logger.info("Profile type %s: %s packet(s)", profile_type, packet_sum_index)
 
             if packet_sum_index == 0:
                 return None
 
-            profile_data = []
+            positions: List[float] = []
+            signals: List[float] = []
 
             # Retrieve all packets
             for packet_number in range(1, packet_sum_index + 1):
@@ -1969,34 +2036,65 @@ class SurugaSeikiController:
 
                 # Log packet details (same as sample program)
                 if profile_packet is not None:
-                    logger.info(f"  Packet {packet_number}: packetIndex={profile_packet.packetIndex}, "
-                              f"dataCount={profile_packet.dataCount}")
+                    logger.info(
+                        "  Packet %s: packetIndex=%s, dataCount=%s",
+                        packet_number,
+                        profile_packet.packetIndex,
+                        profile_packet.dataCount
+                    )
 
                 # Each packet contains multiple data points
                 # The packet structure has mainPositionList and signalCh1List arrays
                 # (as documented in suruga_sample_program.py)
                 if profile_packet is not None and profile_packet.mainPositionList is not None:
-                    for i in range(len(profile_packet.mainPositionList)):
-                        profile_data.append(ProfileDataPoint(
-                            position=float(profile_packet.mainPositionList[i]),
-                            signal=float(profile_packet.signalCh1List[i])
-                        ))
+                    positions.extend(map(float, profile_packet.mainPositionList))
+                    signals.extend(map(float, profile_packet.signalCh1List))
+
+            if not positions:
+                return None
 
             # Log summary of retrieved data
-            if profile_data:
-                positions = [p.position for p in profile_data]
-                signals = [p.signal for p in profile_data]
-                logger.info(f"Retrieved {len(profile_data)} points - "
-                          f"Position range: [{min(positions):.3f}, {max(positions):.3f}] µm, "
-                          f"Signal range: [{min(signals):.6f}, {max(signals):.6f}]")
-            
-            return profile_data if profile_data else None
+            logger.info(
+                "Retrieved %s points - Position range: [%.3f, %.3f] µm, Signal range: [%.6f, %.6f]",
+                len(positions),
+                min(positions),
+                max(positions),
+                min(signals),
+                max(signals)
+            )
+
+            return ProfileArrays(positions=positions, signals=signals)
 
         except Exception as e:
-            logger.warning(f"Could not retrieve alignment profile data for type {profile_type}: {e}")
+            logger.warning("Could not retrieve alignment profile data for type %s: %s", profile_type, e)
             return None
 
-    def _retrieve_angle_adjustment_profile_data(self, angle_adjustment, profile_type) -> Optional[List]:
+    async def _retrieve_alignment_profiles_async(self, profile_types) -> List[Optional[ProfileArrays]]:
+        """
+        Retrieve several alignment profiles off the event loop.
+
+        The SDK documents no thread-safety guarantee for the Alignment packet
+        reads (GetProfilePacketSumIndex/RequestProfileData), and they page through
+        shared state on one .NET object. Each profile type's packets are therefore
+        read under the controller lock, so reads of different types never
+        interleave; the thread pool only keeps the loop free while they run.
+
+        Args:
+            profile_types: Sequence of ProfileDataType enum values
+
+        Returns:
+            List of profile data (or None) in the same order as profile_types
+        """
+        def read_locked(profile_type) -> Optional[ProfileArrays]:
+            with self._lock:
+                return self._retrieve_alignment_profile_data(profile_type)
+
+        return list(await asyncio.gather(*[
+            asyncio.to_thread(read_locked, profile_type)
+            for profile_type in profile_types
+        ]))
+
+    def _retrieve_angle_adjustment_profile_data(self, angle_adjustment, profile_type) -> Optional[ProfileArrays]:
         """
         Retrieve angle adjustment profile data using packet-based retrieval.
 
@@ -2006,10 +2104,8 @@ class SurugaSeikiController:
                          (ContactZ=0, AdjustmentTx=1, AdjustmentTy=2)
 
         Returns:
-            List of ProfileDataPoint objects, or None if no data available
+            ProfileArrays with parallel positions/signals, or None if no data available
         """
-        from .models import ProfileDataPoint
-
         try:
             # Get total number of packets for this profile type
             # AngleAdjustment class has GetProfilePacketSumIndex method similar to Alignment
@@ -2020,7 +2116,8 @@ class SurugaSeikiController:
             if packet_sum_index == 0:
                 return None
 
-            profile_data = []
+            positions: List[float] = []
+            signals: List[float] = []
 
             # Retrieve all packets
             for packet_number in range(1, packet_sum_index + 1):
@@ -2036,21 +2133,18 @@ class SurugaSeikiController:
                 # Each packet contains multiple data points
                 # The packet structure has mainPositionList and signalCh1List arrays
                 if profile_packet is not None and profile_packet.mainPositionList is not None:
-                    for i in range(len(profile_packet.mainPositionList)):
-                        profile_data.append(ProfileDataPoint(
-                            position=float(profile_packet.mainPositionList[i]),
-                            signal=float(profile_packet.signalCh1List[i])
-                        ))
+                    positions.extend(map(float, profile_packet.mainPositionList))
+                    signals.extend(map(float, profile_packet.signalCh1List))
+
+            if not positions:
+                return None
 
             # Log summary of retrieved data
-            if profile_data:
-                positions = [p.position for p in profile_data]
-                signals = [p.signal for p in profile_data]
-                logger.info(f"Retrieved {len(profile_data)} points - "
-                          f"Position range: [{min(positions):.3f}, {max(positions):.3f}] µm, "
-                          f"Signal range: [{min(signals):.6f}, {max(signals):.6f}]")
+            logger.info(f"Retrieved {len(positions)} points - "
+                      f"Position range: [{min(positions):.3f}, {max(positions):.3f}] µm, "
+                      f"Signal range: [{min(signals):.6f}, {max(signals):.6f}]")
 
-            return profile_data if profile_data else None
+            return ProfileArrays(positions=positions, signals=signals)
 
         except Exception as e:
             logger.warning(f"Could not retrieve angle adjustment profile data for type {profile_type}: {e}")
@@ -2080,7 +2174,7 @@ class SurugaSeikiController:
             return None
 
         try:
-            start_time = time.time()
+            start_time = time.perf_counter()
 
             # Create FocusParameter structure
             focus_params = Motion.Alignment.FocusParameter()
@@ -2133,8 +2227,8 @@ class SurugaSeikiController:
             self._alignment.SetMeasurementWaveLength(request.pmCh, request.wavelength)
 
             # Measure initial optical power
-            initial_power = float(self._alignment.GetPower(request.pmCh))
-            logger.info(f"Focus alignment starting (zMode={request.zMode}) - Initial power: {initial_power:.3f} dBm")
+            initial_power = self._alignment.GetPower(request.pmCh)
+            logger.info("Focus alignment starting (zMode=%s) - Initial power: %.3f dBm", request.zMode, initial_power)
 
             # Start focus alignment (NOT ExecuteFocus!)
             self._alignment.StartFocus()
@@ -2148,7 +2242,7 @@ class SurugaSeikiController:
                 # Log phase changes
                 if phase_str != last_phase_str:
                     phase_info = self._get_aligning_phase_info(phase_str)
-                    logger.info(f"Focus alignment phase: {phase_info['phase']} - {phase_info['description']}")
+                    logger.info("Focus alignment phase: %s - %s", phase_info['phase'], phase_info['description'])
                     last_phase_str = phase_str
 
                 # Check if completed
@@ -2157,7 +2251,7 @@ class SurugaSeikiController:
                     status_info = self._get_optical_alignment_status_info(status_str)
                     phase_info = self._get_aligning_phase_info(phase_str)
 
-                    execution_time = time.time() - start_time
+                    execution_time = time.perf_counter() - start_time
 
                     if status_str == "Success":
                         # Settling time: allow servo motors to stabilize
@@ -2165,11 +2259,15 @@ class SurugaSeikiController:
                         logger.debug("Focus alignment settling time complete")
 
                         # Measure final optical power
-                        final_power = float(self._alignment.GetPower(request.pmCh))
+                        final_power = self._alignment.GetPower(request.pmCh)
                         power_improvement = final_power - initial_power
 
-                        logger.info(f"Focus alignment SUCCESS - Final power: {final_power:.3f} dBm, "
-                                  f"Improvement: {power_improvement:+.3f} dB, Time: {execution_time:.2f}s")
+                        logger.info(
+                            "Focus alignment SUCCESS - Final power: %.3f dBm, Improvement: %+.3f dB, Time: %.2fs",
+                            final_power,
+                            power_improvement,
+                            execution_time
+                        )
 
                         # Retrieve profile data via packet-based retrieval (including Z-axis)
                         field_search_profile = self._retrieve_alignment_profile_data(
@@ -2187,20 +2285,21 @@ class SurugaSeikiController:
 
                         # Get peak positions by reading actual axis positions after alignment
                         # (alignment moves stages to optimal position, so final position = peak)
-                        peak_x = float(self._axis_components[request.mainStageNumberX].GetActualPosition())
-                        peak_y = float(self._axis_components[request.mainStageNumberY].GetActualPosition())
+                        peak_x, peak_y = self.get_positions(
+                            (request.mainStageNumberX, request.mainStageNumberY)
+                        )
                         # For focus alignment, need to get Z-axis peak position
                         # Assuming Z-axis is the stage used for focus (typically subStageNumberXY or a dedicated Z stage)
                         # You may need to adjust this based on your hardware configuration
                         try:
                             # Try to get Z peak position - the exact stage number may vary
                             # This is a placeholder and may need adjustment based on hardware setup
-                            peak_z = float(self._axis_components[request.subStageNumberXY].GetActualPosition()) if request.subStageNumberXY > 0 else None
+                            peak_z = self._axis_components[request.subStageNumberXY].GetActualPosition() if request.subStageNumberXY > 0 else None
                         except:
                             peak_z = None
                             logger.warning("Could not retrieve Z peak position")
 
-                        return AlignmentResponse(
+                        return AlignmentResponse.build(
                             success=True,
                             status_code=status_info['status'],
                             status_value=status_info['value'],
@@ -2222,10 +2321,14 @@ class SurugaSeikiController:
                         )
                     else:
                         # Alignment failed
-                        logger.error(f"Focus alignment FAILED - Status: {status_info['status']} - "
-                                   f"{status_info['description']}, Time: {execution_time:.2f}s")
+                        logger.error(
+                            "Focus alignment FAILED - Status: %s - %s, Time: %.2fs",
+                            status_info['status'],
+                            status_info['description'],
+                            execution_time
+                        )
 
-                        return AlignmentResponse(
+                        return AlignmentResponse.build(
                             success=False,
                             status_code=status_info['status'],
                             status_value=status_info['value'],
@@ -2241,12 +2344,12 @@ class SurugaSeikiController:
                 time.sleep(0.5)
 
         except Exception as e:
-            logger.error(f"Error during focus alignment: {e}", exc_info=True)
+            logger.error("Error during focus alignment: %s", e, exc_info=True)
             return None
 
     # ========== Angle Adjustment ==========
 
-    def _get_angle_adjustment_status_info(self, status_str: str) -> dict:
+    def _get_angle_adjustment_status_info(self, status_str: str) -> Mapping[str, Any]:
         """
         Convert angle adjustment status string to detailed status information.
 
@@ -2254,7 +2357,7 @@ class SurugaSeikiController:
             status_str: Status string from AngleAdjustment.GetStatus()
 
         Returns:
-            Dictionary with status, value, and description
+            Read-only mapping with status, value, and description
         """
         status_map = {
             "Stopping": AngleAdjustmentStatus.STOPPING,
@@ -2275,7 +2378,7 @@ class SurugaSeikiController:
         status_enum = status_map.get(status_str, AngleAdjustmentStatus.STOPPING)
         return status_enum.to_dict()
 
-    def _get_adjusting_status_info(self, phase_str: str) -> dict:
+    def _get_adjusting_status_info(self, phase_str: str) -> Mapping[str, Any]:
         """
         Convert adjusting phase string to detailed phase information.
 
@@ -2283,7 +2386,7 @@ class SurugaSeikiController:
             phase_str: Phase string from AngleAdjustment.GetAdjustingStatus()
 
         Returns:
-            Dictionary with phase, value, and description
+            Read-only mapping with phase, value, and description
         """
         phase_map = {
             "NotAdjusting": AdjustingStatus.NOT_ADJUSTING,
@@ -2325,7 +2428,7 @@ class SurugaSeikiController:
             return None
 
         try:
-            start_time = time.time()
+            start_time = time.perf_counter()
 
             # Auto-determine stage-specific hardware parameters
             # These are constants determined by physical stage wiring and cannot be changed
@@ -2426,7 +2529,7 @@ class SurugaSeikiController:
             digital_output_state = self.get_digital_output(unlock_dout_ch_number)
             if digital_output_state is None:
                 logger.error(f"Failed to read digital output channel {unlock_dout_ch_number} state")
-                return AngleAdjustmentResponse(
+                return AngleAdjustmentResponse.build(
                     success=False,
                     status_code="Error",
                     status_value=-1,
@@ -2436,7 +2539,7 @@ class SurugaSeikiController:
 
             if digital_output_state:  # True = LOCKED
                 logger.error(f"{stage_name} stage contact sensor is LOCKED (channel {unlock_dout_ch_number})")
-                return AngleAdjustmentResponse(
+                return AngleAdjustmentResponse.build(
                     success=False,
                     status_code="InvalidParameter",
                     status_value=4,
@@ -2473,7 +2576,7 @@ class SurugaSeikiController:
             # Wait for completion
             timeout = 120  # 120 seconds timeout
             poll_interval = 0.1
-            start_wait_time = time.time()
+            start_wait_time = time.perf_counter()
 
             last_phase = None
             last_status = None
@@ -2502,7 +2605,7 @@ class SurugaSeikiController:
                         time.sleep(0.2)
                         logger.debug(f"{stage_name} angle adjustment settling time complete")
 
-                        execution_time = time.time() - start_time
+                        execution_time = time.perf_counter() - start_time
                         status_info = self._get_angle_adjustment_status_info(status_str)
                         phase_info = self._get_adjusting_status_info(phase_str)
 
@@ -2531,7 +2634,7 @@ class SurugaSeikiController:
                             Motion.AngleAdjustment.ProfileDataType.AdjustmentTy
                         )
 
-                        return AngleAdjustmentResponse(
+                        return AngleAdjustmentResponse.build(
                             success=True,
                             status_code=status_info['status'],
                             status_value=status_info['value'],
@@ -2552,12 +2655,12 @@ class SurugaSeikiController:
                                        "StageOnLimit", "SignalLowerLimit", "CouldNotContact", "CouldnotContact",
                                        "AdjustCountOver", "AngleAdjustRangeOver", "LostContact",
                                        "ProfileDataOver"]:
-                        execution_time = time.time() - start_time
+                        execution_time = time.perf_counter() - start_time
                         status_info = self._get_angle_adjustment_status_info(status_str)
                         phase_info = self._get_adjusting_status_info(phase_str)
 
                         logger.error(f"{stage_name} angle adjustment failed: {status_info['status']} - {status_info['description']}")
-                        return AngleAdjustmentResponse(
+                        return AngleAdjustmentResponse.build(
                             success=False,
                             status_code=status_info['status'],
                             status_value=status_info['value'],
@@ -2570,12 +2673,12 @@ class SurugaSeikiController:
                         )
                     else:
                         # Unknown status - treat as error
-                        execution_time = time.time() - start_time
+                        execution_time = time.perf_counter() - start_time
                         status_info = self._get_angle_adjustment_status_info(status_str)
                         phase_info = self._get_adjusting_status_info(phase_str)
 
                         logger.error(f"{stage_name} angle adjustment failed with unknown status: {status_str}")
-                        return AngleAdjustmentResponse(
+                        return AngleAdjustmentResponse.build(
                             success=False,
                             status_code=status_info['status'],
                             status_value=status_info['value'],
@@ -2588,10 +2691,10 @@ class SurugaSeikiController:
                         )
 
                 # Check timeout
-                if time.time() - start_wait_time > timeout:
-                    execution_time = time.time() - start_time
+                if time.perf_counter() - start_wait_time > timeout:
+                    execution_time = time.perf_counter() - start_time
                     logger.error(f"{stage_name} angle adjustment timed out after {timeout}s")
-                    return AngleAdjustmentResponse(
+                    return AngleAdjustmentResponse.build(
                         success=False,
                         status_code="Timeout",
                         status_value=-1,
@@ -2675,7 +2778,7 @@ class SurugaSeikiController:
                 return None
 
             try:
-                start_time = time.time()
+                start_time = time.perf_counter()
 
                 # Auto-determine stage-specific hardware parameters
                 if request.stage == AngleAdjustmentStage.LEFT:
@@ -2740,7 +2843,7 @@ class SurugaSeikiController:
                 if digital_output_state is None or digital_output_state:
                     error_msg = "Contact sensor is locked or state could not be read"
                     logger.error(f"{stage_name}: {error_msg}")
-                    return AngleAdjustmentResponse(
+                    return AngleAdjustmentResponse.build(
                         success=False,
                         status_code="InvalidParameter",
                         status_value=4,
@@ -2769,7 +2872,7 @@ class SurugaSeikiController:
                 # Wait for completion with cancellation support
                 timeout = 120
                 poll_interval = 0.1
-                start_wait_time = time.time()
+                start_wait_time = time.perf_counter()
                 last_phase = None
                 last_status = None
 
@@ -2782,18 +2885,18 @@ class SurugaSeikiController:
                         # Wait briefly for stop to take effect
                         time.sleep(0.5)
 
-                        return AngleAdjustmentResponse(
+                        return AngleAdjustmentResponse.build(
                             success=False,
                             status_code="Cancelled",
                             status_value=-2,
                             status_description="Operation cancelled by user",
-                            execution_time=time.time() - start_time,
+                            execution_time=time.perf_counter() - start_time,
                             error_message="Angle adjustment was cancelled"
                         )
 
                     status_str = str(angle_adjustment.GetStatus())
                     phase_str = str(angle_adjustment.GetAdjustingStatus())
-                    elapsed_time = time.time() - start_wait_time
+                    elapsed_time = time.perf_counter() - start_wait_time
 
                     # Emit progress on phase changes
                     if phase_str != last_phase:
@@ -2814,7 +2917,7 @@ class SurugaSeikiController:
                     if status_str != "Adjusting":
                         if status_str == "Success":
                             time.sleep(0.2)  # Settling time
-                            execution_time = time.time() - start_time
+                            execution_time = time.perf_counter() - start_time
                             status_info = self._get_angle_adjustment_status_info(status_str)
                             phase_info = self._get_adjusting_status_info(phase_str)
 
@@ -2846,7 +2949,7 @@ class SurugaSeikiController:
                                     "message": "Angle adjustment completed successfully"
                                 })
 
-                            return AngleAdjustmentResponse(
+                            return AngleAdjustmentResponse.build(
                                 success=True,
                                 status_code=status_info['status'],
                                 status_value=status_info['value'],
@@ -2864,7 +2967,7 @@ class SurugaSeikiController:
                             )
                         else:
                             # Error status
-                            execution_time = time.time() - start_time
+                            execution_time = time.perf_counter() - start_time
                             status_info = self._get_angle_adjustment_status_info(status_str)
                             phase_info = self._get_adjusting_status_info(phase_str)
 
@@ -2877,7 +2980,7 @@ class SurugaSeikiController:
                                     "message": f"Failed: {status_info['status']}"
                                 })
 
-                            return AngleAdjustmentResponse(
+                            return AngleAdjustmentResponse.build(
                                 success=False,
                                 status_code=status_info['status'],
                                 status_value=status_info['value'],
@@ -2890,8 +2993,8 @@ class SurugaSeikiController:
                             )
 
                     # Check timeout
-                    if time.time() - start_wait_time > timeout:
-                        execution_time = time.time() - start_time
+                    if time.perf_counter() - start_wait_time > timeout:
+                        execution_time = time.perf_counter() - start_time
                         logger.error(f"{stage_name} timed out after {timeout}s")
 
                         if progress_callback:
@@ -2901,7 +3004,7 @@ class SurugaSeikiController:
                                 "message": "Operation timed out"
                             })
 
-                        return AngleAdjustmentResponse(
+                        return AngleAdjustmentResponse.build(
                             success=False,
                             status_code="Timeout",
                             status_value=-1,
@@ -2942,207 +3045,270 @@ class SurugaSeikiController:
             logger.info("Alignment stop command sent")
             return True
         except Exception as e:
-            logger.error(f"Failed to stop alignment: {e}")
+            logger.error("Failed to stop alignment: %s", e)
             return False
 
-    async def execute_flat_alignment_async(
+    def _read_alignment_status(self) -> Tuple[Any, Any]:
+        """Read raw (status, aligning phase) enum values from the alignment component."""
+        return self._alignment.GetStatus(), self._alignment.GetAligningStatus()
+
+    async def _poll_alignment_until_done(
         self,
-        request: FlatAlignmentRequest,
+        label: str,
+        start_time: float,
         cancellation_event: Optional[asyncio.Event] = None,
-        progress_callback: Optional[Callable[[dict], None]] = None
-    ) -> Optional[AlignmentResponse]:
+        progress_callback: Optional[Callable[[Union[dict, ProgressEvent]], None]] = None,
+        poll_interval: float = 0.5,
+        timeout: float = 300.0
+    ) -> Tuple[dict, dict, float]:
         """
-        Async wrapper for execute_flat_alignment with cancellation and progress support.
+        Poll a started optical alignment until it reaches a terminal state.
+
+        Shared by the async flat and focus alignments. The thread-pool slot is
+        released between polls so concurrent alignments do not pin a worker each.
 
         Args:
-            request: FlatAlignmentRequest with all parameters
+            label: Alignment name used in logs and errors ("Flat" or "Focus")
+            start_time: perf_counter() value when the alignment was set up
             cancellation_event: Optional event to signal cancellation
-            progress_callback: Optional callback for progress updates
+            progress_callback: Optional callback receiving a ProgressEvent per phase change
+            poll_interval: Seconds between status polls
+            timeout: Maximum alignment time in seconds
 
         Returns:
-            AlignmentResponse or None if error
+            Tuple of (status_info, phase_info, execution_time) on success
 
         Raises:
-            Exception: If alignment fails or is cancelled
-        """
-        def sync_execution() -> Optional[AlignmentResponse]:
-            """Synchronous execution in thread pool."""
+            Exception: If alignment fails, times out or is cancelled
+        """
+        last_phase_raw = None
+
+        # Bind loop-invariant lookups once; they are re-used on every tick
+        to_thread = asyncio.to_thread
+        sleep = asyncio.sleep
+        now = time.perf_counter
+        read_status = self._read_alignment_status
+        stop = self._alignment.Stop
+        aligning = self._ALIGNMENT_ALIGNING
+        is_cancelled = cancellation_event.is_set if cancellation_event else None
+
+        while True:
+            # Check cancellation FIRST
+            if is_cancelled is not None and is_cancelled():
+                logger.info("%s alignment cancellation requested", label)
+                await to_thread(stop)
+                await sleep(0.5)  # Wait for stop
+                raise Exception("Alignment cancelled by user")
+
+            status_raw, phase_raw = await to_thread(read_status)
+
+            # Log and broadcast phase changes
+            if phase_raw != last_phase_raw:
+                phase_str = str(phase_raw)
+                phase_info = self._get_aligning_phase_info(phase_str)
+                logger.info("%s alignment phase: %s - %s", label, phase_info['phase'], phase_info['description'])
 
-            if not self.is_connected() or self._alignment is None:
-                raise Exception("Not connected or Alignment not initialized")
-
-            try:
-                start_time = time.time()
-
-                # Create FlatParameter structure
-                flat_params = Motion.Alignment.FlatParameter()
+                if progress_callback:
+                    progress_callback(ProgressEvent(
+                        phase=phase_info['phase'],
+                        phase_description=phase_info['description'],
+                        elapsed_time=now() - start_time,
+                        message=f"Phase: {phase_info['description']}"
+                    ))
+
+                last_phase_raw = phase_raw
+
+            # Check if completed
+            if status_raw != aligning:
+                status_str = str(status_raw)
+                status_info = self._get_optical_alignment_status_info(status_str)
+                execution_time = now() - start_time
+
+                if status_str != "Success":
+                    # Alignment failed
+                    logger.error(
+                        "%s alignment FAILED - Status: %s - %s, Time: %.2fs",
+                        label,
+                        status_info['status'],
+                        status_info['description'],
+                        execution_time
+                    )
 
-                # Set all ~30 parameters from request
-                flat_params.mainStageNumberX = request.mainStageNumberX
-                flat_params.mainStageNumberY = request.mainStageNumberY
-                flat_params.subStageNumberXY = request.subStageNumberXY
-                flat_params.subAngleX = request.subAngleX
-                flat_params.subAngleY = request.subAngleY
+                    raise Exception(f"{label} alignment failed: {status_info['description']}")
 
-                flat_params.pmCh = request.pmCh
-                flat_params.analogCh = request.analogCh
-                flat_params.wavelength = request.wavelength
-                flat_params.pmAutoRangeUpOn = request.pmAutoRangeUpOn
-                flat_params.pmInitRangeSettingOn = request.pmInitRangeSettingOn
-                flat_params.pmInitRange = request.pmInitRange
+                return status_info, phase_info, execution_time
 
-                flat_params.fieldSearchThreshold = request.fieldSearchThreshold
-                flat_params.peakSearchThreshold = request.peakSearchThreshold
+            # Check timeout
+            if now() - start_time > timeout:
+                await to_thread(stop)
+                raise Exception(f"{label} alignment timed out after {timeout:g}s")
 
-                flat_params.searchRangeX = request.searchRangeX
-                flat_params.searchRangeY = request.searchRangeY
+            await sleep(poll_interval)
 
-                flat_params.fieldSearchPitchX = request.fieldSearchPitchX
-                flat_params.fieldSearchPitchY = request.fieldSearchPitchY
-                flat_params.fieldSearchFirstPitchX = request.fieldSearchFirstPitchX
-                flat_params.fieldSearchSpeedX = request.fieldSearchSpeedX
-                flat_params.fieldSearchSpeedY = request.fieldSearchSpeedY
+    async def execute_flat_alignment_async(
+        self,
+        request: FlatAlignmentRequest,
+        cancellation_event: Optional[asyncio.Event] = None,
+        progress_callback: Optional[Callable[[Union[dict, ProgressEvent]], None]] = None
+    ) -> Optional[AlignmentResponse]:
+        """
+        Async wrapper for execute_flat_alignment with cancellation and progress support.
 
-                flat_params.peakSearchSpeedX = request.peakSearchSpeedX
-                flat_params.peakSearchSpeedY = request.peakSearchSpeedY
+        Args:
+            request: FlatAlignmentRequest with all parameters
+            cancellation_event: Optional event to signal cancellation
+            progress_callback: Optional callback for progress updates
 
-                flat_params.smoothingRangeX = request.smoothingRangeX
-                flat_params.smoothingRangeY = request.smoothingRangeY
+        Returns:
+            AlignmentResponse or None if error
 
-                flat_params.centroidThresholdX = request.centroidThresholdX
-                flat_params.centroidThresholdY = request.centroidThresholdY
+        Raises:
+            Exception: If alignment fails or is cancelled
+        """
+        def setup_execution() -> float:
+            """Configure and start flat alignment in thread pool; returns initial power."""
+            # Create FlatParameter structure
+            flat_params = Motion.Alignment.FlatParameter()
 
-                flat_params.convergentRangeX = request.convergentRangeX
-                flat_params.convergentRangeY = request.convergentRangeY
-                flat_params.comparisonCount = request.comparisonCount
-                flat_params.maxRepeatCount = request.maxRepeatCount
+            # Set all ~30 parameters from request
+            flat_params.mainStageNumberX = request.mainStageNumberX
+            flat_params.mainStageNumberY = request.mainStageNumberY
+            flat_params.subStageNumberXY = request.subStageNumberXY
+            flat_params.subAngleX = request.subAngleX
+            flat_params.subAngleY = request.subAngleY
 
-                # Apply parameters to alignment hardware
-                self._alignment.SetFlat(flat_params)
-                self._alignment.SetMeasurementWaveLength(request.pmCh, request.wavelength)
+            flat_params.pmCh = request.pmCh
+            flat_params.analogCh = request.analogCh
+            flat_params.wavelength = request.wavelength
+            flat_params.pmAutoRangeUpOn = request.pmAutoRangeUpOn
+            flat_params.pmInitRangeSettingOn = request.pmInitRangeSettingOn
+            flat_params.pmInitRange = request.pmInitRange
 
-                # Measure initial optical power
-                initial_power = float(self._alignment.GetPower(request.pmCh))
-                logger.info(f"Flat alignment starting - Initial power: {initial_power:.3f} dBm")
+            flat_params.fieldSearchThreshold = request.fieldSearchThreshold
+            flat_params.peakSearchThreshold = request.peakSearchThreshold
 
-                if progress_callback:
-                    progress_callback({
-                        "phase": "Starting",
-                        "initial_power": initial_power,
-                        "message": f"Flat alignment started - Initial power: {initial_power:.3f} dBm"
-                    })
+            flat_params.searchRangeX = request.searchRangeX
+            flat_params.searchRangeY = request.searchRangeY
 
-                # Start flat alignment
-                self._alignment.StartFlat()
-                time.sleep(0.1)
+            flat_params.fieldSearchPitchX = request.fieldSearchPitchX
+            flat_params.fieldSearchPitchY = request.fieldSearchPitchY
+            flat_params.fieldSearchFirstPitchX = request.fieldSearchFirstPitchX
+            flat_params.fieldSearchSpeedX = request.fieldSearchSpeedX
+            flat_params.fieldSearchSpeedY = request.fieldSearchSpeedY
 
-                # Poll status until completion
-                last_phase_str = None
-                poll_interval = 0.5
-                timeout = 300  # 5 minutes
+            flat_params.peakSearchSpeedX = request.peakSearchSpeedX
+            flat_params.peakSearchSpeedY = request.peakSearchSpeedY
 
-                while True:
-                    # Check cancellation FIRST
-                    if cancellation_event and cancellation_event.is_set():
-                        logger.info("Flat alignment cancellation requested")
-                        self._alignment.Stop()
-                        time.sleep(0.5)  # Wait for stop
-                        raise Exception("Alignment cancelled by user")
+            flat_params.smoothingRangeX = request.smoothingRangeX
+            flat_params.smoothingRangeY = request.smoothingRangeY
 
-                    status_str = str(self._alignment.GetStatus())
-                    phase_str = str(self._alignment.GetAligningStatus())
+            flat_params.centroidThresholdX = request.centroidThresholdX
+            flat_params.centroidThresholdY = request.centroidThresholdY
 
-                    # Log and broadcast phase changes
-                    if phase_str != last_phase_str:
-                        phase_info = self._get_aligning_phase_info(phase_str)
-                        logger.info(f"Flat alignment phase: {phase_info['phase']} - {phase_info['description']}")
+            flat_params.convergentRangeX = request.convergentRangeX
+            flat_params.convergentRangeY = request.convergentRangeY
+            flat_params.comparisonCount = request.comparisonCount
+            flat_params.maxRepeatCount = request.maxRepeatCount
 
-                        if progress_callback:
-                            progress_callback({
-                                "phase": phase_info['phase'],
-                                "phase_description": phase_info['description'],
-                                "elapsed_time": time.time() - start_time,
-                                "message": f"Phase: {phase_info['description']}"
-                            })
+            # Apply parameters to alignment hardware
+            self._alignment.SetFlat(flat_params)
+            self._alignment.SetMeasurementWaveLength(request.pmCh, request.wavelength)
 
-                        last_phase_str = phase_str
+            # Measure initial optical power
+            initial_power = self._alignment.GetPower(request.pmCh)
+            logger.info("Flat alignment starting - Initial power: %.3f dBm", initial_power)
 
-                    # Check if completed
-                    if status_str != "Aligning":
-                        status_info = self._get_optical_alignment_status_info(status_str)
-                        phase_info = self._get_aligning_phase_info(phase_str)
-                        execution_time = time.time() - start_time
+            if progress_callback:
+                progress_callback({
+                    "phase": "Starting",
+                    "initial_power": initial_power,
+                    "message": f"Flat alignment started - Initial power: {initial_power:.3f} dBm"
+                })
 
-                        if status_str == "Success":
-                            # Settling time
-                            time.sleep(0.2)
+            # Start flat alignment
+            self._alignment.StartFlat()
 
-                            # Measure final optical power
-                            final_power = float(self._alignment.GetPower(request.pmCh))
-                            power_improvement = final_power - initial_power
+            return initial_power
 
-                            logger.info(f"Flat alignment SUCCESS - Final power: {final_power:.3f} dBm, "
-                                      f"Improvement: {power_improvement:+.3f} dB, Time: {execution_time:.2f}s")
+        def finalize_execution(
+            status_info: dict, phase_info: dict, initial_power: float, execution_time: float
+        ) -> AlignmentResponse:
+            """Settle, read final power and peak positions in thread pool."""
+            # Settling time
+            time.sleep(0.2)
 
-                            # Retrieve profile data
-                            field_search_profile = self._retrieve_alignment_profile_data(
-                                Motion.Alignment.ProfileDataType.FieldSearch
-                            )
-                            peak_search_x_profile = self._retrieve_alignment_profile_data(
-                                Motion.Alignment.ProfileDataType.PeakSearchX
-                            )
-                            peak_search_y_profile = self._retrieve_alignment_profile_data(
-                                Motion.Alignment.ProfileDataType.PeakSearchY
-                            )
+            # Measure final optical power
+            final_power = self._alignment.GetPower(request.pmCh)
+            power_improvement = final_power - initial_power
 
-                            # Get peak positions
-                            peak_x = float(self._axis_components[request.mainStageNumberX].GetActualPosition())
-                            peak_y = float(self._axis_components[request.mainStageNumberY].GetActualPosition())
+            logger.info(
+                "Flat alignment SUCCESS - Final power: %.3f dBm, Improvement: %+.3f dB, Time: %.2fs",
+                final_power,
+                power_improvement,
+                execution_time
+            )
 
-                            return AlignmentResponse(
-                                success=True,
-                                status_code=status_info['status'],
-                                status_value=status_info['value'],
-                                status_description=status_info['description'],
-                                phase_code=phase_info['phase'],
-                                phase_value=phase_info['value'],
-                                phase_description=phase_info['description'],
-                                initial_power=initial_power,
-                                final_power=final_power,
-                                power_improvement=power_improvement,
-                                peak_position_x=peak_x,
-                                peak_position_y=peak_y,
-                                execution_time=execution_time,
-                                field_search_profile=field_search_profile,
-                                peak_search_x_profile=peak_search_x_profile,
-                                peak_search_y_profile=peak_search_y_profile
-                            )
-                        else:
-                            # Alignment failed
-                            logger.error(f"Flat alignment FAILED - Status: {status_info['status']} - "
-                                       f"{status_info['description']}, Time: {execution_time:.2f}s")
+            # Profile data is retrieved by the async caller once this returns
 
-                            raise Exception(f"Flat alignment failed: {status_info['description']}")
+            # Get peak positions
+            peak_x, peak_y = self.get_positions(
+                (request.mainStageNumberX, request.mainStageNumberY)
+            )
 
-                    # Check timeout
-                    if time.time() - start_time > timeout:
-                        self._alignment.Stop()
-                        raise Exception(f"Flat alignment timed out after {timeout}s")
+            return AlignmentResponse.build(
+                success=True,
+                status_code=status_info['status'],
+                status_value=status_info['value'],
+                status_description=status_info['description'],
+                phase_code=phase_info['phase'],
+                phase_value=phase_info['value'],
+                phase_description=phase_info['description'],
+                initial_power=initial_power,
+                final_power=final_power,
+                power_improvement=power_improvement,
+                peak_position_x=peak_x,
+                peak_position_y=peak_y,
+                execution_time=execution_time
+            )
 
-                    time.sleep(poll_interval)
+        if not self.is_connected() or self._alignment is None:
+            raise Exception("Not connected or Alignment not initialized")
 
-            except Exception as e:
-                logger.error(f"Error during flat alignment: {e}", exc_info=True)
-                raise
+        try:
+            start_time = time.perf_counter()
+            initial_power = await asyncio.to_thread(setup_execution)
+            await asyncio.sleep(0.1)
 
-        # Run synchronous function in thread pool
-        return await asyncio.to_thread(sync_execution)
+            status_info, phase_info, execution_time = await self._poll_alignment_until_done(
+                "Flat", start_time, cancellation_event, progress_callback
+            )
+            result = await asyncio.to_thread(
+                finalize_execution, status_info, phase_info, initial_power, execution_time
+            )
+        except Exception as e:
+            logger.error("Error during flat alignment: %s", e, exc_info=True)
+            raise
+
+        # Retrieve profile data concurrently (independent reads per profile type)
+        if result is not None and result.success:
+            field_search, peak_x, peak_y = await self._retrieve_alignment_profiles_async((
+                Motion.Alignment.ProfileDataType.FieldSearch,
+                Motion.Alignment.ProfileDataType.PeakSearchX,
+                Motion.Alignment.ProfileDataType.PeakSearchY,
+            ))
+            result = result.model_copy(update={
+                "field_search_profile": field_search,
+                "peak_search_x_profile": peak_x,
+                "peak_search_y_profile": peak_y,
+            })
+
+        return result
 
     async def execute_focus_alignment_async(
         self,
         request: FocusAlignmentRequest,
         cancellation_event: Optional[asyncio.Event] = None,
-        progress_callback: Optional[Callable[[dict], None]] = None
+        progress_callback: Optional[Callable[[Union[dict, ProgressEvent]], None]] = None
     ) -> Optional[AlignmentResponse]:
         """
         Async wrapper for execute_focus_alignment with cancellation and progress support.
@@ -3158,189 +3324,156 @@ class SurugaSeikiController:
         Raises:
             Exception: If alignment fails or is cancelled
         """
-        def sync_execution() -> Optional[AlignmentResponse]:
-            """Synchronous execution in thread pool."""
-
-            if not self.is_connected() or self._alignment is None:
-                raise Exception("Not connected or Alignment not initialized")
-
-            try:
-                start_time = time.time()
-
-                # Create FocusParameter structure
-                focus_params = Motion.Alignment.FocusParameter()
-
-                # Set zMode (specific to Focus alignment)
-                focus_params.zMode = request.zMode
-
-                # Set all ~30 parameters from request
-                focus_params.mainStageNumberX = request.mainStageNumberX
-                focus_params.mainStageNumberY = request.mainStageNumberY
-                focus_params.subStageNumberXY = request.subStageNumberXY
-                focus_params.subAngleX = request.subAngleX
-                focus_params.subAngleY = request.subAngleY
-
-                focus_params.pmCh = request.pmCh
-                focus_params.analogCh = request.analogCh
-                focus_params.wavelength = request.wavelength
-                focus_params.pmAutoRangeUpOn = request.pmAutoRangeUpOn
-                focus_params.pmInitRangeSettingOn = request.pmInitRangeSettingOn
-                focus_params.pmInitRange = request.pmInitRange
-
-                focus_params.fieldSearchThreshold = request.fieldSearchThreshold
-                focus_params.peakSearchThreshold = request.peakSearchThreshold
-
-                focus_params.searchRangeX = request.searchRangeX
-                focus_params.searchRangeY = request.searchRangeY
-
-                focus_params.fieldSearchPitchX = request.fieldSearchPitchX
-                focus_params.fieldSearchPitchY = request.fieldSearchPitchY
-                focus_params.fieldSearchFirstPitchX = request.fieldSearchFirstPitchX
-                focus_params.fieldSearchSpeedX = request.fieldSearchSpeedX
-                focus_params.fieldSearchSpeedY = request.fieldSearchSpeedY
-
-                focus_params.peakSearchSpeedX = request.peakSearchSpeedX
-                focus_params.peakSearchSpeedY = request.peakSearchSpeedY
-
-                focus_params.smoothingRangeX = request.smoothingRangeX
-                focus_params.smoothingRangeY = request.smoothingRangeY
-
-                focus_params.centroidThresholdX = request.centroidThresholdX
-                focus_params.centroidThresholdY = request.centroidThresholdY
-
-                focus_params.convergentRangeX = request.convergentRangeX
-                focus_params.convergentRangeY = request.convergentRangeY
-                focus_params.comparisonCount = request.comparisonCount
-                focus_params.maxRepeatCount = request.maxRepeatCount
+        def setup_execution() -> float:
+            """Configure and start focus alignment in thread pool; returns initial power."""
+            # Create FocusParameter structure
+            focus_params = Motion.Alignment.FocusParameter()
 
-                # Apply parameters to alignment hardware
-                self._alignment.SetFocus(focus_params)
-                self._alignment.SetMeasurementWaveLength(request.pmCh, request.wavelength)
+            # Set zMode (specific to Focus alignment)
+            focus_params.zMode = request.zMode
 
-                # Measure initial optical power
-                initial_power = float(self._alignment.GetPower(request.pmCh))
-                logger.info(f"Focus alignment starting (zMode={request.zMode}) - Initial power: {initial_power:.3f} dBm")
+            # Set all ~30 parameters from request
+            focus_params.mainStageNumberX = request.mainStageNumberX
+            focus_params.mainStageNumberY = request.mainStageNumberY
+            focus_params.subStageNumberXY = request.subStageNumberXY
+            focus_params.subAngleX = request.subAngleX
+            focus_params.subAngleY = request.subAngleY
 
-                if progress_callback:
-                    progress_callback({
-                        "phase": "Starting",
-                        "initial_power": initial_power,
-                        "z_mode": request.zMode,
-                        "message": f"Focus alignment started - Initial power: {initial_power:.3f} dBm"
-                    })
+            focus_params.pmCh = request.pmCh
+            focus_params.analogCh = request.analogCh
+            focus_params.wavelength = request.wavelength
+            focus_params.pmAutoRangeUpOn = request.pmAutoRangeUpOn
+            focus_params.pmInitRangeSettingOn = request.pmInitRangeSettingOn
+            focus_params.pmInitRange = request.pmInitRange
 
-                # Start focus alignment
-                self._alignment.StartFocus()
-                time.sleep(0.1)
+            focus_params.fieldSearchThreshold = request.fieldSearchThreshold
+            focus_params.peakSearchThreshold = request.peakSearchThreshold
 
-                # Poll status until completion
-                last_phase_str = None
-                poll_interval = 0.5
-                timeout = 300  # 5 minutes
+            focus_params.searchRangeX = request.searchRangeX
+            focus_params.searchRangeY = request.searchRangeY
 
-                while True:
-                    # Check cancellation FIRST
-                    if cancellation_event and cancellation_event.is_set():
-                        logger.info("Focus alignment cancellation requested")
-                        self._alignment.Stop()
-                        time.sleep(0.5)  # Wait for stop
-                        raise Exception("Alignment cancelled by user")
+            focus_params.fieldSearchPitchX = request.fieldSearchPitchX
+            focus_params.fieldSearchPitchY = request.fieldSearchPitchY
+            focus_params.fieldSearchFirstPitchX = request.fieldSearchFirstPitchX
+            focus_params.fieldSearchSpeedX = request.fieldSearchSpeedX
+            focus_params.fieldSearchSpeedY = request.fieldSearchSpeedY
 
-                    status_str = str(self._alignment.GetStatus())
-                    phase_str = str(self._alignment.GetAligningStatus())
+            focus_params.peakSearchSpeedX = request.peakSearchSpeedX
+            focus_params.peakSearchSpeedY = request.peakSearchSpeedY
 
-                    # Log and broadcast phase changes
-                    if phase_str != last_phase_str:
-                        phase_info = self._get_aligning_phase_info(phase_str)
-                        logger.info(f"Focus alignment phase: {phase_info['phase']} - {phase_info['description']}")
+            focus_params.smoothingRangeX = request.smoothingRangeX
+            focus_params.smoothingRangeY = request.smoothingRangeY
 
-                        if progress_callback:
-                            progress_callback({
-                                "phase": phase_info['phase'],
-                                "phase_description": phase_info['description'],
-                                "elapsed_time": time.time() - start_time,
-                                "message": f"Phase: {phase_info['description']}"
-                            })
+            focus_params.centroidThresholdX = request.centroidThresholdX
+            focus_params.centroidThresholdY = request.centroidThresholdY
 
-                        last_phase_str = phase_str
+            focus_params.convergentRangeX = request.convergentRangeX
+            focus_params.convergentRangeY = request.convergentRangeY
+            focus_params.comparisonCount = request.comparisonCount
+            focus_params.maxRepeatCount = request.maxRepeatCount
 
-                    # Check if completed
-                    if status_str != "Aligning":
-                        status_info = self._get_optical_alignment_status_info(status_str)
-                        phase_info = self._get_aligning_phase_info(phase_str)
-                        execution_time = time.time() - start_time
+            # Apply parameters to alignment hardware
+            self._alignment.SetFocus(focus_params)
+            self._alignment.SetMeasurementWaveLength(request.pmCh, request.wavelength)
 
-                        if status_str == "Success":
-                            # Settling time
-                            time.sleep(0.2)
+            # Measure initial optical power
+            initial_power = self._alignment.GetPower(request.pmCh)
+            logger.info("Focus alignment starting (zMode=%s) - Initial power: %.3f dBm", request.zMode, initial_power)
+
+            if progress_callback:
+                progress_callback({
+                    "phase": "Starting",
+                    "initial_power": initial_power,
+                    "z_mode": request.zMode,
+                    "message": f"Focus alignment started - Initial power: {initial_power:.3f} dBm"
+                })
+
+            # Start focus alignment
+            self._alignment.StartFocus()
 
-                            # Measure final optical power
-                            final_power = float(self._alignment.GetPower(request.pmCh))
-                            power_improvement = final_power - initial_power
+            return initial_power
 
-                            logger.info(f"Focus alignment SUCCESS - Final power: {final_power:.3f} dBm, "
-                                      f"Improvement: {power_improvement:+.3f} dB, Time: {execution_time:.2f}s")
+        def finalize_execution(
+            status_info: dict, phase_info: dict, initial_power: float, execution_time: float
+        ) -> AlignmentResponse:
+            """Settle, read final power and peak positions in thread pool."""
+            # Settling time
+            time.sleep(0.2)
 
-                            # Retrieve profile data (including Z-axis)
-                            field_search_profile = self._retrieve_alignment_profile_data(
-                                Motion.Alignment.ProfileDataType.FieldSearch
-                            )
-                            peak_search_x_profile = self._retrieve_alignment_profile_data(
-                                Motion.Alignment.ProfileDataType.PeakSearchX
-                            )
-                            peak_search_y_profile = self._retrieve_alignment_profile_data(
-                                Motion.Alignment.ProfileDataType.PeakSearchY
-                            )
-                            peak_search_z_profile = self._retrieve_alignment_profile_data(
-                                Motion.Alignment.ProfileDataType.PeakSearchZ
-                            )
+            # Measure final optical power
+            final_power = self._alignment.GetPower(request.pmCh)
+            power_improvement = final_power - initial_power
 
-                            # Get peak positions (X, Y, Z)
-                            peak_x = float(self._axis_components[request.mainStageNumberX].GetActualPosition())
-                            peak_y = float(self._axis_components[request.mainStageNumberY].GetActualPosition())
-                            # Z-axis uses subStageNumberXY (typically axis 3 for Z1)
-                            peak_z = float(self._axis_components[request.subStageNumberXY].GetActualPosition())
+            logger.info(
+                "Focus alignment SUCCESS - Final power: %.3f dBm, Improvement: %+.3f dB, Time: %.2fs",
+                final_power,
+                power_improvement,
+                execution_time
+            )
 
-                            return AlignmentResponse(
-                                success=True,
-                                status_code=status_info['status'],
-                                status_value=status_info['value'],
-                                status_description=status_info['description'],
-                                phase_code=phase_info['phase'],
-                                phase_value=phase_info['value'],
-                                phase_description=phase_info['description'],
-                                initial_power=initial_power,
-                                final_power=final_power,
-                                power_improvement=power_improvement,
-                                peak_position_x=peak_x,
-                                peak_position_y=peak_y,
-                                peak_position_z=peak_z,
-                                execution_time=execution_time,
-                                field_search_profile=field_search_profile,
-                                peak_search_x_profile=peak_search_x_profile,
-                                peak_search_y_profile=peak_search_y_profile,
-                                peak_search_z_profile=peak_search_z_profile
-                            )
-                        else:
-                            # Alignment failed
-                            logger.error(f"Focus alignment FAILED - Status: {status_info['status']} - "
-                                       f"{status_info['description']}, Time: {execution_time:.2f}s")
+            # Profile data (including Z-axis) is retrieved by the async caller
 
-                            raise Exception(f"Focus alignment failed: {status_info['description']}")
+            # Get peak positions (X, Y, Z)
+            # Z-axis uses subStageNumberXY (typically axis 3 for Z1); 0 means no Z stage
+            peak_x, peak_y = self.get_positions(
+                (request.mainStageNumberX, request.mainStageNumberY)
+            )
+            peak_z = (
+                self.get_positions((request.subStageNumberXY,))[0]
+                if request.subStageNumberXY > 0 else None
+            )
 
-                    # Check timeout
-                    if time.time() - start_time > timeout:
-                        self._alignment.Stop()
-                        raise Exception(f"Focus alignment timed out after {timeout}s")
+            return AlignmentResponse.build(
+                success=True,
+                status_code=status_info['status'],
+                status_value=status_info['value'],
+                status_description=status_info['description'],
+                phase_code=phase_info['phase'],
+                phase_value=phase_info['value'],
+                phase_description=phase_info['description'],
+                initial_power=initial_power,
+                final_power=final_power,
+                power_improvement=power_improvement,
+                peak_position_x=peak_x,
+                peak_position_y=peak_y,
+                peak_position_z=peak_z,
+                execution_time=execution_time
+            )
 
-                    time.sleep(poll_interval)
+        if not self.is_connected() or self._alignment is None:
+            raise Exception("Not connected or Alignment not initialized")
 
-            except Exception as e:
-                logger.error(f"Error during focus alignment: {e}", exc_info=True)
-                raise
+        try:
+            start_time = time.perf_counter()
+            initial_power = await asyncio.to_thread(setup_execution)
+            await asyncio.sleep(0.1)
 
-        # Run synchronous function in thread pool
-        return await asyncio.to_thread(sync_execution)
+            status_info, phase_info, execution_time = await self._poll_alignment_until_done(
+                "Focus", start_time, cancellation_event, progress_callback
+            )
+            result = await asyncio.to_thread(
+                finalize_execution, status_info, phase_info, initial_power, execution_time
+            )
+        except Exception as e:
+            logger.error("Error during focus alignment: %s", e, exc_info=True)
+            raise
+
+        # Retrieve profile data concurrently (independent reads per profile type)
+        if result is not None and result.success:
+            field_search, peak_x, peak_y, peak_z = await self._retrieve_alignment_profiles_async((
+                Motion.Alignment.ProfileDataType.FieldSearch,
+                Motion.Alignment.ProfileDataType.PeakSearchX,
+                Motion.Alignment.ProfileDataType.PeakSearchY,
+                Motion.Alignment.ProfileDataType.PeakSearchZ,
+            ))
+            result = result.model_copy(update={
+                "field_search_profile": field_search,
+                "peak_search_x_profile": peak_x,
+                "peak_search_y_profile": peak_y,
+                "peak_search_z_profile": peak_z,
+            })
+
+        return result
 
     def _calculate_angle_adjustment_progress(self, phase_str: str) -> int:
         """Calculate progress percentage based on adjustment phase."""
@@ -3372,7 +3505,7 @@ class SurugaSeikiController:
             return False
 
         # Validate channel range (only CH1 and CH2 are available for contact sensing)
-        if channel not in [1, 2]:
+        if channel not in self._DIGITAL_CHANNELS:
             logger.error(f"Invalid digital channel {channel}. Only channels 1 and 2 are supported.")
             return False
 
@@ -3400,21 +3533,22 @@ class SurugaSeikiController:
             return None
 
         # Validate channel range (only CH1 and CH2 are available for contact sensing)
-        if channel not in [1, 2]:
+        if channel not in self._DIGITAL_CHANNELS:
             logger.error(f"Invalid digital channel {channel}. Only channels 1 and 2 are supported.")
             return None
 
         try:
-            # GetPortState with DigitalIOType.Output reads the OUTPUT state
-            # This is used to check if contact sensor is locked/unlocked
-            # Access enum through Motion.IO namespace
-            io_type = Motion.IO.DigitalIOType.Output
-            value = self._io.GetPortState(io_type, channel)
-            return bool(value)
+            return self._get_digital_output_unchecked(channel)
         except Exception as e:
             logger.error(f"Error getting digital output state: {e}", exc_info=True)
             return None
 
+    def _get_digital_output_unchecked(self, channel: int) -> bool:
+        """Read a digital output state without connection or channel validation."""
+        # GetPortState with DigitalIOType.Output reads the OUTPUT state
+        # This is used to check if contact sensor is locked/unlocked
+        return bool(self._io.GetPortState(self._DIGITAL_OUTPUT_TYPE, channel))
+
     def get_analog_input(self, channel: int) -> Optional[float]:
         """
         Get analog input voltage.
@@ -3430,21 +3564,22 @@ class SurugaSeikiController:
             return None
 
         # Validate channel range (only CH5 and CH6 are available)
-        if channel not in [5, 6]:
+        if channel not in self._ANALOG_CHANNELS:
             logger.error(f"Invalid analog channel {channel}. Only channels 5 and 6 are supported.")
             return None
 
         try:
-            # GetAnalogValue requires AnalogIOType enum and channel number
-            # DA1000/DA1100 support AnalogIOType.Input only (per manual section 4.9.1.5)
-            # Access enum through Motion.IO namespace
-            io_type = Motion.IO.AnalogIOType.Input
-            voltage = self._io.GetAnalogValue(io_type, channel)
-            return float(voltage)
+            return self._get_analog_input_unchecked(channel)
         except Exception as e:
             logger.error(f"Error getting analog input: {e}", exc_info=True)
             return None
 
+    def _get_analog_input_unchecked(self, channel: int) -> float:
+        """Read an analog input voltage without connection or channel validation."""
+        # GetAnalogValue requires AnalogIOType enum and channel number
+        # DA1000/DA1100 support AnalogIOType.Input only (per manual section 4.9.1.5)
+        return self._io.GetAnalogValue(self._ANALOG_INPUT_TYPE, channel)
+
     # ========== Utility Methods ==========
 
     def _validate_axis(self, axis_number: int) -> bool:
@@ -3466,11 +3601,26 @@ class SurugaSeikiController:
         Returns:
             Dictionary mapping axis number to AxisStatus
         """
+        return self.get_all_positions_fast()
+
+    def get_all_positions_fast(self) -> Dict[int, AxisStatus]:
+        """
+        Get current positions for all axes with a single connection check and lock.
+
+        Returns:
+            Dictionary mapping axis number to AxisStatus (axes that fail to read are omitted)
+        """
+        if not self.is_connected():
+            logger.error("Not connected to controller")
+            return {}
+
         positions = {}
-        for axis_num in self._axis_components.keys():
-            pos = self.get_position(axis_num)
-            if pos:
-                positions[axis_num] = pos
+        with self._lock:
+            for axis_num, axis in self._axis_components.items():
+                try:
+                    positions[axis_num] = self._read_axis_status(axis_num, axis)
+                except Exception as e:
+                    logger.error(f"Error getting position for axis {axis_num}: {e}")
         return positions
 
     def get_all_digital_outputs(self) -> Dict[int, bool]:
@@ -3480,12 +3630,28 @@ class SurugaSeikiController:
         Returns:
             Dictionary mapping channel number (1, 2) to output state (True=LOCKED, False=UNLOCKED)
         """
-        outputs = {}
-        for channel in [1, 2]:
-            value = self.get_digital_output(channel)
-            if value is not None:
-                outputs[channel] = value
-        return outputs
+        return self.get_all_digital_outputs_fast()
+
+    def get_all_digital_outputs_fast(self) -> Dict[int, bool]:
+        """
+        Get digital output states for CH1/CH2 with a single connection check and lock.
+
+        Returns:
+            Dictionary mapping channel number (1, 2) to output state, empty on error
+        """
+        if not self.is_connected() or self._io is None:
+            logger.error("Not connected or IO not initialized")
+            return {}
+
+        try:
+            with self._lock:
+                return {
+                    channel: self._get_digital_output_unchecked(channel)
+                    for channel in self._DIGITAL_CHANNELS
+                }
+        except Exception as e:
+            logger.error(f"Error getting digital output states: {e}", exc_info=True)
+            return {}
 
     def get_all_analog_inputs(self) -> Dict[int, float]:
         """
@@ -3494,12 +3660,61 @@ class SurugaSeikiController:
         Returns:
             Dictionary mapping channel number (5, 6) to voltage value
         """
-        inputs = {}
-        for channel in [5, 6]:
-            value = self.get_analog_input(channel)
-            if value is not None:
-                inputs[channel] = value
-        return inputs
+        return self.get_all_analog_inputs_fast()
+
+    def get_all_analog_inputs_fast(self) -> Dict[int, float]:
+        """
+        Get analog input voltages for CH5/CH6 with a single connection check and lock.
+
+        Returns:
+            Dictionary mapping channel number (5, 6) to voltage value, empty on error
+        """
+        if not self.is_connected() or self._io is None:
+            logger.error("Not connected or IO not initialized")
+            return {}
+
+        try:
+            with self._lock:
+                return {
+                    channel: self._get_analog_input_unchecked(channel)
+                    for channel in self._ANALOG_CHANNELS
+                }
+        except Exception as e:
+            logger.error(f"Error getting analog inputs: {e}", exc_info=True)
+            return {}
+
+    def get_snapshot(
+        self, power_channel: Optional[int] = None
+    ) -> Tuple[Dict[int, Dict[str, Any]], Dict[int, bool], Dict[int, float], Optional[float]]:
+        """
+        Read positions, IO states and optionally power in one locked pass.
+
+        The ADS link is shared and the DLL is not documented as thread-safe, so
+        streaming reads are batched here instead of being issued concurrently.
+        Positions are plain dicts of AxisStatus fields rather than models, since
+        the streaming path only serializes them.
+
+        Args:
+            power_channel: Power meter channel to read, or None to skip power
+
+        Returns:
+            Tuple of (positions, digital_outputs, analog_inputs, power_value)
+        """
+        if not self.is_connected():
+            logger.error("Not connected to controller")
+            return {}, {}, {}, None
+
+        with self._lock:
+            positions = {}
+            for axis_num, axis in self._axis_components.items():
+                try:
+                    positions[axis_num] = self._read_axis_state(axis_num, axis)
+                except Exception as e:
+                    logger.error(f"Error getting position for axis {axis_num}: {e}")
+            digital_outputs = self.get_all_digital_outputs_fast()
+            analog_inputs = self.get_all_analog_inputs_fast()
+            power_value = self.get_power(power_channel) if power_channel is not None else None
+        return positions, digital_outputs, analog_inputs, power_value
 
     def get_power(self, channel: int = 1) -> Optional[float]:
         """
@@ -3525,7 +3740,7 @@ class SurugaSeikiController:
 
         with self._lock:
             try:
-                power = float(self._alignment.GetPower(channel))
+                power = self._alignment.GetPower(channel)
                 return power
             except Exception as e:
                 logger.error(f"Error reading power meter channel {channel}: {e}", exc_info=True)
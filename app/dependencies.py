@@ -3,10 +3,12 @@ FastAPI Dependencies for Suruga Seiki Controller
 Centralized dependency injection for controller access with proper error handling
 """
 import logging
-from typing import Annotated, Union
+import time
+from typing import Annotated, AsyncIterator, Union
 from fastapi import HTTPException, Depends
 
 from .config import settings
+from .state import state
 
 # Import controller type based on MOCK_MODE to avoid .NET DLL loading in mock mode
 if settings.mock_mode:
@@ -16,34 +18,51 @@ else:
 
 logger = logging.getLogger(__name__)
 
+_NOT_INITIALIZED_DETAIL = "Controller not initialized. Service is starting up or encountered an error."
+_NOT_CONNECTED_DETAIL = "Not connected to hardware. Please connect first via /connection/connect"
 
-def get_controller_dependency() -> Union[ControllerClass, "SurugaSeikiController", "MockSurugaSeikiController"]:
+
+async def get_controller_dependency() -> AsyncIterator[Union[ControllerClass, "SurugaSeikiController", "MockSurugaSeikiController"]]:
     """
     FastAPI dependency for accessing the global controller instance.
 
-    Returns:
+    A server error raised by the endpoint drops the cached connection check, so
+    the next request re-reads is_connected() instead of trusting a dead link.
+
+    Yields:
         SurugaSeikiController: The global controller instance
 
     Raises:
         HTTPException: 503 if controller not initialized or not connected
     """
-    from .main import controller
+    controller = state.controller
 
     if controller is None:
         logger.error("Controller not initialized")
-        raise HTTPException(
-            status_code=503,
-            detail="Controller not initialized. Service is starting up or encountered an error."
-        )
-
-    if not controller.is_connected():
-        logger.warning("Attempt to access controller while disconnected")
-        raise HTTPException(
-            status_code=503,
-            detail="Not connected to hardware. Please connect first via /connection/connect"
-        )
+        raise HTTPException(status_code=503, detail=_NOT_INITIALIZED_DETAIL)
 
-    return controller
+    # Reuse a recent positive check; on the real controller is_connected() reads a .NET property
+    now = time.monotonic()
+    if now >= state.connected_until:
+        if not controller.is_connected():
+            logger.warning("Attempt to access controller while disconnected")
+            raise HTTPException(status_code=503, detail=_NOT_CONNECTED_DETAIL)
+        state.connected_until = now + settings.connection_check_ttl_s
+
+    try:
+        yield controller
+    except HTTPException as e:
+        if e.status_code >= 500:
+            invalidate_connection_cache()
+        raise
+    except Exception:
+        invalidate_connection_cache()
+        raise
+
+
+def invalidate_connection_cache() -> None:
+    """Force the next get_controller_dependency call to re-check the connection."""
+    state.connected_until = 0.0
 
 
 def get_controller_optional() -> Union[ControllerClass, "SurugaSeikiController", "MockSurugaSeikiController"]:
@@ -57,14 +76,11 @@ def get_controller_optional() -> Union[ControllerClass, "SurugaSeikiController",
     Raises:
         HTTPException: 503 if controller not initialized
     """
-    from .main import controller
+    controller = state.controller
 
     if controller is None:
         logger.error("Controller not initialized")
-        raise HTTPException(
-            status_code=503,
-            detail="Controller not initialized. Service is starting up or encountered an error."
-        )
+        raise HTTPException(status_code=503, detail=_NOT_INITIALIZED_DETAIL)
 
     return controller
 
@@ -3,18 +3,24 @@ Suruga Seiki EW51 Probe Station Daemon
 FastAPI application providing REST and WebSocket interfaces for probe station control
 """
 import asyncio
+import importlib.util
 import logging
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
-from typing import List, Optional, TYPE_CHECKING
-from datetime import datetime
+from typing import Dict, List, Optional, Set, TYPE_CHECKING
 
 from fastapi import FastAPI, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
+import orjson
 import uvicorn
 
 from .routers import connection, servo, motion, position, alignment, profile, io, websocket, angle_adjustment
 from .config import settings
 from .factory import create_controller
+from .state import state
+from .dependencies import invalidate_connection_cache
 
 if TYPE_CHECKING:
     from .controller_manager import SurugaSeikiController
@@ -31,150 +37,463 @@ logger = logging.getLogger(__name__)
 controller: Optional["SurugaSeikiController | MockSurugaSeikiController"] = None
 # Shutdown flag to stop background tasks gracefully
 is_shutting_down = False
+# Dedicated pool for blocking controller I/O made by the background tasks
+controller_executor: Optional[ThreadPoolExecutor] = None
+# Serialized position updates awaiting coalescing (only set when ws_batch_ms batching is enabled)
+position_queue: Optional[asyncio.Queue] = None
+# Strong references to the background tasks started in lifespan (cancelled on shutdown)
+background_tasks: List[asyncio.Task] = []
+
+
+# Automatic reconnection backoff bounds (seconds); doubled after each failed attempt
+RECONNECT_BACKOFF_INITIAL_S = 1.0
+RECONNECT_BACKOFF_MAX_S = 60.0
+
+# Per-connection send queue bound (oldest frames are dropped when a client falls behind)
+WS_SEND_QUEUE_SIZE = 64
+# Maximum number of queued frames a writer coalesces into one 'multi' frame
+WS_WRITE_COALESCE_MAX = 16
+
+# Envelope of a batched frame; its updates are already serialized messages
+_MULTI_PREFIX = '{"type":"multi","updates":['
+_MULTI_SUFFIX = "]}"
+
+
+def build_multi_frame(frames: List[str]) -> str:
+    """
+    Splice serialized frames into one 'multi' frame.
+
+    Frames that are themselves 'multi' frames are flattened into the outer
+    updates list, so clients never see nested batches.
+
+    Args:
+        frames: Serialized JSON messages
+
+    Returns:
+        Serialized {"type": "multi", "updates": [...]} frame
+    """
+    updates = [
+        frame[len(_MULTI_PREFIX):-len(_MULTI_SUFFIX)] if frame.startswith(_MULTI_PREFIX) else frame
+        for frame in frames
+    ]
+    return _MULTI_PREFIX + ",".join(updates) + _MULTI_SUFFIX
 
 
 # WebSocket connection manager
 class ConnectionManager:
-    def __init__(self):
-        self.active_connections: List[WebSocket] = []
+    def __init__(self, coalesce: bool = False):
+        """
+        Args:
+            coalesce: Let each writer merge frames already waiting in its queue into
+                one 'multi' frame. Only enabled together with ws_batch_ms batching,
+                since clients must then understand 'multi' frames anyway.
+        """
+        self.coalesce = coalesce
+        self.active_connections: Set[WebSocket] = set()
+        # Set when a client connects so an idle streamer wakes up immediately
+        self.client_connected = asyncio.Event()
+        # Set when a client connects or a queued frame is dropped; the streamer sends
+        # every axis on its next tick (changed-only frames alone can't rebuild state)
+        self.needs_full_snapshot = False
+        # Each connection has a single writer task draining its own send queue,
+        # so frames from different producers never interleave on one socket
+        self._send_queues: Dict[WebSocket, asyncio.Queue] = {}
+        self._writers: Dict[WebSocket, asyncio.Task] = {}
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
+        queue = asyncio.Queue(maxsize=WS_SEND_QUEUE_SIZE)
+        self._send_queues[websocket] = queue
+        self._writers[websocket] = asyncio.create_task(self._writer(websocket, queue))
+        self.active_connections.add(websocket)
+        self.needs_full_snapshot = True
+        self.client_connected.set()
         logger.info(f"WebSocket client connected. Total connections: {len(self.active_connections)}")
 
     def disconnect(self, websocket: WebSocket):
-        self.active_connections.remove(websocket)
+        # May already have been dropped by its writer after a failed send
+        self.active_connections.discard(websocket)
+        self._send_queues.pop(websocket, None)
+        writer = self._writers.pop(websocket, None)
+        if writer is not None and writer is not asyncio.current_task():
+            writer.cancel()
         logger.info(f"WebSocket client disconnected. Total connections: {len(self.active_connections)}")
 
     async def broadcast(self, message: dict):
-        for connection in self.active_connections:
+        await self.broadcast_raw(encode_message(message))
+
+    async def broadcast_raw(self, payload: str):
+        """Queue an already serialized JSON payload for every client."""
+        for websocket in list(self.active_connections):
+            self.send_raw(websocket, payload)
+
+    def send_raw(self, websocket: WebSocket, payload: str):
+        """Queue an already serialized JSON payload for one client, dropping its oldest frame if full."""
+        queue = self._send_queues.get(websocket)
+        if queue is None:
+            return
+        if queue.full():
+            queue.get_nowait()
+            queue.task_done()
+            self.needs_full_snapshot = True
+        queue.put_nowait(payload)
+
+    async def drain(self, timeout: float = 1.0):
+        """Wait (up to timeout seconds) until every queued frame has been written."""
+        queues = list(self._send_queues.values())
+        if queues:
             try:
-                await connection.send_json(message)
+                await asyncio.wait_for(asyncio.gather(*(queue.join() for queue in queues)), timeout)
+            except asyncio.TimeoutError:
+                logger.warning("Timed out flushing WebSocket send queues")
+
+    async def _writer(self, websocket: WebSocket, queue: asyncio.Queue):
+        """Sole sender for one connection; coalesces frames that are already waiting if enabled."""
+        coalesce_max = WS_WRITE_COALESCE_MAX if self.coalesce else 1
+        while True:
+            frames = [await queue.get()]
+            while len(frames) < coalesce_max and not queue.empty():
+                frames.append(queue.get_nowait())
+
+            payload = frames[0] if len(frames) == 1 else build_multi_frame(frames)
+
+            try:
+                # A client that stops reading must not hold its frames (and the
+                # shutdown drain) forever
+                await asyncio.wait_for(websocket.send_text(payload), settings.ws_send_timeout_s)
+            except asyncio.TimeoutError:
+                logger.warning("Dropping slow WebSocket client (send timed out)")
+                self.disconnect(websocket)
+                await self._close_quietly(websocket)
+                return
             except Exception as e:
                 logger.error(f"Error broadcasting to WebSocket: {e}")
+                self.disconnect(websocket)
+                return
+            finally:
+                for _ in frames:
+                    queue.task_done()
+
+    @staticmethod
+    async def _close_quietly(websocket: WebSocket):
+        """Close a dropped connection, ignoring errors from an already broken socket."""
+        try:
+            await asyncio.wait_for(websocket.close(code=1008, reason="Client too slow"), 1.0)
+        except Exception:
+            pass
 
 
-manager = ConnectionManager()
+# Second-resolution prefix cached by now_iso(); strftime runs once per second
+_iso_cache_second = -1
+_iso_cache_prefix = ""
 
 
-# Background task for streaming positions and IO data
-async def position_streaming_task():
-    """Continuously stream position and IO data updates via WebSocket"""
-    while not is_shutting_down:
-        try:
-            if controller and controller.is_connected() and manager.active_connections:
-                # Get all data from controller
-                positions = controller.get_all_positions()
-                digital_outputs = controller.get_all_digital_outputs()
-                analog_inputs = controller.get_all_analog_inputs()
-
-                # Get power meter reading if enabled
-                power_value = None
-                if settings.power_meter_streaming_enabled:
-                    power_value = controller.get_power(settings.power_meter_channel)
-
-                # Convert to serializable format using Pydantic's dict() method
-                position_data = {
-                    "type": "position_update",
-                    "timestamp": datetime.now().isoformat(),
-                    "positions": {
-                        axis_num: pos.dict() if hasattr(pos, 'dict') else pos.model_dump()
-                        for axis_num, pos in positions.items()
-                    },
-                    "digital_outputs": digital_outputs,
-                    "analog_inputs": analog_inputs,
-                    "power_meter": {
-                        "channel": settings.power_meter_channel,
-                        "value_dbm": power_value,
-                        "enabled": settings.power_meter_streaming_enabled
-                    }
-                }
-
-                await manager.broadcast(position_data)
-
-            await asyncio.sleep(1.0 / settings.ws_update_rate_hz)  # Configurable update rate
-        except Exception as e:
-            if not is_shutting_down:
-                logger.error(f"Error in position streaming task: {e}")
-            await asyncio.sleep(1)
+def now_iso() -> str:
+    """Local-time ISO 8601 timestamp with microseconds, like datetime.now().isoformat()."""
+    global _iso_cache_second, _iso_cache_prefix
+    now = time.time()
+    second = int(now)
+    if second != _iso_cache_second:
+        _iso_cache_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(second))
+        _iso_cache_second = second
+    return f"{_iso_cache_prefix}.{int((now - second) * 1_000_000):06d}"
+
+
+# Axis-keyed dicts need OPT_NON_STR_KEYS; numpy values come from the mock controller
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
 
-    logger.info("Position streaming task stopped")
+def encode_message(message: dict) -> str:
+    """Serialize a WebSocket message once for a text frame (int keys such as axis numbers become strings)."""
+    return orjson.dumps(message, option=_ORJSON_OPTIONS).decode()
 
 
-# Background task for connection health monitoring
-async def connection_health_task():
+manager = ConnectionManager(coalesce=settings.ws_batch_ms > 0 and settings.ws_batch_max > 1)
+
+
+def read_controller_snapshot(ctrl, power_channel: Optional[int] = None) -> tuple:
     """
-    Monitor connection health and attempt automatic reconnection.
-    Broadcasts connection status changes to WebSocket clients.
+    Read positions, IO states and (if enabled) power in a single executor hop.
+
+    The reads share one ADS link, so they are batched by the controller's
+    get_snapshot() under a single lock rather than issued concurrently.
+
+    Args:
+        ctrl: Controller instance
+        power_channel: Power meter channel to read, or None to skip the power reading
+
+    Returns:
+        Tuple of (positions, digital_outputs, analog_inputs, power_value)
+    """
+    return ctrl.get_snapshot(power_channel)
+
+
+# Background task multiplexing position/IO streaming and connection health monitoring
+async def background_supervisor_task():
     """
+    Single reactor loop for position/IO streaming and connection health monitoring.
+
+    A fast stream tick (ws_update_rate_hz) and a slow health tick share one task;
+    each iteration sleeps until the earlier of the two deadlines and runs whichever
+    is due. Health checks broadcast connection status changes to WebSocket clients
+    and attempt automatic reconnection while disconnected.
+    """
+    loop = asyncio.get_running_loop()
+
+    # Settings are fixed for the daemon's lifetime; bind them (and hot manager
+    # attributes) to locals once instead of looking them up every tick
+    pm_enabled = settings.power_meter_streaming_enabled
+    pm_channel = settings.power_meter_channel if pm_enabled else None
+    changed_only = settings.ws_changed_only
+    full_snapshot_ticks = settings.ws_full_snapshot_ticks
+    stream_interval = 1.0 / settings.ws_update_rate_hz
+    idle_interval = settings.reconnect_idle_interval_s
+    connections = manager.active_connections
+    client_connected = manager.client_connected
+    broadcast = manager.broadcast
+    broadcast_raw = manager.broadcast_raw
+    run_in_executor = loop.run_in_executor
+
+    # Streaming state: last sent state per axis, axis number -> (state key, state dict)
+    last_dumps = {}
+    ticks_since_snapshot = 0
+
+    # Message skeleton reused every tick; it is serialized right away, so
+    # mutating it in place is safe
+    positions_data = {}
+    power_meter = {
+        "channel": settings.power_meter_channel,
+        "value_dbm": None,
+        "enabled": pm_enabled
+    }
+    position_data = {
+        "type": "position_update",
+        "timestamp": "",
+        "positions": positions_data,
+        "digital_outputs": {},
+        "analog_inputs": {},
+        "power_meter": power_meter
+    }
+
+    # Health state: reconnect attempts back off exponentially (with jitter) while disconnected
     last_connection_state = None
+    reconnect_backoff = RECONNECT_BACKOFF_INITIAL_S
+    next_reconnect_at = 0.0
+
+    async def stream_tick():
+        """Read one controller snapshot and send it to every client."""
+        nonlocal ticks_since_snapshot
+
+        if not (controller and controller.is_connected()):
+            return
+
+        # Get all data from controller off the event loop
+        positions, digital_outputs, analog_inputs, power_value = await run_in_executor(
+            controller_executor, read_controller_snapshot, controller, pm_channel
+        )
+
+        # In changed-only mode, periodically (and whenever a client joins or
+        # a frame was dropped) send every axis so clients can rebuild the full state
+        full_snapshot = (
+            not changed_only
+            or ticks_since_snapshot >= full_snapshot_ticks
+            or manager.needs_full_snapshot
+        )
+        ticks_since_snapshot = 0 if full_snapshot else ticks_since_snapshot + 1
+        manager.needs_full_snapshot = False
+
+        # Snapshot positions are already plain AxisStatus field dicts; in
+        # changed-only mode, include only axes whose state changed
+        positions_data.clear()
+        for axis_num, axis_state in positions.items():
+            key = tuple(axis_state.values())
+            cached = last_dumps.get(axis_num)
+            if cached is not None and cached[0] == key:
+                if full_snapshot:
+                    positions_data[axis_num] = cached[1]
+                continue
+            last_dumps[axis_num] = (key, axis_state)
+            positions_data[axis_num] = axis_state
+
+        position_data["timestamp"] = now_iso()
+        position_data["digital_outputs"] = digital_outputs
+        position_data["analog_inputs"] = analog_inputs
+        power_meter["value_dbm"] = power_value
+        if changed_only:
+            position_data["changed_only"] = not full_snapshot
+
+        # Serialize once per tick rather than once per client
+        payload = encode_message(position_data)
+        if position_queue is not None:
+            # Drop the oldest update if the batching task has fallen behind
+            if position_queue.full():
+                position_queue.get_nowait()
+                manager.needs_full_snapshot = True
+            position_queue.put_nowait(payload)
+        else:
+            await broadcast_raw(payload)
+
+    async def health_tick() -> float:
+        """
+        Check the controller connection and reconnect if needed.
+
+        Returns:
+            Seconds until the next health check
+        """
+        nonlocal last_connection_state, reconnect_backoff, next_reconnect_at
+
+        if not controller:
+            return 5.0
+
+        current_state = controller.is_connected()
+
+        # Detect state change
+        if current_state != last_connection_state:
+            if current_state:
+                logger.info("Connection established")
+                reconnect_backoff = RECONNECT_BACKOFF_INITIAL_S
+                next_reconnect_at = 0.0
+                await broadcast({
+                    "type": "connection_status",
+                    "connected": True,
+                    "timestamp": now_iso(),
+                    "message": "Connected to Suruga Seiki controller"
+                })
+            else:
+                logger.warning("Connection lost")
+                invalidate_connection_cache()
+                await broadcast({
+                    "type": "connection_status",
+                    "connected": False,
+                    "timestamp": now_iso(),
+                    "message": "Disconnected from controller"
+                })
+
+            last_connection_state = current_state
+
+        # Attempt reconnection if disconnected and the backoff has elapsed
+        # (but not during shutdown)
+        if not current_state and not is_shutting_down and loop.time() >= next_reconnect_at:
+            logger.info("Attempting automatic reconnection...")
+            success = False
+            try:
+                success = await run_in_executor(controller_executor, controller.connect)
+                if success:
+                    logger.info("Automatic reconnection successful")
+                    await broadcast({
+                        "type": "connection_status",
+                        "connected": True,
+                        "timestamp": now_iso(),
+                        "message": "Automatically reconnected to controller"
+                    })
+                    last_connection_state = True
+                    reconnect_backoff = RECONNECT_BACKOFF_INITIAL_S
+                else:
+                    logger.debug("Reconnection attempt failed, will retry...")
+            except Exception as e:
+                logger.debug(f"Reconnection attempt error: {e}")
+
+            if not success:
+                delay = reconnect_backoff * random.uniform(0.5, 1.5)
+                next_reconnect_at = loop.time() + delay
+                reconnect_backoff = min(reconnect_backoff * 2, RECONNECT_BACKOFF_MAX_S)
+                logger.debug(f"Next reconnection attempt in {delay:.1f}s")
+
+        # Check every 5 seconds while connected; while disconnected, check at the
+        # configurable interval but wake in time for the next reconnection attempt
+        if controller.is_connected():
+            return 5.0
+        return max(0.1, min(idle_interval, next_reconnect_at - loop.time()))
+
+    next_stream = next_health = loop.time()
 
     while not is_shutting_down:
-        try:
-            if controller:
-                current_state = controller.is_connected()
-
-                # Detect state change
-                if current_state != last_connection_state:
-                    if current_state:
-                        logger.info("Connection established")
-                        await manager.broadcast({
-                            "type": "connection_status",
-                            "connected": True,
-                            "timestamp": datetime.now().isoformat(),
-                            "message": "Connected to Suruga Seiki controller"
-                        })
-                    else:
-                        logger.warning("Connection lost")
-                        await manager.broadcast({
-                            "type": "connection_status",
-                            "connected": False,
-                            "timestamp": datetime.now().isoformat(),
-                            "message": "Disconnected from controller"
-                        })
-
-                    last_connection_state = current_state
-
-                # Attempt reconnection if disconnected (but not during shutdown)
-                if not current_state and not is_shutting_down:
-                    logger.info("Attempting automatic reconnection...")
-                    try:
-                        success = controller.connect()
-                        if success:
-                            logger.info("Automatic reconnection successful")
-                            await manager.broadcast({
-                                "type": "connection_status",
-                                "connected": True,
-                                "timestamp": datetime.now().isoformat(),
-                                "message": "Automatically reconnected to controller"
-                            })
-                            last_connection_state = True
-                        else:
-                            logger.debug("Reconnection attempt failed, will retry...")
-                    except Exception as e:
-                        logger.debug(f"Reconnection attempt error: {e}")
-
-            await asyncio.sleep(5.0)  # Check every 5 seconds
+        now = loop.time()
+
+        if now >= next_health:
+            try:
+                next_health = now + await health_tick()
+            except Exception as e:
+                if not is_shutting_down:
+                    logger.error(f"Error in connection health check: {e}", exc_info=True)
+                next_health = now + 5.0
 
+        if now >= next_stream and connections:
+            try:
+                await stream_tick()
+                next_stream = now + stream_interval  # Configurable update rate
+            except Exception as e:
+                if not is_shutting_down:
+                    logger.error(f"Error in position streaming: {e}")
+                next_stream = now + 1.0
+
+        sleep_for = max(0.0, min(next_stream, next_health) - loop.time())
+        if not connections:
+            # No clients: idle until one connects, the next health check is due,
+            # or 0.5 s passes to re-check shutdown
+            client_connected.clear()
+            try:
+                await asyncio.wait_for(
+                    client_connected.wait(), timeout=min(0.5, max(0.0, next_health - loop.time()))
+                )
+            except asyncio.TimeoutError:
+                pass
+        else:
+            await asyncio.sleep(sleep_for)
+
+    logger.info("Background supervisor task stopped")
+
+
+# Background task for coalescing position updates into batched frames
+async def position_batching_task(queue: asyncio.Queue):
+    """
+    Drain queued position updates and broadcast them as one 'multi' frame.
+
+    Collects up to ws_batch_max updates or waits ws_batch_ms after the first one,
+    whichever comes first. Updates are queued already serialized and are spliced
+    into the frame as-is; a lone update is sent unchanged as a 'position_update'.
+    """
+    loop = asyncio.get_running_loop()
+    window = settings.ws_batch_ms / 1000.0
+
+    while not is_shutting_down:
+        try:
+            try:
+                updates = [await asyncio.wait_for(queue.get(), timeout=1.0)]
+            except asyncio.TimeoutError:
+                continue
+
+            deadline = loop.time() + window
+            while len(updates) < settings.ws_batch_max:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    updates.append(await asyncio.wait_for(queue.get(), timeout=remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            payload = updates[0] if len(updates) == 1 else build_multi_frame(updates)
+            await manager.broadcast_raw(payload)
         except Exception as e:
             if not is_shutting_down:
-                logger.error(f"Error in connection health task: {e}", exc_info=True)
-            await asyncio.sleep(5.0)
-    
-    logger.info("Connection health monitoring task stopped")
+                logger.error(f"Error in position batching task: {e}")
+
+    logger.info("Position batching task stopped")
 
 
 # Application lifecycle
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Initialize and cleanup on startup/shutdown"""
-    global controller, is_shutting_down
+    global controller, is_shutting_down, position_queue, controller_executor
 
     logger.info("Starting Suruga Seiki EW51 Daemon...")
     logger.info(f"Default ADS address: {settings.ads_address}")
     logger.info(f"MOCK MODE: {'ENABLED' if settings.mock_mode else 'DISABLED'}")
     controller = create_controller()
+    state.controller = controller
+    controller_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="controller-io")
 
     # Optionally auto-connect to the machine on startup
     if settings.auto_connect_on_start:
@@ -187,9 +506,21 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.error(f"Auto-connect encountered an error: {e}")
 
+    # Generate the OpenAPI schema up front (FastAPI caches it) so the first
+    # /docs or /openapi.json request doesn't pay for walking every model
+    app.openapi()
+
     # Start background tasks
-    asyncio.create_task(position_streaming_task())
-    asyncio.create_task(connection_health_task())
+    if settings.ws_batch_ms > 0 and settings.ws_batch_max > 1:
+        # Bounded so a stalled batching task cannot grow the backlog without limit
+        position_queue = asyncio.Queue(maxsize=settings.ws_batch_max * 4)
+        background_tasks.append(
+            asyncio.create_task(position_batching_task(position_queue), name="position-batching")
+        )
+        logger.info(f"Coalescing position updates over {settings.ws_batch_ms} ms windows")
+    background_tasks.append(
+        asyncio.create_task(background_supervisor_task(), name="background-supervisor")
+    )
     logger.info("Background tasks started (position + IO streaming, connection health monitoring)")
 
     yield
@@ -197,21 +528,28 @@ async def lifespan(app: FastAPI):
     # Cleanup
     logger.info("Shutting down Suruga Seiki EW51 Daemon...")
     is_shutting_down = True  # Signal background tasks to stop
-    
-    # Give background tasks a moment to finish
-    await asyncio.sleep(0.5)
+
+    # Cancel background tasks and wait for them so nothing is broadcast after
+    # the connections are closed
+    for task in background_tasks:
+        task.cancel()
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+    background_tasks.clear()
+    logger.info("Background tasks stopped")
     
     # Notify all WebSocket clients about shutdown
     if manager.active_connections:
         shutdown_message = {
             "type": "server_shutdown",
             "message": "Suruga Seiki daemon is shutting down",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
         await manager.broadcast(shutdown_message)
-        
+        await manager.drain()
+
         # Close all WebSocket connections gracefully with custom message
-        for connection in manager.active_connections[:]:  # Copy list to avoid modification during iteration
+        for connection in list(manager.active_connections):  # Copy to avoid modification during iteration
+            manager.disconnect(connection)
             try:
                 await connection.close(code=1012, reason="Suruga Seiki daemon shutting down")
             except Exception as e:
@@ -224,6 +562,8 @@ async def lifespan(app: FastAPI):
     if controller and controller.is_connected():
         controller.disconnect()
 
+    controller_executor.shutdown(wait=False)
+
 
 # Create FastAPI app
 app = FastAPI(
@@ -234,10 +574,13 @@ app = FastAPI(
 )
 
 # Add CORS middleware
+# A bare wildcard disables credentials so Starlette can answer with a plain "*"
+# instead of echoing and comparing the request origin on every call
+cors_origins = [origin.strip() for origin in settings.cors_origins.split(",") if origin.strip()]
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
+    allow_origins=cors_origins,
+    allow_credentials=cors_origins != ["*"],
     allow_methods=["*"],
     allow_headers=["*"],
 )
@@ -260,7 +603,7 @@ async def health_check():
     """Health check endpoint"""
     return {
         "status": "healthy",
-        "timestamp": datetime.now().isoformat()
+        "timestamp": now_iso()
     }
 
 
@@ -283,12 +626,22 @@ def run():
     """Entry point for the console script"""
     logger.info(f"Starting daemon on {settings.host}:{settings.port}")
     logger.info(f"WebSocket update rate: {settings.ws_update_rate_hz} Hz")
+
+    # uvloop/httptools are not available on Windows; fall back to the stdlib loop and h11
+    loop = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+    http = "httptools" if importlib.util.find_spec("httptools") else "h11"
+    logger.info(f"Event loop: {loop}, HTTP protocol: {http}")
+
     uvicorn.run(
         "instruments.suruga_seiki_ew51.daemon.app.main:app",
         host=settings.host,
         port=settings.port,
         log_level=settings.log_level.lower(),
-        reload=settings.reload
+        reload=settings.reload,
+        loop=loop,
+        http=http,
+        ws="websockets",
+        ws_per_message_deflate=settings.ws_per_message_deflate
     )
 
 
@@ -14,16 +14,17 @@ Usage:
 """
 import asyncio
 import logging
+import math
 import threading
 import time
-import random
 from typing import Optional, Dict, List, Tuple, Any
 from datetime import datetime
 
+import numpy as np
+
 from .models import (
     AxisStatus,
     ProfileDataResponse,
-    ProfileDataPoint,
     ProfileErrorCode,
     ProfileMeasurementStatus,
     ProfileMeasurementRequest,
@@ -36,6 +37,99 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+# Axis numbers 1-12, frozen once for every all-axis loop
+_AXIS_NUMBERS = tuple(range(1, 13))
+_NUM_AXES = len(_AXIS_NUMBERS)
+
+# Length of the mock's pre-generated noise ring buffer (power of two for cheap wrap-around)
+_NOISE_BUFFER_SIZE = 4096
+
+# fastrlock's reentrant lock is cheaper for the uncontended acquire/release
+# this controller does on every call; it is optional (dev dependency)
+try:
+    from fastrlock.rlock import FastRLock as _RLock
+except ImportError:
+    _RLock = threading.RLock
+
+
+def _step_axes_vectorized(
+    positions: np.ndarray, targets: np.ndarray, speeds: np.ndarray, moving: np.ndarray, dt: float
+) -> np.ndarray:
+    """
+    Advance every moving axis by one simulation tick, in place.
+
+    Axes flagged as moving without a target (NaN) stop; axes within 0.01 µm/deg of
+    their target snap to it and stop; the rest move towards it at speed * dt.
+
+    Args:
+        positions: Current positions
+        targets: Target positions (NaN = no target)
+        speeds: Speeds per axis
+        moving: Moving flags
+        dt: Elapsed time since the previous tick in seconds
+
+    Returns:
+        Boolean mask of the axes that reached their target this tick
+    """
+    # Axes flagged as moving without a target simply stop
+    moving &= ~np.isnan(targets)
+
+    # Distance to target for moving axes (NaN elsewhere compares False)
+    delta = np.where(moving, targets - positions, np.nan)
+    distance = np.abs(delta)
+
+    # Reached target: snap and stop
+    arrived = distance < 0.01
+    positions[arrived] = targets[arrived]
+    moving[arrived] = False
+    targets[arrived] = np.nan
+
+    # Move the remaining axes towards their targets
+    stepping = moving & ~arrived
+    step = np.minimum(speeds * dt, distance)
+    positions[stepping] += np.sign(delta[stepping]) * step[stepping]
+    return arrived
+
+
+def _step_axes_loop(
+    positions: np.ndarray, targets: np.ndarray, speeds: np.ndarray, moving: np.ndarray, dt: float
+) -> np.ndarray:
+    """Scalar-loop equivalent of _step_axes_vectorized, written for Numba compilation."""
+    arrived = np.zeros(positions.shape[0], dtype=np.bool_)
+    for i in range(positions.shape[0]):
+        if not moving[i]:
+            continue
+        target = targets[i]
+        if np.isnan(target):
+            moving[i] = False
+            continue
+        delta = target - positions[i]
+        distance = abs(delta)
+        if distance < 0.01:
+            positions[i] = target
+            moving[i] = False
+            targets[i] = np.nan
+            arrived[i] = True
+        else:
+            positions[i] += math.copysign(min(speeds[i] * dt, distance), delta)
+    return arrived
+
+
+# With only 12 axes, NumPy's per-call overhead dominates the tick; a Numba-compiled
+# loop avoids it. Numba is optional (dev dependency); without it the vectorized
+# NumPy version is used
+try:
+    from numba import njit
+except ImportError:
+    _step_axes = _step_axes_vectorized
+else:
+    _step_axes = njit(_step_axes_loop)
+    # Compile now for the simulation's argument types rather than on the first
+    # tick, which runs under the motion lock
+    _step_axes(
+        np.zeros(1), np.full(1, np.nan), np.ones(1), np.zeros(1, dtype=np.bool_), 0.05
+    )
+
 
 class MockSurugaSeikiController:
     """
@@ -69,17 +163,34 @@ class MockSurugaSeikiController:
             ads_address: ADS address (ignored in mock mode, kept for API compatibility)
         """
         self.ads_address = ads_address
-        self._lock = threading.RLock()
+        # Two independent lock domains so I/O calls never wait behind the 20 Hz
+        # movement tick: axis state (positions, targets, motion, servo and error
+        # flags, connection) and I/O state (digital outputs, analog noise)
+        self._motion_lock = _RLock()
+        self._io_lock = _RLock()
         self._connected = False
 
-        # Axis state
-        self._positions: Dict[int, float] = {i: 0.0 for i in range(1, 13)}
-        self._target_positions: Dict[int, Optional[float]] = {i: None for i in range(1, 13)}
-        self._servos_on: Dict[int, bool] = {i: False for i in range(1, 13)}
-        self._moving: Dict[int, bool] = {i: False for i in range(1, 13)}
-        self._speeds: Dict[int, float] = {i: 1000.0 for i in range(1, 13)}
-        self._errors: Dict[int, bool] = {i: False for i in range(1, 13)}
-        self._error_codes: Dict[int, int] = {i: 0 for i in range(1, 13)}
+        # Axis state as parallel arrays indexed by axis_number - 1, so the
+        # movement simulation can step every axis with a few vectorized ops
+        self._positions = np.zeros(_NUM_AXES, dtype=np.float64)
+        self._target_positions = np.full(_NUM_AXES, np.nan)  # NaN = no target
+        self._servos_on = np.zeros(_NUM_AXES, dtype=bool)
+        self._moving = np.zeros(_NUM_AXES, dtype=bool)
+        self._speeds = np.full(_NUM_AXES, 1000.0)
+        self._errors = np.zeros(_NUM_AXES, dtype=bool)
+        self._error_codes = np.zeros(_NUM_AXES, dtype=np.int64)
+        # AXIS_CONFIG as a tuple with the same indexing, avoiding dict lookups on hot paths
+        self._axis_cfg = tuple(type(self).AXIS_CONFIG[i] for i in _AXIS_NUMBERS)
+        self._axis_names = tuple(cfg[0] for cfg in self._axis_cfg)
+        # Soft limits as arrays (same indexing) for vectorized batch checks
+        self._min_limits = np.array([cfg[2] for cfg in self._axis_cfg], dtype=np.float64)
+        self._max_limits = np.array([cfg[3] for cfg in self._axis_cfg], dtype=np.float64)
+        # Simulated profile measurement, built on first request
+        self._cached_profile_response: Optional[ProfileDataResponse] = None
+        # Last built AxisStatus per axis, and whether the axis changed since then
+        # (set by every motion/servo state change, cleared by get_all_positions)
+        self._status_pool: List[Optional[AxisStatus]] = [None] * _NUM_AXES
+        self._status_dirty = np.ones(_NUM_AXES, dtype=bool)
 
         # I/O state
         self._digital_outputs: Dict[int, bool] = {1: False, 2: False}  # 1=LEFT, 2=RIGHT
@@ -87,6 +198,18 @@ class MockSurugaSeikiController:
             1: 0.5, 2: 0.5, 3: 0.5, 4: 0.5,
             5: 2.8, 6: 2.8, 7: 0.5, 8: 0.5  # Channels 5,6 for contact sensors
         }
+        self._analog_channels = tuple(self._analog_inputs)
+        self._analog_base = np.array(list(self._analog_inputs.values()))
+        # Fluctuation amplitude per channel; contact sensors (5, 6) are noisier
+        self._analog_noise_amplitude = np.array(
+            [0.05 if ch in (5, 6) else 0.02 for ch in self._analog_channels]
+        )
+
+        # Pre-generated unit noise read as a ring buffer (analog inputs and power)
+        # instead of calling random.uniform per reading; padded so an 8-channel
+        # slice never wraps
+        self._noise = np.random.uniform(-1.0, 1.0, _NOISE_BUFFER_SIZE + len(self._analog_channels))
+        self._noise_index = 0
 
         # System state
         self._is_error = False
@@ -95,8 +218,10 @@ class MockSurugaSeikiController:
         # Movement simulation (background thread)
         self._movement_thread: Optional[threading.Thread] = None
         self._movement_stop_event = threading.Event()
+        # Set while any axis is moving; the simulation thread sleeps on it when idle
+        self._motion_pending = threading.Event()
 
-        logger.info(f"MOCK: Initialized MockSurugaSeikiController for ADS address: {ads_address}")
+        logger.info("MOCK: Initialized MockSurugaSeikiController for ADS address: %s", ads_address)
 
     def get_versions(self) -> Tuple[Optional[str], Optional[str]]:
         """Return mock DLL and system versions."""
@@ -115,10 +240,10 @@ class MockSurugaSeikiController:
         Returns:
             True (always succeeds in mock mode)
         """
-        with self._lock:
-            logger.info(f"MOCK: Connecting to simulated probe station at {self.ads_address}")
-            time.sleep(0.5)  # Simulate connection delay
+        logger.info("MOCK: Connecting to simulated probe station at %s", self.ads_address)
+        time.sleep(0.5)  # Simulate connection delay (no state touched, so outside the lock)
 
+        with self._motion_lock:
             # Start movement simulation thread
             if self._movement_thread is None or not self._movement_thread.is_alive():
                 self._movement_stop_event.clear()
@@ -139,17 +264,18 @@ class MockSurugaSeikiController:
         Returns:
             True
         """
-        with self._lock:
+        with self._motion_lock:
             logger.info("MOCK: Disconnecting from simulated probe station")
 
             # Turn off all servos
-            for axis_num in range(1, 13):
-                self._servos_on[axis_num] = False
-                self._moving[axis_num] = False
+            self._servos_on[:] = False
+            self._moving[:] = False
+            self._status_dirty[:] = True
 
             # Stop movement simulation
             if self._movement_thread and self._movement_thread.is_alive():
                 self._movement_stop_event.set()
+                self._motion_pending.set()  # Wake an idle simulation thread so it exits
 
             self._connected = False
             logger.info("MOCK: Disconnected from simulated probe station")
@@ -169,17 +295,17 @@ class MockSurugaSeikiController:
         if not self.is_connected():
             return True, "Not connected to controller"
 
-        with self._lock:
+        with self._motion_lock:
             is_error = False
             error_msgs = []
 
             # Check all axes for errors
-            for axis_num in range(1, 13):
-                if self._errors[axis_num]:
-                    is_error = True
-                    error_code = self._error_codes[axis_num]
-                    axis_name = self.AXIS_CONFIG[axis_num][0]
-                    error_msgs.append(f"Axis {axis_num} ({axis_name}): Error code {error_code}")
+            for index in np.flatnonzero(self._errors):
+                is_error = True
+                axis_num = int(index) + 1
+                error_code = int(self._error_codes[index])
+                axis_name = self._axis_names[index]
+                error_msgs.append(f"Axis {axis_num} ({axis_name}): Error code {error_code}")
 
             if is_error:
                 return True, "; ".join(error_msgs)
@@ -190,60 +316,64 @@ class MockSurugaSeikiController:
 
     def turn_on_servo(self, axis_number: int) -> bool:
         """Turn on servo for specified axis."""
-        with self._lock:
+        with self._motion_lock:
             if not self._connected:
-                logger.error(f"MOCK: Cannot turn on servo - not connected")
+                logger.error("MOCK: Cannot turn on servo - not connected")
                 return False
 
             if axis_number < 1 or axis_number > 12:
-                logger.error(f"MOCK: Invalid axis number: {axis_number}")
+                logger.error("MOCK: Invalid axis number: %s", axis_number)
                 return False
 
-            self._servos_on[axis_number] = True
-            logger.info(f"MOCK: Servo ON for axis {axis_number} ({self.AXIS_CONFIG[axis_number][0]})")
+            self._servos_on[axis_number - 1] = True
+            self._status_dirty[axis_number - 1] = True
+            logger.info("MOCK: Servo ON for axis %s (%s)", axis_number, self._axis_names[axis_number - 1])
             return True
 
     def turn_off_servo(self, axis_number: int) -> bool:
         """Turn off servo for specified axis."""
-        with self._lock:
+        with self._motion_lock:
             if not self._connected:
                 return False
 
             if axis_number < 1 or axis_number > 12:
                 return False
 
-            self._servos_on[axis_number] = False
-            self._moving[axis_number] = False  # Stop movement when servo turns off
-            self._target_positions[axis_number] = None
-            logger.info(f"MOCK: Servo OFF for axis {axis_number} ({self.AXIS_CONFIG[axis_number][0]})")
+            self._servos_on[axis_number - 1] = False
+            self._moving[axis_number - 1] = False  # Stop movement when servo turns off
+            self._target_positions[axis_number - 1] = np.nan
+            self._status_dirty[axis_number - 1] = True
+            logger.info("MOCK: Servo OFF for axis %s (%s)", axis_number, self._axis_names[axis_number - 1])
             return True
 
     def turn_on_servos_batch(self, axis_numbers: List[int]) -> bool:
         """Turn on servos for multiple axes."""
-        with self._lock:
+        with self._motion_lock:
             if not self._connected:
                 return False
 
             for axis_num in axis_numbers:
                 if 1 <= axis_num <= 12:
-                    self._servos_on[axis_num] = True
+                    self._servos_on[axis_num - 1] = True
+                    self._status_dirty[axis_num - 1] = True
 
-            logger.info(f"MOCK: Batch servo ON for {len(axis_numbers)} axes")
+            logger.info("MOCK: Batch servo ON for %s axes", len(axis_numbers))
             return True
 
     def turn_off_servos_batch(self, axis_numbers: List[int]) -> bool:
         """Turn off servos for multiple axes."""
-        with self._lock:
+        with self._motion_lock:
             if not self._connected:
                 return False
 
             for axis_num in axis_numbers:
                 if 1 <= axis_num <= 12:
-                    self._servos_on[axis_num] = False
-                    self._moving[axis_num] = False
-                    self._target_positions[axis_num] = None
+                    self._servos_on[axis_num - 1] = False
+                    self._moving[axis_num - 1] = False
+                    self._target_positions[axis_num - 1] = np.nan
+                    self._status_dirty[axis_num - 1] = True
 
-            logger.info(f"MOCK: Batch servo OFF for {len(axis_numbers)} axes")
+            logger.info("MOCK: Batch servo OFF for %s axes", len(axis_numbers))
             return True
 
     def wait_for_axis_ready(self, axis_number: int, timeout: float = 10.0) -> bool:
@@ -252,7 +382,7 @@ class MockSurugaSeikiController:
 
         In mock mode, this always succeeds immediately after a small delay.
         """
-        if not self._servos_on.get(axis_number, False):
+        if not 1 <= axis_number <= 12 or not self._servos_on[axis_number - 1]:
             return False
 
         time.sleep(0.1)  # Simulate servo settling time
@@ -265,38 +395,80 @@ class MockSurugaSeikiController:
 
     # ========== Position Queries ==========
 
-    def get_position(self, axis_number: int) -> Optional[AxisStatus]:
-        """Get current position and status of an axis."""
-        with self._lock:
-            if not self._connected or axis_number < 1 or axis_number > 12:
-                return None
-
-            return AxisStatus(
-                axis_number=axis_number,
-                actual_position=round(self._positions[axis_number], 3),
-                is_moving=self._moving[axis_number],
-                is_servo_on=self._servos_on[axis_number],
-                is_error=self._errors[axis_number],
-                error_code=self._error_codes[axis_number]
+    def _axis_states(self) -> Dict[int, Dict[str, Any]]:
+        """Return plain AxisStatus field dicts for all axes (caller holds the motion lock)."""
+        positions = np.round(self._positions, 3).tolist()
+        moving = self._moving.tolist()
+        servos_on = self._servos_on.tolist()
+        errors = self._errors.tolist()
+        error_codes = self._error_codes.tolist()
+        return {
+            axis_num: {
+                "axis_number": axis_num,
+                "actual_position": position,
+                "is_moving": is_moving,
+                "is_servo_on": is_servo_on,
+                "is_error": is_error,
+                "error_code": error_code
+            }
+            for axis_num, position, is_moving, is_servo_on, is_error, error_code in zip(
+                _AXIS_NUMBERS, positions, moving, servos_on, errors, error_codes
             )
+        }
+
+    def _build_axis_status(self, index: int) -> AxisStatus:
+        """
+        Build an AxisStatus for the axis at the given array index.
+
+        Fields come from typed internal state, so validation is skipped.
+        """
+        return AxisStatus(
+            axis_number=index + 1,
+            actual_position=round(float(self._positions[index]), 3),
+            is_moving=bool(self._moving[index]),
+            is_servo_on=bool(self._servos_on[index]),
+            is_error=bool(self._errors[index]),
+            error_code=int(self._error_codes[index])
+        )
+
+    def get_position(self, axis_number: int) -> Optional[AxisStatus]:
+        """
+        Get current position and status of an axis.
+
+        Read without the lock: each field read is atomic under the GIL, but a
+        concurrent movement tick may land between them (e.g. the position from
+        one tick and is_moving from the next), which is fine for telemetry.
+        Without the lock the pooled instance is only read, never refreshed.
+        """
+        if not self._connected or axis_number < 1 or axis_number > 12:
+            return None
+
+        index = axis_number - 1
+        cached = self._status_pool[index]
+        if cached is not None and not self._status_dirty[index]:
+            return cached
+        return self._build_axis_status(index)
 
     def get_all_positions(self) -> Dict[int, AxisStatus]:
-        """Get positions for all axes."""
-        with self._lock:
+        """
+        Get positions for all axes.
+
+        Pooled AxisStatus instances are reused for axes whose state has not
+        changed since they were built; only dirty axes are rebuilt. Instances are
+        replaced, never mutated, since callers may still hold the old ones.
+        """
+        with self._motion_lock:
             if not self._connected:
                 return {}
 
-            return {
-                axis_num: AxisStatus(
-                    axis_number=axis_num,
-                    actual_position=round(self._positions[axis_num], 3),
-                    is_moving=self._moving[axis_num],
-                    is_servo_on=self._servos_on[axis_num],
-                    is_error=self._errors[axis_num],
-                    error_code=self._error_codes[axis_num]
-                )
-                for axis_num in range(1, 13)
-            }
+            dirty = self._status_dirty
+            if dirty.any():
+                pool = self._status_pool
+                for index in np.flatnonzero(dirty).tolist():
+                    pool[index] = self._build_axis_status(index)
+                dirty[:] = False
+
+            return dict(zip(_AXIS_NUMBERS, self._status_pool))
 
     # ========== Motion Control ==========
 
@@ -312,26 +484,14 @@ class MockSurugaSeikiController:
         Returns:
             (success, message)
         """
-        with self._lock:
+        with self._motion_lock:
             if not self._connected:
                 return False, "Not connected"
 
-            if not self._servos_on.get(axis_number, False):
-                return False, f"Servo not on for axis {axis_number}"
-
-            # Check soft limits
-            _, _, min_pos, max_pos = self.AXIS_CONFIG[axis_number]
-            if position < min_pos or position > max_pos:
-                return False, f"Position {position} outside limits [{min_pos}, {max_pos}]"
-
-            # Start simulated movement
-            self._target_positions[axis_number] = position
-            self._speeds[axis_number] = speed
-            self._moving[axis_number] = True
+            if not 1 <= axis_number <= 12:
+                return False, f"Invalid axis number: {axis_number}"
 
-            axis_name = self.AXIS_CONFIG[axis_number][0]
-            logger.info(f"MOCK: Moving {axis_name} to {position} at {speed} µm/s")
-            return True, f"Movement started for axis {axis_number}"
+            return self._move_absolute_locked(axis_number, position, speed)
 
     def move_relative(
         self,
@@ -340,30 +500,116 @@ class MockSurugaSeikiController:
         speed: float
     ) -> Tuple[bool, str]:
         """Move axis relative to current position."""
-        with self._lock:
+        with self._motion_lock:
+            if not self._connected:
+                return False, "Not connected"
+
+            if not 1 <= axis_number <= 12:
+                return False, f"Invalid axis number: {axis_number}"
+
+            target = float(self._positions[axis_number - 1]) + distance
+            return self._move_absolute_locked(axis_number, target, speed)
+
+    def _move_absolute_locked(self, axis_number: int, position: float, speed: float) -> Tuple[bool, str]:
+        """
+        Start a simulated move for an already validated axis.
+
+        The caller holds the motion lock and has checked the connection and axis
+        number, so move_relative does not re-enter the lock through move_absolute.
+
+        Returns:
+            (success, message)
+        """
+        if not self._servos_on[axis_number - 1]:
+            return False, f"Servo not on for axis {axis_number}"
+
+        # Check soft limits
+        axis_name, _, min_pos, max_pos = self._axis_cfg[axis_number - 1]
+        if position < min_pos or position > max_pos:
+            return False, f"Position {position} outside limits [{min_pos}, {max_pos}]"
+
+        # Start simulated movement
+        self._target_positions[axis_number - 1] = position
+        self._speeds[axis_number - 1] = speed
+        self._moving[axis_number - 1] = True
+        self._status_dirty[axis_number - 1] = True
+        self._motion_pending.set()
+
+        logger.info("MOCK: Moving %s to %s at %s µm/s", axis_name, position, speed)
+        return True, f"Movement started for axis {axis_number}"
+
+    def move_absolute_batch(
+        self,
+        axis_numbers: List[int],
+        positions: List[float],
+        speeds: List[float]
+    ) -> Tuple[bool, str]:
+        """
+        Move several axes to absolute positions at once (simulated).
+
+        All axes are validated before any of them starts moving, so either every
+        move is started or none is.
+
+        Args:
+            axis_numbers: Axis numbers (1-12)
+            positions: Target positions, one per axis
+            speeds: Speeds, one per axis
+
+        Returns:
+            (success, message)
+        """
+        if not len(axis_numbers) == len(positions) == len(speeds):
+            return False, "axis_numbers, positions and speeds must have the same length"
+
+        with self._motion_lock:
             if not self._connected:
                 return False, "Not connected"
 
-            target = self._positions[axis_number] + distance
-            return self.move_absolute(axis_number, target, speed)
+            axes = np.asarray(axis_numbers, dtype=np.int64)
+            if axes.size == 0:
+                return True, "No axes to move"
+            if ((axes < 1) | (axes > 12)).any():
+                return False, f"Invalid axis number in {list(axis_numbers)}"
+
+            index = axes - 1
+            if not self._servos_on[index].all():
+                off = (axes[~self._servos_on[index]]).tolist()
+                return False, f"Servo not on for axes {off}"
+
+            # Check soft limits for all axes in one pass
+            targets = np.asarray(positions, dtype=np.float64)
+            outside = (targets < self._min_limits[index]) | (targets > self._max_limits[index])
+            if outside.any():
+                return False, f"Positions outside limits for axes {axes[outside].tolist()}"
+
+            # Start simulated movement
+            self._target_positions[index] = targets
+            self._speeds[index] = np.asarray(speeds, dtype=np.float64)
+            self._moving[index] = True
+            self._status_dirty[index] = True
+            self._motion_pending.set()
+
+            logger.info("MOCK: Batch move started for %s axes", axes.size)
+            return True, f"Movement started for {axes.size} axes"
 
     def stop_axis(self, axis_number: int) -> bool:
         """Stop axis movement."""
-        with self._lock:
+        with self._motion_lock:
             if axis_number < 1 or axis_number > 12:
                 return False
 
-            self._moving[axis_number] = False
-            self._target_positions[axis_number] = None
-            logger.info(f"MOCK: Stopped axis {axis_number}")
+            self._moving[axis_number - 1] = False
+            self._target_positions[axis_number - 1] = np.nan
+            self._status_dirty[axis_number - 1] = True
+            logger.info("MOCK: Stopped axis %s", axis_number)
             return True
 
     def stop_all_axes(self) -> bool:
         """Stop all axis movements."""
-        with self._lock:
-            for axis_num in range(1, 13):
-                self._moving[axis_num] = False
-                self._target_positions[axis_num] = None
+        with self._motion_lock:
+            self._moving[:] = False
+            self._target_positions[:] = np.nan
+            self._status_dirty[:] = True
 
             logger.info("MOCK: Stopped all axes")
             return True
@@ -372,89 +618,123 @@ class MockSurugaSeikiController:
 
     def set_digital_output(self, channel: int, value: bool) -> bool:
         """Set digital output (LOCK/UNLOCK control)."""
-        with self._lock:
+        with self._io_lock:
             if channel not in [1, 2]:
                 return False
 
             self._digital_outputs[channel] = value
             state_str = "LOCKED" if value else "UNLOCKED"
             side = "LEFT" if channel == 1 else "RIGHT"
-            logger.info(f"MOCK: Digital output {channel} ({side}): {state_str}")
+            logger.info("MOCK: Digital output %s (%s): %s", channel, side, state_str)
             return True
 
     def get_digital_output(self, channel: int) -> Optional[bool]:
-        """Get digital output state."""
-        with self._lock:
-            return self._digital_outputs.get(channel)
+        """Get digital output state (single dict read, no lock needed)."""
+        return self._digital_outputs.get(channel)
 
     def get_all_digital_outputs(self) -> Dict[int, bool]:
-        """Get all digital outputs."""
-        with self._lock:
-            return dict(self._digital_outputs)
+        """
+        Get all digital outputs.
+
+        Returns an independent copy rather than a read-only view: the result is
+        handed to orjson, which cannot serialize a mappingproxy. Copying a dict
+        is a single C-level operation under the GIL, so no lock is needed.
+        """
+        return self._digital_outputs.copy()
 
     def get_analog_input(self, channel: int) -> Optional[float]:
         """Get analog input value (simulated)."""
-        with self._lock:
-            # Simulate slight voltage fluctuation
-            base_value = self._analog_inputs.get(channel, 0.5)
-            # Channels 5 and 6 (contact sensors) have more noticeable fluctuation
-            if channel in [5, 6]:
-                noise = random.uniform(-0.05, 0.05)
-            else:
-                noise = random.uniform(-0.02, 0.02)
-            return round(base_value + noise, 4)
+        # Lock-free: racing readers may at worst reuse the same noise sample
+        # Simulate slight voltage fluctuation
+        base_value = self._analog_inputs.get(channel, 0.5)
+        index = self._noise_index
+        self._noise_index = (index + 1) & (_NOISE_BUFFER_SIZE - 1)
+        # Channels 5 and 6 (contact sensors) have more noticeable fluctuation
+        amplitude = 0.05 if channel in (5, 6) else 0.02
+        return round(base_value + amplitude * float(self._noise[index]), 4)
 
     def get_all_analog_inputs(self) -> Dict[int, float]:
         """Get all analog inputs (all 8 channels)."""
-        with self._lock:
-            return {
-                ch: self.get_analog_input(ch) or 0.0
-                for ch in range(1, 9)  # Channels 1-8
-            }
+        with self._io_lock:
+            index = self._noise_index
+            count = len(self._analog_channels)
+            self._noise_index = (index + count) & (_NOISE_BUFFER_SIZE - 1)
+            noise = self._noise[index:index + count]
+            values = np.round(self._analog_base + self._analog_noise_amplitude * noise, 4)
+            return dict(zip(self._analog_channels, values.tolist()))
 
     def get_power(self, channel: int) -> Optional[float]:
         """Get power meter reading (simulated dBm)."""
         # Simulate power meter reading
         # Value depends on whether we're "aligned" (higher power near center positions)
-        with self._lock:
-            # Simple simulation: power is higher when X/Y positions are near 0
-            x_offset = abs(self._positions.get(1, 0)) / 1000.0  # Normalize
-            y_offset = abs(self._positions.get(2, 0)) / 1000.0
-            total_offset = (x_offset + y_offset) / 2.0
-
-            # Power ranges from -40 dBm (far) to -10 dBm (aligned)
-            base_power = -40 + (30 * (1.0 - min(total_offset, 1.0)))
-            noise = random.uniform(-0.5, 0.5)
-            return round(base_power + noise, 2)
+        # Simple simulation: power is higher when X/Y positions are near 0
+        # (read without the lock; X and Y may come from consecutive movement ticks)
+        x_offset = abs(float(self._positions[0])) / 1000.0  # Normalize
+        y_offset = abs(float(self._positions[1])) / 1000.0
+        total_offset = (x_offset + y_offset) / 2.0
+
+        # Power ranges from -40 dBm (far) to -10 dBm (aligned)
+        base_power = -40 + (30 * (1.0 - min(total_offset, 1.0)))
+        # ±0.5 dB jitter from the shared noise ring buffer
+        index = self._noise_index
+        self._noise_index = (index + 1) & (_NOISE_BUFFER_SIZE - 1)
+        noise = 0.5 * float(self._noise[index])
+        return round(base_power + noise, 2)
+
+    def get_snapshot(
+        self, power_channel: Optional[int] = None
+    ) -> Tuple[Dict[int, Dict[str, Any]], Dict[int, bool], Dict[int, float], Optional[float]]:
+        """Get positions (as plain AxisStatus field dicts), IO states and optionally power."""
+        with self._motion_lock:
+            if not self._connected:
+                return {}, {}, {}, None
+            positions = self._axis_states()
+
+        # Axis and I/O state are independent, so each domain is read under its own lock
+        return (
+            positions,
+            self.get_all_digital_outputs(),
+            self.get_all_analog_inputs(),
+            self.get_power(power_channel) if power_channel is not None else None,
+        )
 
     # ========== Complex Operations (Simplified Mocks) ==========
 
     def start_profile_measurement(self, request: ProfileMeasurementRequest) -> str:
         """Start profile measurement (returns task_id for mock)."""
         task_id = f"mock_profile_{int(time.time())}"
-        logger.info(f"MOCK: Started profile measurement, task_id={task_id}")
+        logger.info("MOCK: Started profile measurement, task_id=%s", task_id)
         return task_id
 
     def get_profile_data(self, task_id: str) -> ProfileDataResponse:
-        """Get profile measurement data (simulated)."""
+        """
+        Get profile measurement data (simulated).
+
+        The task_id is ignored, so the synthetic profile is built once and the
+        same (read-only) response is returned on every call.
+        """
+        if self._cached_profile_response is None:
+            self._cached_profile_response = self._build_profile_response()
+        return self._cached_profile_response
+
+    def _build_profile_response(self) -> ProfileDataResponse:
+        """Build the simulated Gaussian profile measurement."""
         # Return simulated Gaussian profile
         num_points = 100
-        positions = [i * 0.2 for i in range(num_points)]
-        signals = [random.gauss(0.5, 0.1) * (1.0 - abs(i - 50) / 50.0) for i in range(num_points)]
-
-        data_points = [
-            ProfileDataPoint(position=p, signal=s)
-            for p, s in zip(positions, signals)
-        ]
+        index = np.arange(num_points)
+        positions = index * 0.2
+        envelope = 1.0 - np.abs(index - 50) / 50.0
+        signals = np.random.normal(0.5, 0.1, num_points) * envelope
 
-        peak_idx = max(range(len(signals)), key=lambda i: signals[i])
+        peak_idx = int(signals.argmax())
 
-        return ProfileDataResponse(
+        return ProfileDataResponse.build(
             success=True,
-            data_points=data_points,
+            positions=positions.tolist(),
+            signals=signals.tolist(),
             total_points=num_points,
-            peak_position=positions[peak_idx],
-            peak_value=signals[peak_idx],
+            peak_position=float(positions[peak_idx]),
+            peak_value=float(signals[peak_idx]),
             peak_index=peak_idx,
             main_axis_number=1,
             main_axis_initial_position=0.0,
@@ -470,10 +750,10 @@ class MockSurugaSeikiController:
         request: AngleAdjustmentRequest
     ) -> AngleAdjustmentResponse:
         """Execute angle adjustment (simplified mock)."""
-        logger.info(f"MOCK: Executing angle adjustment for {stage.name} stage")
+        logger.info("MOCK: Executing angle adjustment for %s stage", stage.name)
         time.sleep(1.0)  # Simulate operation
 
-        return AngleAdjustmentResponse(
+        return AngleAdjustmentResponse.build(
             success=True,
             status_code="Success",
             status_value=1,
@@ -493,42 +773,56 @@ class MockSurugaSeikiController:
         """
         Background thread that simulates gradual position changes during movement.
 
-        Updates positions at 20 Hz to create smooth, realistic motion.
+        Updates positions at 20 Hz to create smooth, realistic motion. This stays a
+        thread (rather than an asyncio task) because the mock mirrors the real
+        controller's synchronous API, which is also called from executor threads
+        (streaming snapshots, reconnects) where no event loop is running.
         """
         logger.info("MOCK: Movement simulation thread started")
+        # Time of the previous motion tick; None after idling, so the first
+        # tick of a new move takes one nominal 50 ms step
+        last_tick: Optional[float] = None
 
         while not self._movement_stop_event.is_set():
+            # Block while no axis is moving (re-checking the stop flag every second)
+            if not self._motion_pending.wait(timeout=1.0):
+                last_tick = None
+                continue
+
+            # If an API call holds the motion lock, skip this tick rather than wait;
+            # the elapsed time carries over into the next tick's dt
+            if not self._motion_lock.acquire(False):
+                self._movement_stop_event.wait(0.05)
+                continue
+
             try:
-                with self._lock:
-                    for axis_num in range(1, 13):
-                        if not self._moving[axis_num]:
-                            continue
-
-                        target = self._target_positions[axis_num]
-                        if target is None:
-                            self._moving[axis_num] = False
-                            continue
-
-                        current = self._positions[axis_num]
-                        speed = self._speeds[axis_num]
-
-                        # Calculate distance to move this iteration (50ms @ speed)
-                        distance = abs(target - current)
-                        step = min(speed * 0.05, distance)  # 50ms update
-
-                        if distance < 0.01:  # Reached target (within 0.01 µm/deg)
-                            self._positions[axis_num] = target
-                            self._moving[axis_num] = False
-                            self._target_positions[axis_num] = None
-                            logger.info(f"MOCK: Axis {axis_num} reached target {target}")
-                        else:
-                            # Move towards target
-                            direction = 1 if target > current else -1
-                            self._positions[axis_num] += direction * step
+                # Integrate over the actual elapsed time so sleep jitter or pauses
+                # do not slow the simulated motion down
+                now = time.monotonic()
+                dt = 0.05 if last_tick is None else now - last_tick
+                last_tick = now
+
+                # The whole tick is one kernel call over the state arrays, keeping
+                # the critical section to a few microseconds
+                moving = self._moving
+                if moving.any():
+                    # Every axis moving at the start of the tick changes state
+                    self._status_dirty |= moving
+                    arrived = _step_axes(self._positions, self._target_positions, self._speeds, moving, dt)
+                    if arrived.any() and logger.isEnabledFor(logging.INFO):
+                        for index in np.flatnonzero(arrived):
+                            logger.info("MOCK: Axis %s reached target %s", index + 1, self._positions[index])
+
+                # Cleared under the motion lock, so a move commanded meanwhile is not lost
+                if not moving.any():
+                    self._motion_pending.clear()
+                    last_tick = None
 
             except Exception as e:
-                logger.error(f"MOCK: Error in movement simulation: {e}")
+                logger.error("MOCK: Error in movement simulation: %s", e)
+            finally:
+                self._motion_lock.release()
 
-            time.sleep(0.05)  # 20 Hz update rate
+            self._movement_stop_event.wait(0.05)  # 20 Hz update rate
 
         logger.info("MOCK: Movement simulation thread stopped")
@@ -1,193 +1,163 @@
 """
 Pydantic models for API requests and responses
+
+These stay Pydantic rather than msgspec Structs: FastAPI derives request
+validation, the OpenAPI schema and response serialization from them.
+High-frequency data (WebSocket position streaming) bypasses the models
+and is sent as plain dicts instead.
+
+Code enums (status, phase and error) precompute everything at import time.
+When filling a response or calling the DLL, use the cached member data:
+int(member) for the numeric code, member.status_name / phase_name /
+error_name / description for the strings, and member.to_dict() for the
+shared payload. Avoid member.value and rebuilding these strings.
 """
-from typing import Optional, List, Tuple
-from enum import Enum
-from pydantic import BaseModel, Field, field_validator
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Annotated, Any, ClassVar, Dict, List, Literal, Mapping, Optional, get_args
+from enum import Enum, IntEnum
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    NonNegativeFloat,
+    NonNegativeInt,
+    PositiveFloat,
+    PositiveInt,
+    computed_field,
+    field_validator,
+)
+from pydantic.dataclasses import dataclass as pydantic_dataclass
+
+
+# Shared field constraints. Per-field descriptions and defaults are layered on
+# top with Field(...) at each use.
+AxisNumber = Annotated[int, Field(ge=1, le=12)]
+OptionalAxisNumber = Annotated[int, Field(ge=0, le=12)]  # 0 means "no axis"
+
+# Linear axes usable as a profile scan axis (X, Y, Z on each stage)
+_ALLOWED_SCAN_AXES = frozenset({1, 2, 3, 7, 8, 9})
+_ALLOWED_SCAN_AXES_SORTED = sorted(_ALLOWED_SCAN_AXES)
 
 
 # ========== Enums ==========
 
-class ProfileErrorCode(Enum):
-    """Profile measurement error codes from manual section 4.7.3.1"""
-    NONE = (0, "Normal")
-    AXIS = (1, "Error due to axis")
-    PROFILING = (2, "Executing profile measurement")
-    PARAMETER = (3, "Inappropriate parameters")
+class _CodeEnum(IntEnum):
+    """
+    Base for code enums whose members are (value, description[, display_name]).
+
+    Subclasses pass ``kind`` ("error", "status" or "phase"), stored as ``_kind``; it
+    names both the display name attribute (``error_name``, ``status_name``,
+    ``phase_name``) and its key in ``to_dict()``. Without a display name the member
+    name is capitalized.
+    """
 
-    def __init__(self, value: int, description: str):
-        self._value_ = value
+    _kind: ClassVar[str]
+    error_name: str
+    status_name: str
+    phase_name: str
+
+    def __init_subclass__(cls, kind: Optional[str] = None, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+        # Set as a class keyword: an assignment in an enum body would become a member
+        if kind is not None:
+            cls._kind = kind
+
+    def __new__(cls, value: int, description: str, display_name: Optional[str] = None):
+        member = int.__new__(cls, value)
+        member._value_ = value
+        return member
+
+    def __init__(self, value: int, description: str, display_name: Optional[str] = None):
+        kind = self._kind
+        display_name = display_name or self.name.capitalize()
         self.description = description
+        setattr(self, f"{kind}_name", display_name)
+        self._dict: Mapping[str, Any] = MappingProxyType({
+            kind: display_name,
+            "value": value,
+            "description": description
+        })
 
-    @property
-    def error_name(self) -> str:
-        """Return the error name as string"""
-        return self.name.capitalize()
+    def to_dict(self) -> Mapping[str, Any]:
+        """Return code info as a read-only mapping shared by every call"""
+        return self._dict
 
-    def to_dict(self) -> dict:
-        """Return error info as dictionary"""
-        return {
-            "error": self.error_name,
-            "value": self.value,
-            "description": self.description
-        }
 
+class _ErrorCodeEnum(_CodeEnum, kind="error"):
+    """Error codes: (value, description), named after the member"""
 
-class ProfileMeasurementStatus(Enum):
-    """Profile measurement status from manual section 4.7.3.2"""
-    STOPPING = (0, "Stopped")
-    SUCCESS = (1, "Normal termination")
+
+class _StatusCodeEnum(_CodeEnum, kind="status"):
+    """Status codes: (value, description, display_name)"""
+
+
+class _PhaseCodeEnum(_CodeEnum, kind="phase"):
+    """Phase codes: (value, description, display_name)"""
+
+
+class ProfileErrorCode(_ErrorCodeEnum):
+    """Profile measurement error codes from manual section 4.7.3.1"""
+    NONE = (0, "Normal")
+    AXIS = (1, "Error due to axis")
     PROFILING = (2, "Executing profile measurement")
-    PROFILE_DATA_OVER = (3, "Exceeded profile data store range")
-    INVALID_PARAMETER = (4, "Invalid profile measurement parameters")
-    SERVOS_NOT_READY = (5, "Servo not in Ready state")
-    SERVOS_ALARM = (6, "Servo alarm")
-    STAGE_ON_LIMIT = (7, "Stage reached at limit sensor")
-    TORQUE_LIMIT = (8, "Stopped by torque limit")
-
-    def __init__(self, value: int, description: str):
-        self._value_ = value
-        self.description = description
+    PARAMETER = (3, "Inappropriate parameters")
 
-    @property
-    def status_name(self) -> str:
-        """Return the status name as string"""
-        name_map = {
-            "STOPPING": "Stopping",
-            "SUCCESS": "Success",
-            "PROFILING": "Profiling",
-            "PROFILE_DATA_OVER": "ProfileDataOver",
-            "INVALID_PARAMETER": "InvalidParameter",
-            "SERVOS_NOT_READY": "ServosNotReady",
-            "SERVOS_ALARM": "ServosAlarm",
-            "STAGE_ON_LIMIT": "StageOnLimit",
-            "TORQUE_LIMIT": "TorqueLimit"
-        }
-        return name_map.get(self.name, self.name)
-
-    def to_dict(self) -> dict:
-        """Return status info as dictionary"""
-        return {
-            "status": self.status_name,
-            "value": self.value,
-            "description": self.description
-        }
-
-
-class AngleAdjustmentStage(Enum):
+
+class ProfileMeasurementStatus(_StatusCodeEnum):
+    """Profile measurement status from manual section 4.7.3.2"""
+    STOPPING = (0, "Stopped", "Stopping")
+    SUCCESS = (1, "Normal termination", "Success")
+    PROFILING = (2, "Executing profile measurement", "Profiling")
+    PROFILE_DATA_OVER = (3, "Exceeded profile data store range", "ProfileDataOver")
+    INVALID_PARAMETER = (4, "Invalid profile measurement parameters", "InvalidParameter")
+    SERVOS_NOT_READY = (5, "Servo not in Ready state", "ServosNotReady")
+    SERVOS_ALARM = (6, "Servo alarm", "ServosAlarm")
+    STAGE_ON_LIMIT = (7, "Stage reached at limit sensor", "StageOnLimit")
+    TORQUE_LIMIT = (8, "Stopped by torque limit", "TorqueLimit")
+
+
+class AngleAdjustmentStage(IntEnum):
     """Stage selection for angle adjustment"""
     LEFT = 1
     RIGHT = 2
 
 
-class AngleAdjustmentErrorCode(Enum):
+class AngleAdjustmentErrorCode(_ErrorCodeEnum):
     """Angle adjustment error codes"""
     NONE = (0, "Normal")
     AXIS = (1, "Error due to axis")
     ADJUSTING = (2, "Executing angle adjustment")
     PARAMETER = (3, "Invalid parameter")
 
-    def __init__(self, value: int, description: str):
-        self._value_ = value
-        self.description = description
-
-    @property
-    def error_name(self) -> str:
-        """Return the error name as string"""
-        return self.name.capitalize()
 
-    def to_dict(self) -> dict:
-        """Return error info as dictionary"""
-        return {
-            "error": self.error_name,
-            "value": self.value,
-            "description": self.description
-        }
-
-
-class AngleAdjustmentStatus(Enum):
+class AngleAdjustmentStatus(_StatusCodeEnum):
     """Angle adjustment status codes"""
-    STOPPING = (0, "Angle adjustment is stopping normally")
-    SUCCESS = (1, "Angle adjustment completed successfully")
-    ADJUSTING = (2, "Executing angle adjustment")
-    PROFILE_DATA_OVER = (3, "Exceeded recording range of profile data")
-    INVALID_PARAMETER = (4, "Invalid parameter")
-    SERVO_IS_NOT_READY = (5, "Using axis is not turned on")
-    SERVO_IS_ALARM = (6, "Servo alarm is occurring for using axis")
-    STAGE_ON_LIMIT = (7, "A position limit of using axis is detected")
-    SIGNAL_LOWER_LIMIT = (8, "Signal reached lower limit")
-    COULD_NOT_CONTACT = (9, "Failed for no contact detection")
-    ADJUST_COUNT_OVER = (10, "Failed for exceeding maximum number of retry count")
-    ANGLE_ADJUST_RANGE_OVER = (11, "Failed for exceeding angle adjustment range")
-    LOST_CONTACT = (12, "Failed for lost contact detection while adjusting")
-
-    def __init__(self, value: int, description: str):
-        self._value_ = value
-        self.description = description
-
-    @property
-    def status_name(self) -> str:
-        """Return the status name as string"""
-        name_map = {
-            "STOPPING": "Stopping",
-            "SUCCESS": "Success",
-            "ADJUSTING": "Adjusting",
-            "PROFILE_DATA_OVER": "ProfileDataOver",
-            "INVALID_PARAMETER": "InvalidParameter",
-            "SERVO_IS_NOT_READY": "ServoIsNotReady",
-            "SERVO_IS_ALARM": "ServoIsAlarm",
-            "STAGE_ON_LIMIT": "StageOnLimit",
-            "SIGNAL_LOWER_LIMIT": "SignalLowerLimit",
-            "COULD_NOT_CONTACT": "CouldNotContact",
-            "ADJUST_COUNT_OVER": "AdjustCountOver",
-            "ANGLE_ADJUST_RANGE_OVER": "AngleAdjustRangeOver",
-            "LOST_CONTACT": "LostContact"
-        }
-        return name_map.get(self.name, self.name)
-
-    def to_dict(self) -> dict:
-        """Return status info as dictionary"""
-        return {
-            "status": self.status_name,
-            "value": self.value,
-            "description": self.description
-        }
-
-
-class AdjustingStatus(Enum):
+    STOPPING = (0, "Angle adjustment is stopping normally", "Stopping")
+    SUCCESS = (1, "Angle adjustment completed successfully", "Success")
+    ADJUSTING = (2, "Executing angle adjustment", "Adjusting")
+    PROFILE_DATA_OVER = (3, "Exceeded recording range of profile data", "ProfileDataOver")
+    INVALID_PARAMETER = (4, "Invalid parameter", "InvalidParameter")
+    SERVO_IS_NOT_READY = (5, "Using axis is not turned on", "ServoIsNotReady")
+    SERVO_IS_ALARM = (6, "Servo alarm is occurring for using axis", "ServoIsAlarm")
+    STAGE_ON_LIMIT = (7, "A position limit of using axis is detected", "StageOnLimit")
+    SIGNAL_LOWER_LIMIT = (8, "Signal reached lower limit", "SignalLowerLimit")
+    COULD_NOT_CONTACT = (9, "Failed for no contact detection", "CouldNotContact")
+    ADJUST_COUNT_OVER = (10, "Failed for exceeding maximum number of retry count", "AdjustCountOver")
+    ANGLE_ADJUST_RANGE_OVER = (11, "Failed for exceeding angle adjustment range", "AngleAdjustRangeOver")
+    LOST_CONTACT = (12, "Failed for lost contact detection while adjusting", "LostContact")
+
+
+class AdjustingStatus(_PhaseCodeEnum):
     """Angle adjustment phase status"""
-    NOT_ADJUSTING = (0, "Not adjusting")
-    INITIALIZING = (1, "Executing initializing process")
-    CONTACTING_Z = (2, "Detecting contact with Z-axis")
-    ADJUSTING_TX = (3, "Adjusting axis specified by angleAxisNumberTx")
-    ADJUSTING_TY = (4, "Adjusting axis specified by angleAxisNumberTy")
-
-    def __init__(self, value: int, description: str):
-        self._value_ = value
-        self.description = description
+    NOT_ADJUSTING = (0, "Not adjusting", "NotAdjusting")
+    INITIALIZING = (1, "Executing initializing process", "Initializing")
+    CONTACTING_Z = (2, "Detecting contact with Z-axis", "ContactingZ")
+    ADJUSTING_TX = (3, "Adjusting axis specified by angleAxisNumberTx", "AdjustingTx")
+    ADJUSTING_TY = (4, "Adjusting axis specified by angleAxisNumberTy", "AdjustingTy")
 
-    @property
-    def phase_name(self) -> str:
-        """Return the phase name as string"""
-        name_map = {
-            "NOT_ADJUSTING": "NotAdjusting",
-            "INITIALIZING": "Initializing",
-            "CONTACTING_Z": "ContactingZ",
-            "ADJUSTING_TX": "AdjustingTx",
-            "ADJUSTING_TY": "AdjustingTy"
-        }
-        return name_map.get(self.name, self.name)
-
-    def to_dict(self) -> dict:
-        """Return phase info as dictionary"""
-        return {
-            "phase": self.phase_name,
-            "value": self.value,
-            "description": self.description
-        }
-
-
-class AlignmentErrorCode(Enum):
+
+class AlignmentErrorCode(_ErrorCodeEnum):
     """Optical alignment error codes"""
     NONE = (0, "Normal")
     AXIS = (1, "Error due to axis")
@@ -195,138 +165,135 @@ class AlignmentErrorCode(Enum):
     PARAMETER = (3, "Invalid parameter")
     INTERRUPTED = (4, "Alignment interrupted")
 
-    def __init__(self, value: int, description: str):
-        self._value_ = value
-        self.description = description
 
-    @property
-    def error_name(self) -> str:
-        """Return the error name as string"""
-        return self.name.capitalize()
+class OpticalAlignmentStatus(_StatusCodeEnum):
+    """Optical alignment status codes"""
+    STOPPING = (0, "Alignment is stopping normally", "Stopping")
+    SUCCESS = (1, "Alignment completed successfully", "Success")
+    ALIGNING = (2, "Executing alignment", "Aligning")
+    FIELD_SEARCH_RANGE_OVER = (3, "Failed for exceeding field search range", "FieldSearchRangeOver")
+    PROFILE_DATA_OVER = (4, "Exceed recording range of profile data", "ProfileDataOver")
+    PEAK_SEARCH_COUNT_OVER = (5, "Failed for exceeding maximum number of peak search count", "PeakSearchCountOver")
+    PEAK_SEARCH_RANGE_OVER = (6, "Failed for exceeding peak search range", "PeakSearchRangeOver")
+    INVALID_PARAMETER = (7, "Invalid parameter", "InvalidParameter")
+    SERVO_IS_NOT_READY = (8, "Using axis is not turned on", "ServoIsNotReady")
+    SERVO_IS_ALARM = (9, "Servo alarm is occurring for using axis", "ServoIsAlarm")
+    STAGE_ON_LIMIT = (10, "A position limit of using axis is detected", "StageOnLimit")
+    VOLTAGE_LIMIT = (11, "Signal voltage reached at maximum limit", "VoltageLimit")
+    PM_RANGE_LIMIT = (12, "Could not range up due to PM range limit", "PMRangeLimit")
+    PM_INIT_RANGE_CHANGE_FAIL = (13, "Power meter initial range setting failed", "PMInitRangeChangeFail")
+    PM_DISCONNECTED = (14, "Power meter is not connected", "PMDisconnected")
+    ROTATION_ADJUSTMENT_FAIL = (15, "Failed for rotation adjustment", "RotationAdjustmentFail")
+    IN_POSITION_FAIL = (16, "Not reached to in-position state", "InPositionFail")
+    TORQUE_LIMIT = (17, "Stopped by torque limit", "TorqueLimit")
+    INTERRUPTED = (18, "Alignment interrupted", "Interrupted")
+
+
+class AligningStatusPhase(_PhaseCodeEnum):
+    """Optical alignment phase status"""
+    NOT_ALIGNING = (0, "Not aligning", "NotAligning")
+    INITIALIZING = (1, "Executing initializing process", "Initializing")
+    FIELD_SEARCHING = (2, "Field searching", "FieldSearching")
+    PEAK_SEARCHING_X = (3, "X-axis peak searching", "PeakSearchingX")
+    PEAK_SEARCHING_Y = (4, "Y-axis peak searching", "PeakSearchingY")
+    PEAK_SEARCHING_Z = (5, "Z-axis peak searching", "PeakSearchingZ")
+    PEAK_SEARCH_X_CH2 = (6, "Ch2 X-axis peak searching", "PeakSearchXCh2")
+
+
+# ========== Result Code Literals ==========
+# Code strings the controller can place in response status/phase/error fields:
+# the enum display names plus the outcomes it reports on its own.
+
+ProfileStatusCode = Literal[
+    "Stopping", "Success", "Profiling", "ProfileDataOver", "InvalidParameter",
+    "ServosNotReady", "ServosAlarm", "StageOnLimit", "TorqueLimit",
+    "Cancelled", "Timeout",
+]
+ProfileErrorName = Literal["None", "Axis", "Profiling", "Parameter"]
+AlignmentStatusCode = Literal[
+    "Stopping", "Success", "Aligning", "FieldSearchRangeOver", "ProfileDataOver",
+    "PeakSearchCountOver", "PeakSearchRangeOver", "InvalidParameter", "ServoIsNotReady",
+    "ServoIsAlarm", "StageOnLimit", "VoltageLimit", "PMRangeLimit", "PMInitRangeChangeFail",
+    "PMDisconnected", "RotationAdjustmentFail", "InPositionFail", "TorqueLimit", "Interrupted",
+]
+AlignmentPhaseCode = Literal[
+    "NotAligning", "Initializing", "FieldSearching", "PeakSearchingX", "PeakSearchingY",
+    "PeakSearchingZ", "PeakSearchXCh2",
+]
+AngleAdjustmentStatusCode = Literal[
+    "Stopping", "Success", "Adjusting", "ProfileDataOver", "InvalidParameter",
+    "ServoIsNotReady", "ServoIsAlarm", "StageOnLimit", "SignalLowerLimit", "CouldNotContact",
+    "AdjustCountOver", "AngleAdjustRangeOver", "LostContact",
+    "Cancelled", "Timeout", "Error",
+]
+AngleAdjustmentPhaseCode = Literal[
+    "NotAdjusting", "Initializing", "ContactingZ", "AdjustingTx", "AdjustingTy",
+]
+
+# Keep the literals in step with the enum display names
+assert get_args(ProfileStatusCode)[:-2] == tuple(m.status_name for m in ProfileMeasurementStatus)
+assert get_args(ProfileErrorName) == tuple(m.error_name for m in ProfileErrorCode)
+assert get_args(AlignmentStatusCode) == tuple(m.status_name for m in OpticalAlignmentStatus)
+assert get_args(AlignmentPhaseCode) == tuple(m.phase_name for m in AligningStatusPhase)
+assert get_args(AngleAdjustmentStatusCode)[:-3] == tuple(m.status_name for m in AngleAdjustmentStatus)
+assert get_args(AngleAdjustmentPhaseCode) == tuple(m.phase_name for m in AdjustingStatus)
+
+
+# ========== Base Models ==========
+
+class ApiModel(BaseModel):
+    """
+    Base for all request and response models.
 
-    def to_dict(self) -> dict:
-        """Return error info as dictionary"""
-        return {
-            "error": self.error_name,
-            "value": self.value,
-            "description": self.description
-        }
+    Models are immutable snapshots, and unknown fields are rejected instead
+    of being silently ignored.
+    """
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
 
-class OpticalAlignmentStatus(Enum):
-    """Optical alignment status codes"""
-    STOPPING = (0, "Alignment is stopping normally")
-    SUCCESS = (1, "Alignment completed successfully")
-    ALIGNING = (2, "Executing alignment")
-    FIELD_SEARCH_RANGE_OVER = (3, "Failed for exceeding field search range")
-    PROFILE_DATA_OVER = (4, "Exceed recording range of profile data")
-    PEAK_SEARCH_COUNT_OVER = (5, "Failed for exceeding maximum number of peak search count")
-    PEAK_SEARCH_RANGE_OVER = (6, "Failed for exceeding peak search range")
-    INVALID_PARAMETER = (7, "Invalid parameter")
-    SERVO_IS_NOT_READY = (8, "Using axis is not turned on")
-    SERVO_IS_ALARM = (9, "Servo alarm is occurring for using axis")
-    STAGE_ON_LIMIT = (10, "A position limit of using axis is detected")
-    VOLTAGE_LIMIT = (11, "Signal voltage reached at maximum limit")
-    PM_RANGE_LIMIT = (12, "Could not range up due to PM range limit")
-    PM_INIT_RANGE_CHANGE_FAIL = (13, "Power meter initial range setting failed")
-    PM_DISCONNECTED = (14, "Power meter is not connected")
-    ROTATION_ADJUSTMENT_FAIL = (15, "Failed for rotation adjustment")
-    IN_POSITION_FAIL = (16, "Not reached to in-position state")
-    TORQUE_LIMIT = (17, "Stopped by torque limit")
-    INTERRUPTED = (18, "Alignment interrupted")
-
-    def __init__(self, value: int, description: str):
-        self._value_ = value
-        self.description = description
+class ServerResponseModel(ApiModel):
+    """
+    Base for response models populated only from server-produced values.
 
-    @property
-    def status_name(self) -> str:
-        """Return the status name as string"""
-        name_map = {
-            "STOPPING": "Stopping",
-            "SUCCESS": "Success",
-            "ALIGNING": "Aligning",
-            "FIELD_SEARCH_RANGE_OVER": "FieldSearchRangeOver",
-            "PROFILE_DATA_OVER": "ProfileDataOver",
-            "PEAK_SEARCH_COUNT_OVER": "PeakSearchCountOver",
-            "PEAK_SEARCH_RANGE_OVER": "PeakSearchRangeOver",
-            "INVALID_PARAMETER": "InvalidParameter",
-            "SERVO_IS_NOT_READY": "ServoIsNotReady",
-            "SERVO_IS_ALARM": "ServoIsAlarm",
-            "STAGE_ON_LIMIT": "StageOnLimit",
-            "VOLTAGE_LIMIT": "VoltageLimit",
-            "PM_RANGE_LIMIT": "PMRangeLimit",
-            "PM_INIT_RANGE_CHANGE_FAIL": "PMInitRangeChangeFail",
-            "PM_DISCONNECTED": "PMDisconnected",
-            "ROTATION_ADJUSTMENT_FAIL": "RotationAdjustmentFail",
-            "IN_POSITION_FAIL": "InPositionFail",
-            "TORQUE_LIMIT": "TorqueLimit",
-            "INTERRUPTED": "Interrupted"
-        }
-        return name_map.get(self.name, self.name)
-
-    def to_dict(self) -> dict:
-        """Return status info as dictionary"""
-        return {
-            "status": self.status_name,
-            "value": self.value,
-            "description": self.description
-        }
-
-
-class AligningStatusPhase(Enum):
-    """Optical alignment phase status"""
-    NOT_ALIGNING = (0, "Not aligning")
-    INITIALIZING = (1, "Executing initializing process")
-    FIELD_SEARCHING = (2, "Field searching")
-    PEAK_SEARCHING_X = (3, "X-axis peak searching")
-    PEAK_SEARCHING_Y = (4, "Y-axis peak searching")
-    PEAK_SEARCHING_Z = (5, "Z-axis peak searching")
-    PEAK_SEARCH_X_CH2 = (6, "Ch2 X-axis peak searching")
-
-    def __init__(self, value: int, description: str):
-        self._value_ = value
-        self.description = description
+    Use build() rather than the constructor: the values come straight from
+    the controller, so re-running Pydantic validation on them is wasted work
+    (notably for profiles carrying thousands of data points).
+    """
 
-    @property
-    def phase_name(self) -> str:
-        """Return the phase name as string"""
-        name_map = {
-            "NOT_ALIGNING": "NotAligning",
-            "INITIALIZING": "Initializing",
-            "FIELD_SEARCHING": "FieldSearching",
-            "PEAK_SEARCHING_X": "PeakSearchingX",
-            "PEAK_SEARCHING_Y": "PeakSearchingY",
-            "PEAK_SEARCHING_Z": "PeakSearchingZ",
-            "PEAK_SEARCH_X_CH2": "PeakSearchXCh2"
-        }
-        return name_map.get(self.name, self.name)
-
-    def to_dict(self) -> dict:
-        """Return phase info as dictionary"""
-        return {
-            "phase": self.phase_name,
-            "value": self.value,
-            "description": self.description
-        }
+    @classmethod
+    def build(cls, **data):
+        """
+        Construct without validation; unset fields get their defaults.
+
+        Raises:
+            TypeError: If a keyword is not a field of the model
+        """
+        unknown = data.keys() - cls.model_fields.keys()
+        if unknown:
+            raise TypeError(f"{cls.__name__}.build() got unknown fields: {', '.join(sorted(unknown))}")
+        return cls.model_construct(**data)
 
 
 # ========== Connection Models ==========
+# Small per-poll responses are slotted Pydantic dataclasses rather than models:
+# cheaper to build and hold, but still validated when constructed.
 
-class ConnectionRequest(BaseModel):
+class ConnectionRequest(ApiModel):
     ads_address: str = Field(
         default="5.146.68.190.1.1",
         description="ADS address of probe station (format: x.x.x.x.x.x)"
     )
 
 
-class ConnectionResponse(BaseModel):
+@pydantic_dataclass(frozen=True, slots=True, kw_only=True)
+class ConnectionResponse:
     success: bool
     message: str
     connected: bool
 
 
-class SystemStatus(BaseModel):
+@pydantic_dataclass(frozen=True, slots=True, kw_only=True)
+class SystemStatus:
     """Complete system status information"""
     is_connected: bool
     dll_version: Optional[str] = None
@@ -339,117 +306,131 @@ class SystemStatus(BaseModel):
 
 # ========== Axis Models ==========
 
-class AxisStatus(BaseModel):
+@pydantic_dataclass(frozen=True, slots=True, kw_only=True)
+class AxisStatus:
     """Status and position information for a single axis"""
-    axis_number: int = Field(ge=1, le=12, description="Axis number (1-12)")
-    actual_position: float = Field(description="Current actual position in micrometers or degrees")
-    is_moving: bool = Field(description="True if axis is currently moving")
-    is_servo_on: bool = Field(description="True if servo is enabled")
-    is_error: bool = Field(default=False, description="True if axis has an error")
-    error_code: int = Field(default=0, description="Error code if is_error is True")
+    axis_number: Annotated[AxisNumber, Field(description="Axis number (1-12)")]
+    actual_position: Annotated[float, Field(description="Current actual position in micrometers or degrees")]
+    is_moving: Annotated[bool, Field(description="True if axis is currently moving")]
+    is_servo_on: Annotated[bool, Field(description="True if servo is enabled")]
+    is_error: Annotated[bool, Field(description="True if axis has an error")] = False
+    error_code: Annotated[int, Field(description="Error code if is_error is True")] = 0
 
 
 # ========== Servo Models ==========
 
-class ServoRequest(BaseModel):
-    axis_id: int = Field(ge=1, le=12, description="Axis number (1-12)")
+class ServoRequest(ApiModel):
+    axis_id: AxisNumber = Field(description="Axis number (1-12)")
 
 
 # ========== Motion Models ==========
 
-class MoveAbsoluteRequest(BaseModel):
-    axis_id: int = Field(..., ge=1, le=12, example=7, description="The axis number (1-indexed)")
-    position: float = Field(..., example=1500.5, description="Target position in µm or degrees")
-    speed: float = Field(default=1000.0, gt=0, description="Movement speed in µm/s or deg/s")
+class MoveAbsoluteRequest(ApiModel):
+    axis_id: AxisNumber = Field(examples=[7], description="The axis number (1-indexed)")
+    position: float = Field(examples=[1500.5], description="Target position in µm or degrees")
+    speed: PositiveFloat = Field(default=1000.0, description="Movement speed in µm/s or deg/s")
 
 
-class MoveRelativeRequest(BaseModel):
-    axis_id: int = Field(..., ge=1, le=12, example=7, description="The axis number (1-indexed)")
-    distance: float = Field(..., example=500.0, description="Relative distance in µm or degrees")
-    speed: float = Field(default=1000.0, gt=0, description="Movement speed in µm/s or deg/s")
+class MoveRelativeRequest(ApiModel):
+    axis_id: AxisNumber = Field(examples=[7], description="The axis number (1-indexed)")
+    distance: float = Field(examples=[500.0], description="Relative distance in µm or degrees")
+    speed: PositiveFloat = Field(default=1000.0, description="Movement speed in µm/s or deg/s")
 
 
-class Move2DRequest(BaseModel):
-    axis1: int = Field(ge=1, le=12, description="First axis number")
-    axis2: int = Field(ge=1, le=12, description="Second axis number")
+class Move2DRequest(ApiModel):
+    axis1: AxisNumber = Field(description="First axis number")
+    axis2: AxisNumber = Field(description="Second axis number")
     x: float = Field(description="X position in µm")
     y: float = Field(description="Y position in µm")
-    speed: float = Field(default=1000.0, gt=0, description="Movement speed in µm/s")
+    speed: PositiveFloat = Field(default=1000.0, description="Movement speed in µm/s")
     angle_offset: float = Field(default=0.0, ge=-180, le=180, description="Rotation angle offset in degrees")
     relative: bool = Field(default=False, description="True for relative move, False for absolute")
 
 
-class Move3DRequest(BaseModel):
-    axis1: int = Field(ge=1, le=12, description="First axis number (X)")
-    axis2: int = Field(ge=1, le=12, description="Second axis number (Y)")
-    axis3: int = Field(ge=1, le=12, description="Third axis number (Z)")
+class Move3DRequest(ApiModel):
+    axis1: AxisNumber = Field(description="First axis number (X)")
+    axis2: AxisNumber = Field(description="Second axis number (Y)")
+    axis3: AxisNumber = Field(description="Third axis number (Z)")
     x: float = Field(description="X position in µm")
     y: float = Field(description="Y position in µm")
     z: float = Field(description="Z position in µm")
-    speed: float = Field(default=1000.0, gt=0, description="Movement speed in µm/s")
+    speed: PositiveFloat = Field(default=1000.0, description="Movement speed in µm/s")
     rotation_center_x: float = Field(default=0.0, description="Rotation center X offset in µm")
     rotation_center_y: float = Field(default=0.0, description="Rotation center Y offset in µm")
 
 
 # ========== Alignment Models ==========
 
-class FlatAlignmentRequest(BaseModel):
+class _CommonAlignmentRequest(ApiModel):
     """
-    Flat alignment parameters based on FlatParameter structure from manual.
-    Used for 2D flat surface alignment with detailed control over search parameters.
+    Parameters shared verbatim by FlatParameter and FocusParameter.
 
-    All ~30 parameters required by the Alignment.FlatParameter API.
+    Search, pitch, speed, smoothing, centroid and convergence fields are
+    declared on the subclasses because their defaults (and for some, their
+    types) differ between flat and focus alignment.
     """
     # Stage configuration
-    mainStageNumberX: int = Field(7, ge=1, le=12, description="Main X-axis stage number")
-    mainStageNumberY: int = Field(8, ge=1, le=12, description="Main Y-axis stage number")
-    subStageNumberXY: int = Field(0, ge=0, le=12, description="Sub-stage number, 0 for None")
+    mainStageNumberX: AxisNumber = Field(7, description="Main X-axis stage number")
+    mainStageNumberY: AxisNumber = Field(8, description="Main Y-axis stage number")
+    subStageNumberXY: OptionalAxisNumber = Field(0, description="Sub-stage number, 0 for None")
     subAngleX: float = Field(0.0, description="Sub-stage X angle in degrees")
     subAngleY: float = Field(0.0, description="Sub-stage Y angle in degrees")
 
     # Power meter configuration
     pmCh: int = Field(1, ge=1, description="Power meter channel number")
     analogCh: int = Field(1, ge=1, description="Analog input channel number")
-    wavelength: int = Field(1310, gt=0, description="Measurement wavelength in nm (e.g., 1310, 1550)")
+    wavelength: PositiveInt = Field(1310, description="Measurement wavelength in nm (e.g., 1310, 1550)")
     pmAutoRangeUpOn: bool = Field(True, description="Enable power meter auto-range up")
     pmInitRangeSettingOn: bool = Field(True, description="Enable initial range setting")
     pmInitRange: int = Field(-30, description="Initial power meter range in dBm")
 
+    # Field search parameters
+    fieldSearchFirstPitchX: NonNegativeFloat = Field(0.0, description="First X-axis field search pitch in µm")
+
+    # Convergence parameters
+    comparisonCount: int = Field(2, ge=1, description="Comparison count for convergence")
+    maxRepeatCount: int = Field(10, ge=1, le=99, description="Maximum repeat count for alignment")
+
+
+class FlatAlignmentRequest(_CommonAlignmentRequest):
+    """
+    Flat alignment parameters based on FlatParameter structure from manual.
+    Used for 2D flat surface alignment with detailed control over search parameters.
+
+    All ~30 parameters required by the Alignment.FlatParameter API.
+    """
     # Search thresholds
-    fieldSearchThreshold: float = Field(0.0, ge=0, description="Field search threshold")
+    fieldSearchThreshold: NonNegativeFloat = Field(0.0, description="Field search threshold")
     peakSearchThreshold: float = Field(10.0, ge=0, le=99.99, description="Peak search threshold in %")
 
     # Search ranges
-    searchRangeX: float = Field(15.0, gt=0, description="X-axis search range in µm")
-    searchRangeY: float = Field(10.0, gt=0, description="Y-axis search range in µm")
+    searchRangeX: PositiveFloat = Field(15.0, description="X-axis search range in µm")
+    searchRangeY: PositiveFloat = Field(10.0, description="Y-axis search range in µm")
 
     # Field search parameters
-    fieldSearchPitchX: float = Field(1.0, gt=0, description="X-axis field search pitch in µm")
-    fieldSearchPitchY: float = Field(1.0, gt=0, description="Y-axis field search pitch in µm")
-    fieldSearchFirstPitchX: float = Field(0.0, ge=0, description="First X-axis field search pitch in µm")
-    fieldSearchSpeedX: float = Field(100.0, gt=0, description="X-axis field search speed in µm/s")
-    fieldSearchSpeedY: float = Field(100.0, gt=0, description="Y-axis field search speed in µm/s")
+    fieldSearchPitchX: PositiveFloat = Field(1.0, description="X-axis field search pitch in µm")
+    fieldSearchPitchY: PositiveFloat = Field(1.0, description="Y-axis field search pitch in µm")
+    fieldSearchSpeedX: PositiveFloat = Field(100.0, description="X-axis field search speed in µm/s")
+    fieldSearchSpeedY: PositiveFloat = Field(100.0, description="Y-axis field search speed in µm/s")
 
     # Peak search parameters
-    peakSearchSpeedX: float = Field(10.0, gt=0, description="X-axis peak search speed in µm/s")
-    peakSearchSpeedY: float = Field(10.0, gt=0, description="Y-axis peak search speed in µm/s")
+    peakSearchSpeedX: PositiveFloat = Field(10.0, description="X-axis peak search speed in µm/s")
+    peakSearchSpeedY: PositiveFloat = Field(10.0, description="Y-axis peak search speed in µm/s")
 
     # Smoothing parameters
-    smoothingRangeX: int = Field(40, ge=0, description="X-axis smoothing range in samples")
-    smoothingRangeY: int = Field(40, ge=0, description="Y-axis smoothing range in samples")
+    smoothingRangeX: NonNegativeInt = Field(40, description="X-axis smoothing range in samples")
+    smoothingRangeY: NonNegativeInt = Field(40, description="Y-axis smoothing range in samples")
 
     # Centroid parameters
-    centroidThresholdX: float = Field(0, ge=0, description="X-axis centroid threshold")
-    centroidThresholdY: float = Field(0, ge=0, description="Y-axis centroid threshold")
+    centroidThresholdX: NonNegativeFloat = Field(0.0, description="X-axis centroid threshold")
+    centroidThresholdY: NonNegativeFloat = Field(0.0, description="Y-axis centroid threshold")
 
     # Convergence parameters
     convergentRangeX: float = Field(0.5, le=1, description="X-axis convergence range")
-    convergentRangeY: float = Field(0.5, e=1, description="Y-axis convergence range")
-    comparisonCount: int = Field(2, ge=1, description="Comparison count for convergence")
-    maxRepeatCount: int = Field(10, ge=1, le=99, description="Maximum repeat count for alignment")
+    convergentRangeY: float = Field(0.5, le=1, description="Y-axis convergence range")
 
 
-class FocusAlignmentRequest(BaseModel):
+class FocusAlignmentRequest(_CommonAlignmentRequest):
     """
     Focus alignment parameters based on FocusParameter structure from manual.
     Similar to Flat but includes Z-axis focus optimization with zMode.
@@ -457,67 +438,53 @@ class FocusAlignmentRequest(BaseModel):
     All ~31 parameters required by the Alignment.FocusParameter API.
     """
     # Z-mode configuration
-    zMode: str = Field("Round", description="Z-axis mode: Round, Triangle, or Linear")
-
-    # Stage configuration
-    mainStageNumberX: int = Field(7, ge=1, le=12, description="Main X-axis stage number")
-    mainStageNumberY: int = Field(8, ge=1, le=12, description="Main Y-axis stage number")
-    subStageNumberXY: int = Field(0, ge=0, le=12, description="Sub-stage number, 0 for None")
-    subAngleX: float = Field(0.0, description="Sub-stage X angle in degrees")
-    subAngleY: float = Field(0.0, description="Sub-stage Y angle in degrees")
-
-    # Power meter configuration
-    pmCh: int = Field(1, ge=1, description="Power meter channel number")
-    analogCh: int = Field(1, ge=1, description="Analog input channel number")
-    wavelength: int = Field(1310, gt=0, description="Measurement wavelength in nm (e.g., 1310, 1550)")
-    pmAutoRangeUpOn: bool = Field(True, description="Enable power meter auto-range up")
-    pmInitRangeSettingOn: bool = Field(True, description="Enable initial range setting")
-    pmInitRange: int = Field(-30, description="Initial power meter range in dBm")
+    zMode: Literal["Round", "Triangle", "Linear"] = Field("Round", description="Z-axis mode: Round, Triangle, or Linear")
 
     # Search thresholds
-    fieldSearchThreshold: float = Field(0.1, ge=0, description="Field search threshold")
+    fieldSearchThreshold: NonNegativeFloat = Field(0.1, description="Field search threshold")
     peakSearchThreshold: float = Field(40.0, ge=0, le=99.99, description="Peak search threshold in %")
 
     # Search ranges
-    searchRangeX: float = Field(500.0, gt=0, description="X-axis search range in µm")
-    searchRangeY: float = Field(500.0, gt=0, description="Y-axis search range in µm")
+    searchRangeX: PositiveFloat = Field(500.0, description="X-axis search range in µm")
+    searchRangeY: PositiveFloat = Field(500.0, description="Y-axis search range in µm")
 
     # Field search parameters
-    fieldSearchPitchX: float = Field(5.0, gt=0, description="X-axis field search pitch in µm")
-    fieldSearchPitchY: float = Field(5.0, gt=0, description="Y-axis field search pitch in µm")
-    fieldSearchFirstPitchX: float = Field(0.0, ge=0, description="First X-axis field search pitch in µm")
-    fieldSearchSpeedX: float = Field(1000.0, gt=0, description="X-axis field search speed in µm/s")
-    fieldSearchSpeedY: float = Field(1000.0, gt=0, description="Y-axis field search speed in µm/s")
+    fieldSearchPitchX: PositiveFloat = Field(5.0, description="X-axis field search pitch in µm")
+    fieldSearchPitchY: PositiveFloat = Field(5.0, description="Y-axis field search pitch in µm")
+    fieldSearchSpeedX: PositiveFloat = Field(1000.0, description="X-axis field search speed in µm/s")
+    fieldSearchSpeedY: PositiveFloat = Field(1000.0, description="Y-axis field search speed in µm/s")
 
     # Peak search parameters
-    peakSearchSpeedX: float = Field(5.0, gt=0, description="X-axis peak search speed in µm/s")
-    peakSearchSpeedY: float = Field(5.0, gt=0, description="Y-axis peak search speed in µm/s")
+    peakSearchSpeedX: PositiveFloat = Field(5.0, description="X-axis peak search speed in µm/s")
+    peakSearchSpeedY: PositiveFloat = Field(5.0, description="Y-axis peak search speed in µm/s")
 
     # Smoothing parameters
-    smoothingRangeX: int = Field(50, ge=0, description="X-axis smoothing range in samples")
-    smoothingRangeY: int = Field(50, ge=0, description="Y-axis smoothing range in samples")
+    smoothingRangeX: NonNegativeInt = Field(50, description="X-axis smoothing range in samples")
+    smoothingRangeY: NonNegativeInt = Field(50, description="Y-axis smoothing range in samples")
 
     # Centroid parameters
-    centroidThresholdX: int = Field(0, ge=0, description="X-axis centroid threshold")
-    centroidThresholdY: int = Field(0, ge=0, description="Y-axis centroid threshold")
+    centroidThresholdX: NonNegativeInt = Field(0, description="X-axis centroid threshold")
+    centroidThresholdY: NonNegativeInt = Field(0, description="Y-axis centroid threshold")
 
     # Convergence parameters
     convergentRangeX: int = Field(1, ge=1, description="X-axis convergence range")
     convergentRangeY: int = Field(1, ge=1, description="Y-axis convergence range")
-    comparisonCount: int = Field(2, ge=1, description="Comparison count for convergence")
-    maxRepeatCount: int = Field(10, ge=1, le=99, description="Maximum repeat count for alignment")
 
 
-class SingleAlignmentRequest(BaseModel):
+class SingleAlignmentRequest(ApiModel):
     """Single axis alignment parameters"""
-    stage_number: int = Field(1, ge=1, le=12, description="Axis stage number")
+    stage_number: AxisNumber = Field(1, description="Axis stage number")
     analog_ch: int = Field(1, ge=1, description="Analog input channel number")
-    search_range: float = Field(1000.0, gt=0, description="Search range in µm")
-    search_speed: float = Field(100.0, gt=0, description="Search speed in µm/s")
-    sampling_interval: float = Field(10.0, gt=0, description="Sampling interval in µm")
+    search_range: PositiveFloat = Field(1000.0, description="Search range in µm")
+    search_speed: PositiveFloat = Field(100.0, description="Search speed in µm/s")
+    sampling_interval: PositiveFloat = Field(10.0, description="Sampling interval in µm")
 
 
-class ProfileDataPoint(BaseModel):
+# A slotted dataclass rather than a model: profiles hold thousands of these and
+# they are only ever built from controller data. Pydantic still serializes them
+# as {"position": ..., "signal": ...} objects.
+@dataclass(frozen=True, slots=True)
+class ProfileDataPoint:
     """
     Single data point in a profile measurement.
     
@@ -525,11 +492,20 @@ class ProfileDataPoint(BaseModel):
     For multi-axis (X,Y) profile data, use Optical Alignment API which
     provides separate profiles for FieldSearch, PeakSearchX, and PeakSearchY.
     """
-    position: float = Field(description="Main axis position in µm")
-    signal: float = Field(description="Signal value (voltage, power, etc.)")
+    position: Annotated[float, Field(description="Main axis position in µm")]
+    signal: Annotated[float, Field(description="Signal value (voltage, power, etc.)")]
+
 
+# Alignment and angle adjustment profiles are kept column-wise, the way the
+# controller hands packets back, instead of one ProfileDataPoint per sample.
+@dataclass(frozen=True, slots=True)
+class ProfileArrays:
+    """Profile samples as parallel position/signal arrays."""
+    positions: Annotated[List[float], Field(description="Main axis position of each sample in µm")]
+    signals: Annotated[List[float], Field(description="Signal value of each sample, parallel to positions")]
 
-class AlignmentResponse(BaseModel):
+
+class AlignmentResponse(ServerResponseModel):
     """
     Response from optical alignment execution (flat or focus).
     Following the pattern from AngleAdjustmentResponse and ProfileDataResponse.
@@ -538,12 +514,12 @@ class AlignmentResponse(BaseModel):
     success: bool = Field(description="True if alignment completed successfully")
 
     # Status information (always populated)
-    status_code: Optional[str] = Field(default=None, description="Final status code from OpticalAlignmentStatus")
+    status_code: Optional[AlignmentStatusCode] = Field(default=None, description="Final status code from OpticalAlignmentStatus")
     status_value: Optional[int] = Field(default=None, description="Final status numeric value")
     status_description: Optional[str] = Field(default=None, description="Final status description")
 
     # Phase information (populated when available)
-    phase_code: Optional[str] = Field(default=None, description="Last phase code from AligningStatusPhase")
+    phase_code: Optional[AlignmentPhaseCode] = Field(default=None, description="Last phase code from AligningStatusPhase")
     phase_value: Optional[int] = Field(default=None, description="Last phase numeric value")
     phase_description: Optional[str] = Field(default=None, description="Last phase description")
 
@@ -562,21 +538,21 @@ class AlignmentResponse(BaseModel):
 
     # Profile data retrieved from controller (populated on success)
     # Each profile contains data from different phases: field search, peak search X/Y/Z
-    field_search_profile: Optional[List[ProfileDataPoint]] = Field(
+    field_search_profile: Optional[ProfileArrays] = Field(
         default=None,
-        description="Field search profile data points"
+        description="Field search profile samples"
     )
-    peak_search_x_profile: Optional[List[ProfileDataPoint]] = Field(
+    peak_search_x_profile: Optional[ProfileArrays] = Field(
         default=None,
-        description="X-axis peak search profile data points"
+        description="X-axis peak search profile samples"
     )
-    peak_search_y_profile: Optional[List[ProfileDataPoint]] = Field(
+    peak_search_y_profile: Optional[ProfileArrays] = Field(
         default=None,
-        description="Y-axis peak search profile data points"
+        description="Y-axis peak search profile samples"
     )
-    peak_search_z_profile: Optional[List[ProfileDataPoint]] = Field(
+    peak_search_z_profile: Optional[ProfileArrays] = Field(
         default=None,
-        description="Z-axis peak search profile data points (focus mode only)"
+        description="Z-axis peak search profile samples (focus mode only)"
     )
 
     # Error information (populated when success=False)
@@ -585,41 +561,46 @@ class AlignmentResponse(BaseModel):
 
 # ========== Profile Models ==========
 
-class ProfileParameterModel(BaseModel):
+class ProfileParameterModel(ApiModel):
     """
     Profile measurement parameter based on ProfileParameter structure from manual.
     Used to configure profile measurement with the Profile Class API.
     """
-    main_axis_number: int = Field(ge=1, le=12, description="Main axis number")
-    sub1_axis_number: int = Field(default=0, ge=0, le=12, description="Sub-axis1 number, 0: None")
-    sub2_axis_number: int = Field(default=0, ge=0, le=12, description="Sub-axis2 number, 0: None")
+    main_axis_number: AxisNumber = Field(description="Main axis number")
+    sub1_axis_number: OptionalAxisNumber = Field(default=0, description="Sub-axis1 number, 0: None")
+    sub2_axis_number: OptionalAxisNumber = Field(default=0, description="Sub-axis2 number, 0: None")
     signal_ch1_number: int = Field(ge=1, description="Ch1 signal axis number (analog channel)")
-    signal_ch2_number: int = Field(default=0, ge=0, description="Ch2 signal axis number, 0: None")
-    main_range: float = Field(gt=0, description="Main axis profile measurement range [µm or deg]")
-    sub1_range: float = Field(default=0.0, ge=0, description="Sub-axis1 profile measurement range [µm or deg]")
-    sub2_range: float = Field(default=0.0, ge=0, description="Sub-axis2 profile measurement range [µm or deg]")
-    speed: float = Field(gt=0, description="Axis speed [µm/s or deg/s]")
-    accel_rate: float = Field(gt=0, description="Axis acceleration [µm/s² or deg/s²]")
-    decel_rate: float = Field(gt=0, description="Axis deceleration [µm/s² or deg/s²]")
-    smoothing: int = Field(default=0, ge=0, description="Smoothing range [samples]")
-
-
-class ProfileStatus(BaseModel):
+    signal_ch2_number: NonNegativeInt = Field(default=0, description="Ch2 signal axis number, 0: None")
+    main_range: PositiveFloat = Field(description="Main axis profile measurement range [µm or deg]")
+    sub1_range: NonNegativeFloat = Field(default=0.0, description="Sub-axis1 profile measurement range [µm or deg]")
+    sub2_range: NonNegativeFloat = Field(default=0.0, description="Sub-axis2 profile measurement range [µm or deg]")
+    speed: PositiveFloat = Field(description="Axis speed [µm/s or deg/s]")
+    accel_rate: PositiveFloat = Field(description="Axis acceleration [µm/s² or deg/s²]")
+    decel_rate: PositiveFloat = Field(description="Axis deceleration [µm/s² or deg/s²]")
+    smoothing: NonNegativeInt = Field(default=0, description="Smoothing range [samples]")
+
+
+@pydantic_dataclass(frozen=True, slots=True, kw_only=True)
+class ProfileStatus:
     """Profile measurement status"""
-    status: str = Field(description="Status: idle, running, completed, error")
-    error_code: int = Field(default=0, description="Error code if error occurred")
-    error_message: str = Field(default="", description="Error message if error occurred")
+    status: Annotated[str, Field(description="Status: idle, running, completed, error")]
+    error_code: Annotated[int, Field(description="Error code if error occurred")] = 0
+    error_message: Annotated[str, Field(description="Error message if error occurred")] = ""
 
 
-class ProfileDataResponse(BaseModel):
+class ProfileDataResponse(ServerResponseModel):
     """
     Complete profile measurement data with peak detection.
     Enhanced to include peak position and value extraction.
+
+    Samples are stored as parallel positions/signals arrays; data_points is
+    derived from them for clients that still read the per-point form.
     """
     success: bool = Field(description="True if measurement succeeded")
     
     # Data fields (null if measurement failed)
-    data_points: Optional[List[ProfileDataPoint]] = Field(default=None, description="List of measured data points (null if failed)")
+    positions: Optional[List[float]] = Field(default=None, description="Main axis position of each sample [µm or deg] (null if failed)")
+    signals: Optional[List[float]] = Field(default=None, description="Signal value of each sample, parallel to positions (null if failed)")
     total_points: Optional[int] = Field(default=None, description="Total number of data points (null if failed)")
 
     # Peak information (null if measurement failed)
@@ -636,15 +617,26 @@ class ProfileDataResponse(BaseModel):
     scan_speed: float = Field(description="Scan speed [µm/s or deg/s]")
     
     # Error information (populated when success=False)
-    error_code: Optional[str] = Field(default=None, description="Error code if measurement failed")
+    error_code: Optional[ProfileErrorName] = Field(default=None, description="Error code if measurement failed")
     error_value: Optional[int] = Field(default=None, description="Error numeric value if measurement failed")
     error_description: Optional[str] = Field(default=None, description="Error description if measurement failed")
-    status_code: Optional[str] = Field(default=None, description="Final status code if measurement failed during execution")
+    status_code: Optional[ProfileStatusCode] = Field(default=None, description="Final status code if measurement failed during execution")
     status_value: Optional[int] = Field(default=None, description="Final status numeric value if measurement failed during execution")
     status_description: Optional[str] = Field(default=None, description="Final status description if measurement failed during execution")
 
+    @computed_field(description="Measured data points (deprecated: use positions/signals; null if failed)")
+    @property
+    def data_points(self) -> Optional[List[ProfileDataPoint]]:
+        """Per-point view of positions/signals, built on access"""
+        if self.positions is None or self.signals is None:
+            return None
+        return [
+            ProfileDataPoint(p, s)
+            for p, s in zip(self.positions, self.signals)
+        ]
+
 
-class ProfileMeasurementRequest(BaseModel):
+class ProfileMeasurementRequest(ApiModel):
     """
     Request to execute a profile measurement scan.
     All parameters from ProfileParameter structure must be specified.
@@ -666,24 +658,24 @@ class ProfileMeasurementRequest(BaseModel):
     are not allowed for profile measurements as a safety measure.
     """
     # Main axis parameters
-    scan_axis: int = Field(default=1, ge=1, le=12, description="Main axis to scan (mainAxisNumber) - restricted to linear axes only: 1, 2, 3, 7, 8, 9")
-    scan_range: float = Field(default=20.0, gt=0, description="Main axis scan range in µm (mainRange)")
+    scan_axis: AxisNumber = Field(default=1, description="Main axis to scan (mainAxisNumber) - restricted to linear axes only: 1, 2, 3, 7, 8, 9")
+    scan_range: PositiveFloat = Field(default=20.0, description="Main axis scan range in µm (mainRange)")
 
     # Sub-axis parameters (for motion control, not data collection)
-    sub1_axis_number: int = Field(default=0, ge=0, le=12, description="Sub-axis 1 (Y) number for motion control, 0 for None (sub1AxisNumber)")
-    sub2_axis_number: int = Field(default=0, ge=0, le=12, description="Sub-axis 2 (Z) number for motion control, 0 for None (sub2AxisNumber)")
-    sub1_range: float = Field(default=0.0, ge=0, description="Sub-axis 1 (Y) motion range in µm, 0 to disable (sub1Range)")
-    sub2_range: float = Field(default=0.0, ge=0, description="Sub-axis 2 (Z) motion range in µm, 0 to disable (sub2Range)")
+    sub1_axis_number: OptionalAxisNumber = Field(default=0, description="Sub-axis 1 (Y) number for motion control, 0 for None (sub1AxisNumber)")
+    sub2_axis_number: OptionalAxisNumber = Field(default=0, description="Sub-axis 2 (Z) number for motion control, 0 for None (sub2AxisNumber)")
+    sub1_range: NonNegativeFloat = Field(default=0.0, description="Sub-axis 1 (Y) motion range in µm, 0 to disable (sub1Range)")
+    sub2_range: NonNegativeFloat = Field(default=0.0, description="Sub-axis 2 (Z) motion range in µm, 0 to disable (sub2Range)")
 
     # Signal parameters
     signal_ch1_number: int = Field(default=1, ge=1, le=12, description="Signal channel 1 number (analog channel to monitor)")
     signal_ch2_number: int = Field(default=0, ge=0, le=12, description="Signal channel 2 number, 0 for None (signalCh2Number)")
 
     # Motion parameters
-    scan_speed: float = Field(default=25.0, gt=0, description="Scan speed in µm/s (speed)")
-    accel_rate: float = Field(default=1000.0, gt=0, description="Acceleration rate in µm/s² (accelRate)")
-    decel_rate: float = Field(default=1000.0, gt=0, description="Deceleration rate in µm/s² (decelRate)")
-    smoothing: int = Field(default=10, ge=0, description="Smoothing range in samples")
+    scan_speed: PositiveFloat = Field(default=25.0, description="Scan speed in µm/s (speed)")
+    accel_rate: PositiveFloat = Field(default=1000.0, description="Acceleration rate in µm/s² (accelRate)")
+    decel_rate: PositiveFloat = Field(default=1000.0, description="Deceleration rate in µm/s² (decelRate)")
+    smoothing: NonNegativeInt = Field(default=10, description="Smoothing range in samples")
 
     @field_validator('scan_axis')
     @classmethod
@@ -693,10 +685,9 @@ class ProfileMeasurementRequest(BaseModel):
         Allowed axes: 1, 2, 3, 7, 8, 9
         Disallowed axes: 4, 5, 6, 10, 11, 12 (rotational axes Tx, Ty, Tz)
         """
-        allowed_axes = {1, 2, 3, 7, 8, 9}
-        if v not in allowed_axes:
+        if v not in _ALLOWED_SCAN_AXES:
             raise ValueError(
-                f"scan_axis must be one of {sorted(allowed_axes)} (linear axes only). "
+                f"scan_axis must be one of {_ALLOWED_SCAN_AXES_SORTED} (linear axes only). "
                 f"Rotational axes (Tx, Ty, Tz) are not allowed for profile measurements. "
                 f"Got: {v}"
             )
@@ -705,7 +696,7 @@ class ProfileMeasurementRequest(BaseModel):
 
 # ========== Angle Adjustment Models ==========
 
-class AngleAdjustmentRequest(BaseModel):
+class AngleAdjustmentRequest(ApiModel):
     """
     Request to execute angle adjustment.
 
@@ -717,58 +708,58 @@ class AngleAdjustmentRequest(BaseModel):
     stage: AngleAdjustmentStage = Field(description="Stage to adjust (LEFT or RIGHT)")
 
     # Basic parameters
-    gap: float = Field(default=4.0, ge=0, description="Gap distance in µm after angle adjustment")
-    signal_lower_limit: float = Field(default=0.4, ge=0, description="Signal lower limit threshold")
+    gap: NonNegativeFloat = Field(default=4.0, description="Gap distance in µm after angle adjustment")
+    signal_lower_limit: NonNegativeFloat = Field(default=0.4, description="Signal lower limit threshold")
 
     # Unlock control parameters
     unlock_dout_control_on: bool = Field(default=False, description="Enable unlock digital output control")
     lock_unlock_adjust_enable: bool = Field(default=False, description="Enable lock/unlock adjustment")
-    lock_unlock_difference: float = Field(default=0.0, ge=0, description="Lock/unlock difference threshold")
+    lock_unlock_difference: NonNegativeFloat = Field(default=0.0, description="Lock/unlock difference threshold")
 
     # Contact detection parameters
-    contact_search_range: float = Field(default=5000.0, gt=0, description="Contact search range in µm")
-    contact_search_speed: float = Field(default=100.0, gt=0, description="Contact search speed in µm/s")
-    contact_smoothing: int = Field(default=10, ge=0, description="Contact smoothing samples")
-    contact_sensitivity: int = Field(default=5, ge=0, description="Contact sensitivity")
-    push_distance: float = Field(default=20.0, ge=0, description="Push distance after contact in µm")
+    contact_search_range: PositiveFloat = Field(default=5000.0, description="Contact search range in µm")
+    contact_search_speed: PositiveFloat = Field(default=100.0, description="Contact search speed in µm/s")
+    contact_smoothing: NonNegativeInt = Field(default=10, description="Contact smoothing samples")
+    contact_sensitivity: NonNegativeInt = Field(default=5, description="Contact sensitivity")
+    push_distance: NonNegativeFloat = Field(default=20.0, description="Push distance after contact in µm")
 
     # Angle adjustment axes (0 = disabled)
-    angle_axis_number_tx: int = Field(default=0, ge=0, description="Tx angle axis number (0 = disabled)")
-    angle_axis_number_ty: int = Field(default=0, ge=0, description="Ty angle axis number (0 = disabled)")
+    angle_axis_number_tx: NonNegativeInt = Field(default=0, description="Tx angle axis number (0 = disabled)")
+    angle_axis_number_ty: NonNegativeInt = Field(default=0, description="Ty angle axis number (0 = disabled)")
 
     # Angle search ranges - non-zero required for API validation
-    angle_search_range_tx: float = Field(default=5.0, ge=0, description="Tx angle search range in degrees")
-    angle_search_range_ty: float = Field(default=5.0, ge=0, description="Ty angle search range in degrees")
+    angle_search_range_tx: NonNegativeFloat = Field(default=5.0, description="Tx angle search range in degrees")
+    angle_search_range_ty: NonNegativeFloat = Field(default=5.0, description="Ty angle search range in degrees")
 
     # Angle search speeds - non-zero required for API validation
-    angle_search_speed_tx: float = Field(default=1.0, ge=0, description="Tx angle search speed in deg/s")
-    angle_search_speed_ty: float = Field(default=1.0, ge=0, description="Ty angle search speed in deg/s")
+    angle_search_speed_tx: NonNegativeFloat = Field(default=1.0, description="Tx angle search speed in deg/s")
+    angle_search_speed_ty: NonNegativeFloat = Field(default=1.0, description="Ty angle search speed in deg/s")
 
     # Angle smoothing
-    angle_smoothing_tx: int = Field(default=30, ge=0, description="Tx angle smoothing samples")
-    angle_smoothing_ty: int = Field(default=30, ge=0, description="Ty angle smoothing samples")
+    angle_smoothing_tx: NonNegativeInt = Field(default=30, description="Tx angle smoothing samples")
+    angle_smoothing_ty: NonNegativeInt = Field(default=30, description="Ty angle smoothing samples")
 
     # Angle sensitivity
-    angle_sensitivity_tx: int = Field(default=5, ge=0, description="Tx angle sensitivity")
-    angle_sensitivity_ty: int = Field(default=5, ge=0, description="Ty angle sensitivity")
+    angle_sensitivity_tx: NonNegativeInt = Field(default=5, description="Tx angle sensitivity")
+    angle_sensitivity_ty: NonNegativeInt = Field(default=5, description="Ty angle sensitivity")
 
     # Angle judge counts (0 = disabled)
-    angle_judge_count_tx: int = Field(default=2, ge=0, description="Tx angle judge count (0 = disabled)")
-    angle_judge_count_ty: int = Field(default=2, ge=0, description="Ty angle judge count (0 = disabled)")
+    angle_judge_count_tx: NonNegativeInt = Field(default=2, description="Tx angle judge count (0 = disabled)")
+    angle_judge_count_ty: NonNegativeInt = Field(default=2, description="Ty angle judge count (0 = disabled)")
 
     # Angle convergence (0 = disabled)
-    angle_convergent_range_tx: float = Field(default=0.05, ge=0, description="Tx convergence range in degrees (0 = disabled)")
-    angle_convergent_range_ty: float = Field(default=0.05, ge=0, description="Ty convergence range in degrees (0 = disabled)")
+    angle_convergent_range_tx: NonNegativeFloat = Field(default=0.05, description="Tx convergence range in degrees (0 = disabled)")
+    angle_convergent_range_ty: NonNegativeFloat = Field(default=0.05, description="Ty convergence range in degrees (0 = disabled)")
 
     # Adjustment limits (0 = disabled)
-    angle_comparison_count: int = Field(default=2, ge=0, description="Angle comparison count (0 = disabled)")
-    angle_max_count: int = Field(default=5, ge=0, description="Maximum adjustment iteration count (0 = disabled)")
+    angle_comparison_count: NonNegativeInt = Field(default=2, description="Angle comparison count (0 = disabled)")
+    angle_max_count: NonNegativeInt = Field(default=5, description="Maximum adjustment iteration count (0 = disabled)")
 
     # Rotation center parameters
     rotation_center_enabled: bool = Field(default=False, description="Enable rotation center mode")
 
 
-class AngleAdjustmentResponse(BaseModel):
+class AngleAdjustmentResponse(ServerResponseModel):
     """
     Response from angle adjustment execution.
     Following the pattern from AlignmentResponse with signal measurements instead of power.
@@ -776,12 +767,12 @@ class AngleAdjustmentResponse(BaseModel):
     success: bool = Field(description="True if adjustment completed successfully")
 
     # Status information (always populated)
-    status_code: Optional[str] = Field(default=None, description="Final status code from AngleAdjustmentStatus")
+    status_code: Optional[AngleAdjustmentStatusCode] = Field(default=None, description="Final status code from AngleAdjustmentStatus")
     status_value: Optional[int] = Field(default=None, description="Final status numeric value")
     status_description: Optional[str] = Field(default=None, description="Final status description")
 
     # Phase information (populated when available)
-    phase_code: Optional[str] = Field(default=None, description="Last phase code from AdjustingStatus")
+    phase_code: Optional[AngleAdjustmentPhaseCode] = Field(default=None, description="Last phase code from AdjustingStatus")
     phase_value: Optional[int] = Field(default=None, description="Last phase numeric value")
     phase_description: Optional[str] = Field(default=None, description="Last phase description")
 
@@ -795,31 +786,31 @@ class AngleAdjustmentResponse(BaseModel):
 
     # Profile data retrieved from controller (populated on success)
     # Each profile contains data from different phases: ContactZ, AdjustingTx, AdjustingTy
-    contact_z_profile: Optional[List[ProfileDataPoint]] = Field(
+    contact_z_profile: Optional[ProfileArrays] = Field(
         default=None,
-        description="Contact Z detection profile data points"
+        description="Contact Z detection profile samples"
     )
-    adjusting_tx_profile: Optional[List[ProfileDataPoint]] = Field(
+    adjusting_tx_profile: Optional[ProfileArrays] = Field(
         default=None,
-        description="TX angle adjustment profile data points"
+        description="TX angle adjustment profile samples"
     )
-    adjusting_ty_profile: Optional[List[ProfileDataPoint]] = Field(
+    adjusting_ty_profile: Optional[ProfileArrays] = Field(
         default=None,
-        description="TY angle adjustment profile data points"
+        description="TY angle adjustment profile samples"
     )
 
     # Error information (populated when success=False)
     error_message: Optional[str] = Field(default=None, description="Detailed error message if adjustment failed")
 
 
-class StopAngleAdjustmentRequest(BaseModel):
+class StopAngleAdjustmentRequest(ApiModel):
     """Request to stop a running angle adjustment."""
     stage: AngleAdjustmentStage = Field(description="Stage to stop (LEFT or RIGHT)")
 
 
 # ========== I/O Models ==========
 
-class DigitalOutputRequest(BaseModel):
+class DigitalOutputRequest(ApiModel):
     channel: int = Field(ge=1, le=2, description="Digital output channel number (1=Left, 2=Right)")
     value: bool = Field(description="Output value: True for LOCKED, False for UNLOCKED")
 
@@ -845,7 +836,7 @@ class OperationTypeEnum(str, Enum):
     AXIS_MOVEMENT = "axis_movement"
 
 
-class TaskResponse(BaseModel):
+class TaskResponse(ApiModel):
     """Response when a task is created (202 Accepted)."""
     task_id: str = Field(description="Unique task identifier")
     operation_type: str = Field(description="Type of operation (angle_adjustment, flat_alignment, etc.)")
@@ -854,23 +845,31 @@ class TaskResponse(BaseModel):
     message: str = Field(default="Task created and execution started", description="Human-readable message")
 
 
-class TaskStatusResponse(BaseModel):
+class TaskStatusResponse(ApiModel):
     """Complete task status information."""
     task_id: str = Field(description="Unique task identifier")
     operation_type: str = Field(description="Type of operation")
     status: str = Field(description="Current task status")
-    progress: dict = Field(default_factory=dict, description="Operation-specific progress data")
-    result: Optional[dict] = Field(default=None, description="Result data when task completes")
+    progress: Dict[str, Any] = Field(default_factory=dict, description="Operation-specific progress data")
+    result: Optional[Dict[str, Any]] = Field(default=None, description="Result data when task completes")
     error: Optional[str] = Field(default=None, description="Error message if task failed")
     created_at: Optional[str] = Field(default=None, description="ISO timestamp when task was created")
     started_at: Optional[str] = Field(default=None, description="ISO timestamp when task execution started")
     completed_at: Optional[str] = Field(default=None, description="ISO timestamp when task finished")
 
 
-class TaskProgressMessage(BaseModel):
+class TaskStopResponse(ApiModel):
+    """Response when cancellation of a task is requested."""
+    success: bool = Field(description="Whether the cancellation request was accepted")
+    task_id: str = Field(description="Unique task identifier")
+    status: str = Field(description="Task status after the request (normally stopping)")
+    message: str = Field(description="Human-readable message")
+
+
+class TaskProgressMessage(ApiModel):
     """WebSocket message for task progress updates."""
     type: str = Field(default="task_progress", description="Message type")
     task_id: str = Field(description="Task identifier")
     operation_type: str = Field(description="Type of operation")
     status: str = Field(description="Current task status")
-    progress: dict = Field(description="Progress data specific to operation type")
+    progress: Dict[str, Any] = Field(description="Progress data specific to operation type")
@@ -8,8 +8,10 @@ Updated to support async task management with:
 - Task status polling
 """
 import asyncio
-from fastapi import APIRouter, HTTPException, status, Response, Query
-from pydantic import BaseModel
+from datetime import datetime
+from fastapi import APIRouter, HTTPException, status, Request, Response, Query
+from typing import Annotated, Any, Dict, List, Union, get_args
+from pydantic import BaseModel, ConfigDict, Field
 
 from ..models import (
     FlatAlignmentRequest,
@@ -20,28 +22,52 @@ from ..models import (
     AligningStatusPhase,
     TaskResponse,
     TaskStatusResponse,
+    TaskStopResponse,
 )
 from ..dependencies import ControllerDep
-from ..task_manager import task_manager, OperationType
+from ..task_manager import task_manager, OperationType, TaskNotFoundError, TaskNotCancellableError
 from ..tasks.alignment_task import AlignmentTaskExecutor
+from .code_catalog import CodeCatalog
+from .task_status import task_status_response
 
 router = APIRouter(prefix="/alignment", tags=["Optical Alignment"])
 
+# Code catalogs are static; encode them once and let clients cache them
+_ERROR_CODES = CodeCatalog(AlignmentErrorCode)
+_STATUS_CODES = CodeCatalog(OpticalAlignmentStatus)
+_PHASE_CODES = CodeCatalog(AligningStatusPhase)
+
+# Fixed parts of the 202 responses, built once rather than per launch
+_STATUS_URL_PREFIX = f"{router.prefix}/status/"
+_FLAT_TASK_MESSAGE = "Flat alignment task created and execution started"
+_FOCUS_TASK_MESSAGES = {
+    z_mode: f"Focus alignment task created and execution started (zMode={z_mode})"
+    for z_mode in get_args(FocusAlignmentRequest.model_fields["zMode"].annotation)
+}
+
+
+# Shared by the single and batch power meter response schemas
+_POWER_METER_EXAMPLE = {
+    "channel": 1,
+    "value_dbm": -15.3,
+    "timestamp": "2025-11-06T10:30:45.123456"
+}
+
 
 class PowerMeterResponse(BaseModel):
     """Response model for power meter readings"""
+    model_config = ConfigDict(json_schema_extra={"examples": [_POWER_METER_EXAMPLE]})
+
     channel: int
     value_dbm: float
     timestamp: str
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "channel": 1,
-                "value_dbm": -15.3,
-                "timestamp": "2025-11-06T10:30:45.123456"
-            }
-        }
+
+class PowerMeterBatchResponse(BaseModel):
+    """Response model for multi-channel power meter readings"""
+    model_config = ConfigDict(json_schema_extra={"examples": [{"readings": [_POWER_METER_EXAMPLE]}]})
+
+    readings: List[PowerMeterResponse]
 
 
 @router.get("/power", response_model=PowerMeterResponse)
@@ -67,8 +93,6 @@ async def get_power_meter_reading(
         - 200 OK: Power reading retrieved successfully
         - 500 Internal Server Error: Controller not connected or power meter error
     """
-    from datetime import datetime
-
     power_value = controller.get_power(channel)
 
     if power_value is None:
@@ -84,65 +108,113 @@ async def get_power_meter_reading(
     )
 
 
+@router.get("/power/batch", response_model=PowerMeterBatchResponse)
+async def get_power_meter_readings(
+    controller: ControllerDep,
+    channels: List[Annotated[int, Field(ge=1, le=2)]] = Query(
+        default=[1, 2],
+        min_length=1,
+        max_length=2,
+        description="Power meter channel numbers, e.g. ?channels=1&channels=2"
+    )
+):
+    """
+    Get optical power readings for several power meter channels in one request.
+
+    Saves a round trip over calling /alignment/power once per channel. The
+    reads are issued back to back; the controller serializes hardware
+    access, so they are not run concurrently.
+
+    Args:
+        channels: Power meter channel numbers (each 1 or 2, at most two)
+
+    Returns:
+        PowerMeterBatchResponse with one reading per requested channel, in request order
+
+    HTTP Status Codes:
+        - 200 OK: All power readings retrieved successfully
+        - 422 Unprocessable Entity: Invalid or too many channel numbers
+        - 500 Internal Server Error: Controller not connected or power meter error
+    """
+    readings = []
+    for channel in channels:
+        power_value = controller.get_power(channel)
+
+        if power_value is None:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to read power meter channel {channel}: Controller not connected or power meter error"
+            )
+
+        readings.append(PowerMeterResponse(
+            channel=channel,
+            value_dbm=power_value,
+            timestamp=datetime.now().isoformat()
+        ))
+
+    return PowerMeterBatchResponse(readings=readings)
+
+
 @router.get("/error-codes")
-async def get_alignment_error_codes():
+async def get_alignment_error_codes(request: Request):
     """
     Get all optical alignment error codes with descriptions.
 
     Returns:
         List of error code definitions
     """
-    return [error.to_dict() for error in AlignmentErrorCode]
+    return _ERROR_CODES.response(request)
 
 
 @router.get("/status-codes")
-async def get_alignment_status_codes():
+async def get_alignment_status_codes(request: Request):
     """
     Get all optical alignment status codes with descriptions.
 
     Returns:
         List of status code definitions
     """
-    return [status_code.to_dict() for status_code in OpticalAlignmentStatus]
+    return _STATUS_CODES.response(request)
 
 
 @router.get("/phase-codes")
-async def get_aligning_phase_codes():
+async def get_aligning_phase_codes(request: Request):
     """
     Get all aligning phase codes with descriptions.
 
     Returns:
         List of phase code definitions
     """
-    return [phase.to_dict() for phase in AligningStatusPhase]
+    return _PHASE_CODES.response(request)
 
 
-@router.post("/flat/execute", status_code=status.HTTP_202_ACCEPTED, response_model=TaskResponse)
-async def execute_flat_alignment(
-    request: FlatAlignmentRequest,
-    controller: ControllerDep
-):
+def _launch_alignment(
+    alignment_type: str,
+    operation_type: OperationType,
+    request: Union[FlatAlignmentRequest, FocusAlignmentRequest],
+    controller,
+    request_data: Dict[str, Any],
+    message: str,
+) -> TaskResponse:
     """
-    Execute flat (2D) optical alignment - async with task tracking.
+    Create an alignment task and start it in the background.
 
-    Returns immediately with 202 Accepted and task_id.
-    Use GET /alignment/status/{task_id} to check progress.
-    Use POST /alignment/stop/{task_id} to cancel alignment.
+    Shared by the flat and focus launch endpoints, which differ only in the
+    operation type, the recorded request data and the response message.
 
-    Performs a 2D optical alignment scan to maximize optical power coupling
-    by optimizing X and Y stage positions. The process includes:
-    1. Field search to locate the signal
-    2. Peak search on X-axis
-    3. Peak search on Y-axis
-    4. Convergence iterations if needed
+    Args:
+        alignment_type: "flat" or "focus", passed through to AlignmentTaskExecutor
+        operation_type: Task operation type to register
+        request: Validated alignment request
+        controller: Connected controller instance
+        request_data: Extra fields stored on the task alongside alignment_type
+        message: Message for the 202 response
 
     Returns:
-        TaskResponse with task_id for status polling
+        TaskResponse for the newly created task
 
-    HTTP Status Codes:
-        - 202 Accepted: Task created and execution started
-        - 409 Conflict: Another task is already running
-        - 500 Internal Server Error: Controller not connected or unexpected error
+    Raises:
+        HTTPException: 500 if the controller is not connected, 409 if another task is running
     """
     # Check controller connection
     if not controller.is_connected():
@@ -154,12 +226,8 @@ async def execute_flat_alignment(
     # Create task
     try:
         task = task_manager.create_task(
-            operation_type=OperationType.FLAT_ALIGNMENT,
-            request_data={
-                "alignment_type": "flat",
-                "pm_ch": request.pmCh,
-                "wavelength": request.wavelength,
-            }
+            operation_type=operation_type,
+            request_data={"alignment_type": alignment_type, **request_data}
         )
     except RuntimeError as e:
         raise HTTPException(
@@ -174,7 +242,7 @@ async def execute_flat_alignment(
         executor.execute(
             task.task_id,
             {
-                "alignment_type": "flat",
+                "alignment_type": alignment_type,
                 "request": request
             },
             controller
@@ -186,8 +254,45 @@ async def execute_flat_alignment(
         task_id=task.task_id,
         operation_type=task.operation_type.value,
         status=task.status.value,
-        status_url=f"/alignment/status/{task.task_id}",
-        message="Flat alignment task created and execution started"
+        status_url=_STATUS_URL_PREFIX + task.task_id,
+        message=message
+    )
+
+
+@router.post("/flat/execute", status_code=status.HTTP_202_ACCEPTED, response_model=TaskResponse)
+async def execute_flat_alignment(
+    request: FlatAlignmentRequest,
+    controller: ControllerDep
+):
+    """
+    Execute flat (2D) optical alignment - async with task tracking.
+
+    Returns immediately with 202 Accepted and task_id.
+    Use GET /alignment/status/{task_id} to check progress.
+    Use POST /alignment/stop/{task_id} to cancel alignment.
+
+    Performs a 2D optical alignment scan to maximize optical power coupling
+    by optimizing X and Y stage positions. The process includes:
+    1. Field search to locate the signal
+    2. Peak search on X-axis
+    3. Peak search on Y-axis
+    4. Convergence iterations if needed
+
+    Returns:
+        TaskResponse with task_id for status polling
+
+    HTTP Status Codes:
+        - 202 Accepted: Task created and execution started
+        - 409 Conflict: Another task is already running
+        - 500 Internal Server Error: Controller not connected or unexpected error
+    """
+    return _launch_alignment(
+        "flat",
+        OperationType.FLAT_ALIGNMENT,
+        request,
+        controller,
+        {"pm_ch": request.pmCh, "wavelength": request.wavelength},
+        _FLAT_TASK_MESSAGE,
     )
 
 
@@ -224,56 +329,18 @@ async def execute_focus_alignment(
         - 409 Conflict: Another task is already running
         - 500 Internal Server Error: Controller not connected or unexpected error
     """
-    # Check controller connection
-    if not controller.is_connected():
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Controller not connected"
-        )
-
-    # Create task
-    try:
-        task = task_manager.create_task(
-            operation_type=OperationType.FOCUS_ALIGNMENT,
-            request_data={
-                "alignment_type": "focus",
-                "pm_ch": request.pmCh,
-                "wavelength": request.wavelength,
-                "z_mode": request.zMode,
-            }
-        )
-    except RuntimeError as e:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=str(e)
-        )
-
-    # Create executor and launch background task
-    executor = AlignmentTaskExecutor(task_manager=task_manager)
-
-    asyncio.create_task(
-        executor.execute(
-            task.task_id,
-            {
-                "alignment_type": "focus",
-                "request": request
-            },
-            controller
-        )
-    )
-
-    # Return 202 Accepted with task info
-    return TaskResponse(
-        task_id=task.task_id,
-        operation_type=task.operation_type.value,
-        status=task.status.value,
-        status_url=f"/alignment/status/{task.task_id}",
-        message=f"Focus alignment task created and execution started (zMode={request.zMode})"
+    return _launch_alignment(
+        "focus",
+        OperationType.FOCUS_ALIGNMENT,
+        request,
+        controller,
+        {"pm_ch": request.pmCh, "wavelength": request.wavelength, "z_mode": request.zMode},
+        _FOCUS_TASK_MESSAGES[request.zMode],
     )
 
 
 @router.get("/status/{task_id}", response_model=TaskStatusResponse)
-async def get_alignment_status(task_id: str):
+async def get_alignment_status(task_id: str, request: Request, response: Response):
     """
     Get status of an optical alignment task (flat or focus).
 
@@ -283,28 +350,10 @@ async def get_alignment_status(task_id: str):
     - Result data when completed
     - Error message if failed
     """
-    task = task_manager.get_task(task_id)
+    return task_status_response(task_id, request, response)
 
-    if not task:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Task {task_id} not found"
-        )
 
-    return TaskStatusResponse(
-        task_id=task.task_id,
-        operation_type=task.operation_type.value,
-        status=task.status.value,
-        progress=task.progress,
-        result=task.result,
-        error=task.error,
-        created_at=task.created_at.isoformat() if task.created_at else None,
-        started_at=task.started_at.isoformat() if task.started_at else None,
-        completed_at=task.completed_at.isoformat() if task.completed_at else None,
-    )
-
-
-@router.post("/stop/{task_id}")
+@router.post("/stop/{task_id}", response_model=TaskStopResponse)
 async def stop_alignment_task(task_id: str, controller: ControllerDep):
     """
     Cancel a running optical alignment task.
@@ -312,24 +361,15 @@ async def stop_alignment_task(task_id: str, controller: ControllerDep):
     Sends cancellation signal to the background task.
     The alignment will stop via Alignment.Stop() in the polling loop.
     """
-    task = task_manager.get_task(task_id)
-
-    if not task:
+    # Set cancellation event
+    try:
+        task = task_manager.cancel_task(task_id)
+    except TaskNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Task {task_id} not found"
-        )
-
-    if task.status.value not in ["pending", "running"]:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Task {task_id} is {task.status.value} and cannot be cancelled"
+            detail=str(e)
         )
-
-    # Set cancellation event
-    try:
-        task_manager.cancel_task(task_id)
-    except ValueError as e:
+    except TaskNotCancellableError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
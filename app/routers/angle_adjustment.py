@@ -8,7 +8,7 @@ Updated to support async task management with:
 - Task status polling
 """
 import asyncio
-from fastapi import APIRouter, HTTPException, status, Response
+from fastapi import APIRouter, HTTPException, status, Request, Response
 
 from ..models import (
     AngleAdjustmentRequest,
@@ -19,45 +19,53 @@ from ..models import (
     AdjustingStatus,
     TaskResponse,
     TaskStatusResponse,
+    TaskStopResponse,
 )
 from ..dependencies import ControllerDep
-from ..task_manager import task_manager, OperationType
+from ..task_manager import task_manager, OperationType, TaskNotFoundError, TaskNotCancellableError
 from ..tasks.angle_adjustment_task import AngleAdjustmentTaskExecutor
+from .code_catalog import CodeCatalog
+from .task_status import task_status_response
 
 router = APIRouter(prefix="/angle-adjustment", tags=["Angle Adjustment"])
 
+# Code catalogs are static; encode them once and let clients cache them
+_ERROR_CODES = CodeCatalog(AngleAdjustmentErrorCode)
+_STATUS_CODES = CodeCatalog(AngleAdjustmentStatus)
+_PHASE_CODES = CodeCatalog(AdjustingStatus)
+
 
 @router.get("/error-codes")
-async def get_angle_adjustment_error_codes():
+async def get_angle_adjustment_error_codes(request: Request):
     """
     Get all angle adjustment error codes with descriptions.
 
     Returns:
         List of error code definitions
     """
-    return [error.to_dict() for error in AngleAdjustmentErrorCode]
+    return _ERROR_CODES.response(request)
 
 
 @router.get("/status-codes")
-async def get_angle_adjustment_status_codes():
+async def get_angle_adjustment_status_codes(request: Request):
     """
     Get all angle adjustment status codes with descriptions.
 
     Returns:
         List of status code definitions
     """
-    return [status_code.to_dict() for status_code in AngleAdjustmentStatus]
+    return _STATUS_CODES.response(request)
 
 
 @router.get("/phase-codes")
-async def get_adjusting_phase_codes():
+async def get_adjusting_phase_codes(request: Request):
     """
     Get all adjusting phase codes with descriptions.
 
     Returns:
         List of phase code definitions
     """
-    return [phase.to_dict() for phase in AdjustingStatus]
+    return _PHASE_CODES.response(request)
 
 
 @router.post("/execute", status_code=status.HTTP_202_ACCEPTED, response_model=TaskResponse)
@@ -99,7 +107,7 @@ async def execute_angle_adjustment(
         task = task_manager.create_task(
             operation_type=OperationType.ANGLE_ADJUSTMENT,
             request_data={
-                "stage": request.stage.value,
+                "stage": int(request.stage),
                 "gap": request.gap,
                 "signal_lower_limit": request.signal_lower_limit,
             }
@@ -132,7 +140,7 @@ async def execute_angle_adjustment(
 
 
 @router.get("/status/{task_id}", response_model=TaskStatusResponse)
-async def get_angle_adjustment_status(task_id: str):
+async def get_angle_adjustment_status(task_id: str, request: Request, response: Response):
     """
     Get status of an angle adjustment task.
 
@@ -142,28 +150,10 @@ async def get_angle_adjustment_status(task_id: str):
     - Result data when completed
     - Error message if failed
     """
-    task = task_manager.get_task(task_id)
+    return task_status_response(task_id, request, response)
 
-    if not task:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Task {task_id} not found"
-        )
 
-    return TaskStatusResponse(
-        task_id=task.task_id,
-        operation_type=task.operation_type.value,
-        status=task.status.value,
-        progress=task.progress,
-        result=task.result,
-        error=task.error,
-        created_at=task.created_at.isoformat() if task.created_at else None,
-        started_at=task.started_at.isoformat() if task.started_at else None,
-        completed_at=task.completed_at.isoformat() if task.completed_at else None,
-    )
-
-
-@router.post("/stop/{task_id}")
+@router.post("/stop/{task_id}", response_model=TaskStopResponse)
 async def stop_angle_adjustment_task(task_id: str, controller: ControllerDep):
     """
     Cancel a running angle adjustment task.
@@ -171,24 +161,15 @@ async def stop_angle_adjustment_task(task_id: str, controller: ControllerDep):
     Sends cancellation signal to the background task.
     The angle adjustment will stop via AngleAdjustment.Stop() in the polling loop.
     """
-    task = task_manager.get_task(task_id)
-
-    if not task:
+    # Set cancellation event
+    try:
+        task = task_manager.cancel_task(task_id)
+    except TaskNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Task {task_id} not found"
-        )
-
-    if task.status.value not in ["pending", "running"]:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Task {task_id} is {task.status.value} and cannot be cancelled"
+            detail=str(e)
         )
-
-    # Set cancellation event
-    try:
-        task_manager.cancel_task(task_id)
-    except ValueError as e:
+    except TaskNotCancellableError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
@@ -0,0 +1,40 @@
+"""
+Cached responses for the static error/status/phase code catalog endpoints
+"""
+import hashlib
+from enum import Enum
+from typing import Type
+
+import orjson
+from fastapi import Request, Response
+
+# The catalogs only change with a new deployment, so clients and proxies may keep them
+_CACHE_CONTROL = "public, max-age=86400, immutable"
+
+
+class CodeCatalog:
+    """
+    Pre-encoded JSON body and ETag for one code enum's catalog.
+
+    The body is serialized once at import; requests carrying a matching
+    If-None-Match header get an empty 304 instead of the payload.
+    """
+
+    def __init__(self, enum_cls: Type[Enum]):
+        self.body = orjson.dumps([dict(member.to_dict()) for member in enum_cls])
+        self.etag = f'"{hashlib.md5(self.body).hexdigest()}"'
+        self._headers = {"ETag": self.etag, "Cache-Control": _CACHE_CONTROL}
+
+    def response(self, request: Request) -> Response:
+        """
+        Build the response for a catalog request.
+
+        Args:
+            request: Incoming request, checked for If-None-Match
+
+        Returns:
+            304 Not Modified if the client's copy is current, otherwise the JSON catalog
+        """
+        if request.headers.get("if-none-match") == self.etag:
+            return Response(status_code=304, headers=self._headers)
+        return Response(content=self.body, media_type="application/json", headers=self._headers)
@@ -5,7 +5,7 @@ from datetime import datetime
 from fastapi import APIRouter
 
 from ..models import ConnectionRequest, ConnectionResponse, SystemStatus
-from ..dependencies import ControllerOptionalDep
+from ..dependencies import ControllerOptionalDep, invalidate_connection_cache
 
 router = APIRouter(prefix="/connection", tags=["Connection"])
 
@@ -37,6 +37,7 @@ async def connect_to_controller(request: ConnectionRequest, controller: Controll
 async def disconnect_from_controller(controller: ControllerOptionalDep):
     """Disconnect from the probe station controller"""
     success = controller.disconnect()
+    invalidate_connection_cache()
 
     return {
         "success": success,
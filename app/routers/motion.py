@@ -8,7 +8,7 @@ Updated to support async task management with:
 - Task status polling
 """
 import asyncio
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, status, Request, Response
 from typing import Optional
 
 from ..models import (
@@ -19,10 +19,18 @@ from ..models import (
     Move3DRequest,
     TaskResponse,
     TaskStatusResponse,
+    TaskStopResponse,
 )
 from ..dependencies import ControllerDep
-from ..task_manager import task_manager, OperationType
+from ..task_manager import (
+    task_manager,
+    OperationType,
+    CANCELLABLE_STATUSES,
+    TaskNotFoundError,
+    TaskNotCancellableError,
+)
 from ..tasks.motion_task import MotionTaskExecutor
+from .task_status import task_status_response
 
 router = APIRouter(prefix="/move", tags=["Motion Control"])
 
@@ -134,7 +142,7 @@ async def move_relative_async(request: MoveRelativeRequest, controller: Controll
 
 
 @router.get("/status/{task_id}", response_model=TaskStatusResponse)
-async def get_movement_status(task_id: str):
+async def get_movement_status(task_id: str, request: Request, response: Response):
     """
     Get status of a movement task.
 
@@ -144,28 +152,10 @@ async def get_movement_status(task_id: str):
     - Result data when completed
     - Error message if failed
     """
-    task = task_manager.get_task(task_id)
+    return task_status_response(task_id, request, response)
 
-    if not task:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Task {task_id} not found"
-        )
 
-    return TaskStatusResponse(
-        task_id=task.task_id,
-        operation_type=task.operation_type.value,
-        status=task.status.value,
-        progress=task.progress,
-        result=task.result,
-        error=task.error,
-        created_at=task.created_at.isoformat() if task.created_at else None,
-        started_at=task.started_at.isoformat() if task.started_at else None,
-        completed_at=task.completed_at.isoformat() if task.completed_at else None,
-    )
-
-
-@router.post("/stop/{task_id}")
+@router.post("/stop/{task_id}", response_model=TaskStopResponse)
 async def stop_movement_task(task_id: str, controller: ControllerDep):
     """
     Cancel a running movement task.
@@ -173,24 +163,15 @@ async def stop_movement_task(task_id: str, controller: ControllerDep):
     Sends cancellation signal to the background task.
     The axis will stop via axis.Stop() in the polling loop.
     """
-    task = task_manager.get_task(task_id)
-
-    if not task:
+    # Set cancellation event
+    try:
+        task = task_manager.cancel_task(task_id)
+    except TaskNotFoundError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Task {task_id} not found"
-        )
-
-    if task.status.value not in ["pending", "running"]:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Task {task_id} is {task.status.value} and cannot be cancelled"
+            detail=str(e)
         )
-
-    # Set cancellation event
-    try:
-        task_manager.cancel_task(task_id)
-    except ValueError as e:
+    except TaskNotCancellableError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
@@ -241,7 +222,7 @@ async def emergency_stop(controller: ControllerDep):
     """
     # Cancel current task if any
     current_task = task_manager.get_current_task()
-    if current_task and current_task.status.value in ["pending", "running"]:
+    if current_task and current_task.status in CANCELLABLE_STATUSES:
         try:
             task_manager.cancel_task(current_task.task_id)
         except Exception:
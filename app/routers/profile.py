@@ -2,7 +2,7 @@
 Profile measurement endpoints
 """
 import asyncio
-from fastapi import APIRouter, HTTPException, status, Response
+from fastapi import APIRouter, HTTPException, status, Request, Response
 
 from ..models import (
     ProfileMeasurementRequest,
@@ -11,34 +11,41 @@ from ..models import (
     ProfileMeasurementStatus,
     TaskResponse,
     TaskStatusResponse,
+    TaskStopResponse,
 )
 from ..dependencies import ControllerDep
-from ..task_manager import task_manager, OperationType
+from ..task_manager import task_manager, OperationType, TaskNotFoundError, TaskNotCancellableError
 from ..tasks.profile_task import ProfileMeasurementTaskExecutor
+from .code_catalog import CodeCatalog
+from .task_status import task_status_response
 
 router = APIRouter(prefix="/profile", tags=["Profile Measurement"])
 
+# Code catalogs are static; encode them once and let clients cache them
+_ERROR_CODES = CodeCatalog(ProfileErrorCode)
+_STATUS_CODES = CodeCatalog(ProfileMeasurementStatus)
+
 
 @router.get("/error-codes")
-async def get_profile_error_codes():
+async def get_profile_error_codes(request: Request):
     """
     Get all profile measurement error codes with descriptions.
     
     Returns:
         List of error code definitions from manual section 4.7.3.1
     """
-    return [error.to_dict() for error in ProfileErrorCode]
+    return _ERROR_CODES.response(request)
 
 
 @router.get("/status-codes")
-async def get_profile_status_codes():
+async def get_profile_status_codes(request: Request):
     """
     Get all profile measurement status codes with descriptions.
     
     Returns:
         List of status code definitions from manual section 4.7.3.2
     """
-    return [status_code.to_dict() for status_code in ProfileMeasurementStatus]
+    return _STATUS_CODES.response(request)
 
 
 @router.post("/measure", response_model=ProfileDataResponse)
@@ -125,39 +132,17 @@ async def execute_profile_measurement(
 
 
 @router.get("/status/{task_id}", response_model=TaskStatusResponse)
-async def get_profile_measurement_status(task_id: str):
-    task = task_manager.get_task(task_id)
-    if not task:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Task {task_id} not found")
-
-    return TaskStatusResponse(
-        task_id=task.task_id,
-        operation_type=task.operation_type.value,
-        status=task.status.value,
-        progress=task.progress,
-        result=task.result,
-        error=task.error,
-        created_at=task.created_at.isoformat() if task.created_at else None,
-        started_at=task.started_at.isoformat() if task.started_at else None,
-        completed_at=task.completed_at.isoformat() if task.completed_at else None,
-    )
+async def get_profile_measurement_status(task_id: str, request: Request, response: Response):
+    return task_status_response(task_id, request, response)
 
 
-@router.post("/stop/{task_id}")
+@router.post("/stop/{task_id}", response_model=TaskStopResponse)
 async def stop_profile_measurement_task(task_id: str, controller: ControllerDep):
-    task = task_manager.get_task(task_id)
-    if not task:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Task {task_id} not found")
-
-    if task.status.value not in ["pending", "running"]:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Task {task_id} is {task.status.value} and cannot be cancelled",
-        )
-
     try:
-        task_manager.cancel_task(task_id)
-    except ValueError as e:
+        task = task_manager.cancel_task(task_id)
+    except TaskNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except TaskNotCancellableError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
     # Issue hardware stop as well (best-effort)
@@ -0,0 +1,63 @@
+"""
+Shared handler for the per-router task status polling endpoints
+"""
+from typing import Union
+
+from fastapi import HTTPException, Request, Response, status
+
+from ..models import TaskStatusResponse
+from ..task_manager import task_manager
+
+# Let clients keep the last poll but always revalidate it against the ETag
+_CACHE_CONTROL = "no-cache"
+
+
+def task_status_response(
+    task_id: str,
+    request: Request,
+    response: Response
+) -> Union[TaskStatusResponse, Response]:
+    """
+    Build the status response for a task, or a 304 if the client is up to date.
+
+    The ETag changes whenever the task manager updates the task, so a poll
+    carrying the previous ETag in If-None-Match skips rebuilding and
+    re-serializing the status body.
+
+    Args:
+        task_id: Task ID to look up
+        request: Incoming request, checked for If-None-Match
+        response: Outgoing response, receives the ETag header
+
+    Returns:
+        TaskStatusResponse, or an empty 304 Not Modified response
+
+    Raises:
+        HTTPException: 404 if the task is not found
+    """
+    task = task_manager.get_task(task_id)
+
+    if not task:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Task {task_id} not found"
+        )
+
+    etag = task.etag
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": _CACHE_CONTROL})
+
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = _CACHE_CONTROL
+
+    return TaskStatusResponse(
+        task_id=task.task_id,
+        operation_type=task.operation_type.value,
+        status=task.status.value,
+        progress=task.progress,
+        result=task.result,
+        error=task.error,
+        created_at=task.created_at_iso,
+        started_at=task.started_at_iso,
+        completed_at=task.completed_at_iso,
+    )
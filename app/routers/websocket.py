@@ -21,11 +21,11 @@ async def websocket_endpoint(websocket: WebSocket):
             # Keep connection alive and handle incoming messages
             data = await websocket.receive_text()
 
-            # Echo back for testing
-            await websocket.send_json({
+            # Echo back for testing (through the connection's writer queue)
+            manager.send_raw(websocket, main.encode_message({
                 "type": "echo",
                 "message": data,
                 "timestamp": datetime.now().isoformat()
-            })
+            }))
     except WebSocketDisconnect:
         manager.disconnect(websocket)
@@ -0,0 +1,22 @@
+"""
+Shared application state
+Holds objects created during startup so dependencies can read them without importing main
+"""
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .controller_manager import SurugaSeikiController
+    from .mock_controller import MockSurugaSeikiController
+
+
+class AppState:
+    """Process-wide holder populated by the application lifespan."""
+
+    controller: Optional["SurugaSeikiController | MockSurugaSeikiController"] = None
+    # time.monotonic() deadline until which the last positive is_connected() check is reused;
+    # reset to 0.0 whenever the connection is known to have dropped
+    connected_until: float = 0.0
+
+
+# Global state instance
+state = AppState()
@@ -13,6 +13,14 @@ from enum import Enum
 from typing import Any, Optional
 
 
+class TaskNotFoundError(ValueError):
+    """Raised when a task ID is not the current task or in history."""
+
+
+class TaskNotCancellableError(ValueError):
+    """Raised when cancelling a task that is no longer pending or running."""
+
+
 class TaskStatus(str, Enum):
     """Status of a task."""
 
@@ -24,6 +32,12 @@ class TaskStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
+# Status groups tested on every launch, stop and status transition
+CANCELLABLE_STATUSES = frozenset({TaskStatus.PENDING, TaskStatus.RUNNING})
+ACTIVE_STATUSES = CANCELLABLE_STATUSES | {TaskStatus.STOPPING}
+TERMINAL_STATUSES = frozenset({TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED})
+
+
 class OperationType(str, Enum):
     """Types of operations that can be executed as tasks."""
 
@@ -50,6 +64,9 @@ class Task:
         completed_at: When the task finished (success, failure, or cancellation)
         cancellation_event: Asyncio event for signaling cancellation
         request_data: Original request data for the operation
+        version: Incremented by TaskManager on every state change; used as the status ETag
+        created_at_iso, started_at_iso, completed_at_iso: ISO renderings of the
+            timestamps, set together with them so status polls don't re-format
     """
 
     task_id: str
@@ -63,6 +80,18 @@ class Task:
     completed_at: Optional[datetime] = None
     cancellation_event: asyncio.Event = field(default_factory=asyncio.Event)
     request_data: Optional[dict[str, Any]] = None
+    version: int = 0
+    created_at_iso: str = field(init=False)
+    started_at_iso: Optional[str] = None
+    completed_at_iso: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        self.created_at_iso = self.created_at.isoformat()
+
+    @property
+    def etag(self) -> str:
+        """HTTP entity tag identifying the current state of this task."""
+        return f'"{self.task_id}.{self.version}"'
 
     def to_dict(self) -> dict[str, Any]:
         """Convert task to dictionary for API responses."""
@@ -73,11 +102,37 @@ class Task:
             "progress": self.progress,
             "result": self.result,
             "error": self.error,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "started_at": self.started_at.isoformat() if self.started_at else None,
-            "completed_at": (
-                self.completed_at.isoformat() if self.completed_at else None
-            ),
+            "created_at": self.created_at_iso,
+            "started_at": self.started_at_iso,
+            "completed_at": self.completed_at_iso,
+        }
+
+
+@dataclass(slots=True)
+class ProgressEvent:
+    """Phase-change progress update emitted from hot polling loops.
+
+    Converted to a plain dictionary only at the broadcast boundary.
+
+    Attributes:
+        phase: Phase code (e.g. "FieldSearching")
+        phase_description: Human-readable phase description
+        elapsed_time: Seconds since the operation started
+        message: Progress message for clients
+    """
+
+    phase: str
+    phase_description: str
+    elapsed_time: float
+    message: str
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert event to dictionary for progress broadcasting."""
+        return {
+            "phase": self.phase,
+            "phase_description": self.phase_description,
+            "elapsed_time": self.elapsed_time,
+            "message": self.message,
         }
 
 
@@ -116,11 +171,7 @@ class TaskManager:
         Raises:
             RuntimeError: If a task is already running
         """
-        if self._current_task and self._current_task.status in [
-            TaskStatus.PENDING,
-            TaskStatus.RUNNING,
-            TaskStatus.STOPPING,
-        ]:
+        if self._current_task and self._current_task.status in ACTIVE_STATUSES:
             raise RuntimeError(
                 f"Task {self._current_task.task_id} is already {self._current_task.status.value}. "
                 f"Only one task can run at a time."
@@ -174,12 +225,15 @@ class TaskManager:
             raise ValueError(f"Task {task_id} not found")
 
         task.status = status
+        task.version += 1
 
         # Update timestamps
         if status == TaskStatus.RUNNING and not task.started_at:
             task.started_at = datetime.utcnow()
-        elif status in [TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED]:
+            task.started_at_iso = task.started_at.isoformat()
+        elif status in TERMINAL_STATUSES:
             task.completed_at = datetime.utcnow()
+            task.completed_at_iso = task.completed_at.isoformat()
 
     def update_progress(self, task_id: str, progress: dict[str, Any]) -> None:
         """Update task progress data.
@@ -196,6 +250,7 @@ class TaskManager:
             raise ValueError(f"Task {task_id} not found")
 
         task.progress.update(progress)
+        task.version += 1
 
     def complete_task(self, task_id: str, result: dict[str, Any]) -> None:
         """Mark task as completed with result.
@@ -214,6 +269,8 @@ class TaskManager:
         task.status = TaskStatus.COMPLETED
         task.result = result
         task.completed_at = datetime.utcnow()
+        task.completed_at_iso = task.completed_at.isoformat()
+        task.version += 1
 
     def fail_task(self, task_id: str, error: str) -> None:
         """Mark task as failed with error.
@@ -232,23 +289,29 @@ class TaskManager:
         task.status = TaskStatus.FAILED
         task.error = error
         task.completed_at = datetime.utcnow()
+        task.completed_at_iso = task.completed_at.isoformat()
+        task.version += 1
 
-    def cancel_task(self, task_id: str) -> None:
+    def cancel_task(self, task_id: str) -> Task:
         """Cancel a running task.
 
         Args:
             task_id: Task ID to cancel
 
+        Returns:
+            The cancelled task, now in STOPPING state
+
         Raises:
-            ValueError: If task not found or not in cancellable state
+            TaskNotFoundError: If task not found
+            TaskNotCancellableError: If task not in cancellable state
         """
         task = self.get_task(task_id)
         if not task:
-            raise ValueError(f"Task {task_id} not found")
+            raise TaskNotFoundError(f"Task {task_id} not found")
 
-        if task.status not in [TaskStatus.PENDING, TaskStatus.RUNNING]:
-            raise ValueError(
-                f"Task {task_id} cannot be cancelled (status: {task.status.value})"
+        if task.status not in CANCELLABLE_STATUSES:
+            raise TaskNotCancellableError(
+                f"Task {task_id} is {task.status.value} and cannot be cancelled"
             )
 
         # Set cancellation event to signal background task
@@ -256,17 +319,16 @@ class TaskManager:
 
         # Update status to stopping
         task.status = TaskStatus.STOPPING
+        task.version += 1
+
+        return task
 
     def clear_current_task(self) -> None:
         """Clear the current task reference.
 
         Should be called after task reaches terminal state.
         """
-        if (
-            self._current_task
-            and self._current_task.status
-            in [TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED]
-        ):
+        if self._current_task and self._current_task.status in TERMINAL_STATUSES:
             self._current_task = None
 
     def _add_to_history(self, task: Task) -> None:
@@ -91,31 +91,35 @@ class AlignmentTaskExecutor(BaseTaskExecutor):
 
         # Include profile data counts and actual profile data if available
         if result.field_search_profile:
-            result_dict["field_search_profile_points"] = len(result.field_search_profile)
+            profile = result.field_search_profile
+            result_dict["field_search_profile_points"] = len(profile.positions)
             result_dict["field_search_profile"] = [
-                {"position": p.position, "signal": p.signal}
-                for p in result.field_search_profile
+                {"position": position, "signal": signal}
+                for position, signal in zip(profile.positions, profile.signals)
             ]
 
         if result.peak_search_x_profile:
-            result_dict["peak_search_x_profile_points"] = len(result.peak_search_x_profile)
+            profile = result.peak_search_x_profile
+            result_dict["peak_search_x_profile_points"] = len(profile.positions)
             result_dict["peak_search_x_profile"] = [
-                {"position": p.position, "signal": p.signal}
-                for p in result.peak_search_x_profile
+                {"position": position, "signal": signal}
+                for position, signal in zip(profile.positions, profile.signals)
             ]
 
         if result.peak_search_y_profile:
-            result_dict["peak_search_y_profile_points"] = len(result.peak_search_y_profile)
+            profile = result.peak_search_y_profile
+            result_dict["peak_search_y_profile_points"] = len(profile.positions)
             result_dict["peak_search_y_profile"] = [
-                {"position": p.position, "signal": p.signal}
-                for p in result.peak_search_y_profile
+                {"position": position, "signal": signal}
+                for position, signal in zip(profile.positions, profile.signals)
             ]
 
         if alignment_type == "focus" and result.peak_search_z_profile:
-            result_dict["peak_search_z_profile_points"] = len(result.peak_search_z_profile)
+            profile = result.peak_search_z_profile
+            result_dict["peak_search_z_profile_points"] = len(profile.positions)
             result_dict["peak_search_z_profile"] = [
-                {"position": p.position, "signal": p.signal}
-                for p in result.peak_search_z_profile
+                {"position": position, "signal": signal}
+                for position, signal in zip(profile.positions, profile.signals)
             ]
 
         # Check if operation was successful
@@ -73,13 +73,13 @@ class AngleAdjustmentTaskExecutor(BaseTaskExecutor):
 
         # Include profile data if available
         if result.contact_z_profile:
-            result_dict["contact_z_profile_points"] = len(result.contact_z_profile)
+            result_dict["contact_z_profile_points"] = len(result.contact_z_profile.positions)
 
         if result.adjusting_tx_profile:
-            result_dict["adjusting_tx_profile_points"] = len(result.adjusting_tx_profile)
+            result_dict["adjusting_tx_profile_points"] = len(result.adjusting_tx_profile.positions)
 
         if result.adjusting_ty_profile:
-            result_dict["adjusting_ty_profile_points"] = len(result.adjusting_ty_profile)
+            result_dict["adjusting_ty_profile_points"] = len(result.adjusting_ty_profile.positions)
 
         # Check if operation was successful
         if not result.success:
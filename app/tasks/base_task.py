@@ -8,9 +8,9 @@ WebSocket broadcasting.
 import asyncio
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Optional, Union
 
-from app.task_manager import Task, TaskManager, TaskStatus
+from app.task_manager import ProgressEvent, Task, TaskManager, TaskStatus
 
 logger = logging.getLogger(__name__)
 
@@ -193,7 +193,9 @@ class BaseTaskExecutor(ABC):
         self.task_manager.fail_task(task_id, error_msg)
         await self.broadcast_progress(task_id, {"message": f"Error: {error_msg}"})
 
-    def create_progress_callback(self, task_id: str) -> Callable[[dict], None]:
+    def create_progress_callback(
+        self, task_id: str
+    ) -> Callable[[Union[dict, ProgressEvent]], None]:
         """Create a synchronous progress callback for use in thread pool.
 
         The callback created by this method can be called from synchronous
@@ -214,12 +216,15 @@ class BaseTaskExecutor(ABC):
             loop = None
             logger.warning("No running event loop when creating progress callback")
 
-        def progress_callback(progress_data: dict[str, Any]):
+        def progress_callback(progress_data: Union[dict[str, Any], ProgressEvent]):
             """Synchronous progress callback that schedules async broadcast."""
             if loop is None:
                 # Silently skip if no loop available
                 return
 
+            if isinstance(progress_data, ProgressEvent):
+                progress_data = progress_data.to_dict()
+
             try:
                 # Schedule the coroutine on the event loop
                 asyncio.run_coroutine_threadsafe(
@@ -0,0 +1,8 @@
+"""
+Shared test configuration
+
+Tests run against the mock controller so the .NET DLL is never loaded.
+"""
+import os
+
+os.environ.setdefault("SURUGA_MOCK_MODE", "true")
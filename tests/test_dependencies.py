@@ -0,0 +1,34 @@
+"""
+Tests for the connection check cache in app.dependencies
+"""
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.state import state
+
+
+@pytest.fixture
+def client():
+    with TestClient(app) as client:
+        client.post("/connection/connect", json={})
+        yield client
+
+
+def test_successful_request_keeps_cache(client):
+    assert client.get("/io/analog/input/5").status_code == 200
+    assert state.connected_until > 0.0
+
+
+def test_controller_failure_invalidates_cache(client, monkeypatch):
+    assert client.get("/io/analog/input/5").status_code == 200
+    monkeypatch.setattr(state.controller, "get_analog_input", lambda channel: None)
+
+    assert client.get("/io/analog/input/5").status_code == 500
+    assert state.connected_until == 0.0
+
+
+def test_client_error_keeps_cache(client):
+    assert client.get("/io/analog/input/5").status_code == 200
+    assert client.get("/io/analog/input/1").status_code == 400
+    assert state.connected_until > 0.0
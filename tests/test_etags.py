@@ -0,0 +1,94 @@
+"""
+Tests for the ETag / If-None-Match handling of task status and code catalog endpoints
+"""
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.task_manager import TERMINAL_STATUSES, OperationType, TaskStatus, task_manager
+
+CATALOG_PATHS = [
+    "/alignment/error-codes",
+    "/alignment/status-codes",
+    "/alignment/phase-codes",
+    "/angle-adjustment/error-codes",
+    "/angle-adjustment/status-codes",
+    "/angle-adjustment/phase-codes",
+    "/profile/error-codes",
+    "/profile/status-codes",
+]
+
+
+@pytest.fixture
+def client():
+    # No lifespan: neither endpoint family touches the controller
+    return TestClient(app)
+
+
+@pytest.fixture
+def task():
+    task = task_manager.create_task(OperationType.FLAT_ALIGNMENT)
+    yield task
+    if task.status not in TERMINAL_STATUSES:
+        task_manager.fail_task(task.task_id, "test finished")
+    task_manager.clear_current_task()
+
+
+def poll(client, task, etag=None):
+    headers = {"If-None-Match": etag} if etag else {}
+    return client.get(f"/alignment/status/{task.task_id}", headers=headers)
+
+
+def test_task_etag_changes_on_every_update(client, task):
+    etags = [poll(client, task).headers["ETag"]]
+
+    task_manager.update_status(task.task_id, TaskStatus.RUNNING)
+    etags.append(poll(client, task).headers["ETag"])
+    task_manager.update_progress(task.task_id, {"phase": "FieldSearching"})
+    etags.append(poll(client, task).headers["ETag"])
+    task_manager.cancel_task(task.task_id)
+    etags.append(poll(client, task).headers["ETag"])
+
+    assert len(set(etags)) == len(etags)
+
+
+def test_task_matching_etag_returns_304(client, task):
+    etag = poll(client, task).headers["ETag"]
+
+    response = poll(client, task, etag)
+
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert response.content == b""
+
+
+def test_task_stale_etag_returns_200(client, task):
+    stale = poll(client, task).headers["ETag"]
+    task_manager.update_status(task.task_id, TaskStatus.RUNNING)
+
+    response = poll(client, task, stale)
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != stale
+    assert response.json()["status"] == TaskStatus.RUNNING.value
+
+
+def test_unknown_task_returns_404(client):
+    assert client.get("/alignment/status/missing").status_code == 404
+
+
+@pytest.mark.parametrize("path", CATALOG_PATHS)
+def test_catalog_etag(client, path):
+    response = client.get(path)
+    etag = response.headers["ETag"]
+    assert response.status_code == 200
+    assert response.json()
+
+    cached = client.get(path, headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["ETag"] == etag
+    assert cached.content == b""
+
+    stale = client.get(path, headers={"If-None-Match": '"stale"'})
+    assert stale.status_code == 200
+    assert stale.content == response.content
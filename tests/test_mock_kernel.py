@@ -0,0 +1,36 @@
+"""
+Equivalence of the mock controller's movement kernels
+"""
+import numpy as np
+import pytest
+
+from app.mock_controller import _step_axes, _step_axes_loop, _step_axes_vectorized
+
+
+def random_state(rng, n=12):
+    positions = rng.uniform(-100.0, 100.0, n)
+    targets = positions + rng.uniform(-50.0, 50.0, n)
+    # Some axes without a target, some already within the snap distance
+    targets[rng.random(n) < 0.2] = np.nan
+    near = rng.random(n) < 0.2
+    targets[near] = positions[near] + rng.uniform(-0.009, 0.009, near.sum())
+    speeds = rng.uniform(0.0, 2000.0, n)
+    moving = rng.random(n) < 0.7
+    return positions, targets, speeds, moving
+
+
+@pytest.mark.parametrize("kernel", [_step_axes_loop, _step_axes])
+def test_kernel_matches_vectorized(kernel):
+    rng = np.random.default_rng(1234)
+    for _ in range(500):
+        state = random_state(rng)
+        dt = rng.uniform(0.0, 0.2)
+        expected = [a.copy() for a in state]
+        actual = [a.copy() for a in state]
+
+        expected_arrived = _step_axes_vectorized(*expected, dt)
+        actual_arrived = kernel(*actual, dt)
+
+        np.testing.assert_array_equal(actual_arrived, expected_arrived)
+        for got, want in zip(actual, expected):
+            np.testing.assert_allclose(got, want, rtol=0, atol=1e-9, equal_nan=True)
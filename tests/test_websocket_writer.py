@@ -0,0 +1,157 @@
+"""
+Tests for the per-connection WebSocket writer in app.main.ConnectionManager
+"""
+import asyncio
+import json
+
+from app.main import WS_SEND_QUEUE_SIZE, ConnectionManager, build_multi_frame
+
+
+class FakeWebSocket:
+    """Records sent frames; sends block while the gate is cleared."""
+
+    def __init__(self):
+        self.sent = []
+        self.gate = asyncio.Event()
+        self.gate.set()
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, payload):
+        await self.gate.wait()
+        self.sent.append(payload)
+
+    async def close(self, code=1000, reason=""):
+        pass
+
+
+def frame(n):
+    return json.dumps({"type": "position_update", "n": n}, separators=(",", ":"))
+
+
+async def connect_blocked(manager):
+    """Connect a client whose writer is parked on its first send."""
+    ws = FakeWebSocket()
+    ws.gate.clear()
+    await manager.connect(ws)
+    manager.send_raw(ws, frame(0))
+    await asyncio.sleep(0)  # writer takes frame 0 and blocks in send_text
+    return ws
+
+
+async def test_frames_sent_individually_without_coalescing():
+    manager = ConnectionManager()
+    ws = await connect_blocked(manager)
+    for n in range(1, 4):
+        manager.send_raw(ws, frame(n))
+
+    ws.gate.set()
+    await manager.drain()
+
+    assert ws.sent == [frame(n) for n in range(4)]
+    manager.disconnect(ws)
+
+
+async def test_waiting_frames_coalesced_into_one_multi_frame():
+    manager = ConnectionManager(coalesce=True)
+    ws = await connect_blocked(manager)
+    for n in range(1, 4):
+        manager.send_raw(ws, frame(n))
+
+    ws.gate.set()
+    await manager.drain()
+
+    assert ws.sent[0] == frame(0)
+    assert len(ws.sent) == 2
+    multi = json.loads(ws.sent[1])
+    assert multi["type"] == "multi"
+    assert [update["n"] for update in multi["updates"]] == [1, 2, 3]
+    manager.disconnect(ws)
+
+
+async def test_coalescing_flattens_batched_frames():
+    manager = ConnectionManager(coalesce=True)
+    ws = await connect_blocked(manager)
+    manager.send_raw(ws, build_multi_frame([frame(1), frame(2)]))
+    manager.send_raw(ws, frame(3))
+
+    ws.gate.set()
+    await manager.drain()
+
+    multi = json.loads(ws.sent[1])
+    assert [update["type"] for update in multi["updates"]] == ["position_update"] * 3
+    assert [update["n"] for update in multi["updates"]] == [1, 2, 3]
+    manager.disconnect(ws)
+
+
+async def test_full_queue_drops_oldest_frames():
+    manager = ConnectionManager()
+    ws = await connect_blocked(manager)
+    overflow = 5
+    for n in range(1, WS_SEND_QUEUE_SIZE + overflow + 1):
+        manager.send_raw(ws, frame(n))
+
+    ws.gate.set()
+    await manager.drain()
+
+    sent = [json.loads(payload)["n"] for payload in ws.sent]
+    # Frame 0 was already in flight; frames 1..overflow were evicted
+    assert sent == [0] + list(range(overflow + 1, WS_SEND_QUEUE_SIZE + overflow + 1))
+    manager.disconnect(ws)
+
+
+async def test_connect_requests_full_snapshot():
+    manager = ConnectionManager()
+    ws = FakeWebSocket()
+    manager.needs_full_snapshot = False
+
+    await manager.connect(ws)
+
+    assert manager.needs_full_snapshot
+    manager.disconnect(ws)
+
+
+async def test_dropped_frame_requests_full_snapshot():
+    manager = ConnectionManager()
+    ws = await connect_blocked(manager)
+    for n in range(1, WS_SEND_QUEUE_SIZE + 1):
+        manager.send_raw(ws, frame(n))
+    manager.needs_full_snapshot = False
+
+    manager.send_raw(ws, frame(WS_SEND_QUEUE_SIZE + 1))
+
+    assert manager.needs_full_snapshot
+    ws.gate.set()
+    await manager.drain()
+    manager.disconnect(ws)
+
+
+async def test_drain_waits_for_queued_frames():
+    manager = ConnectionManager()
+    ws = await connect_blocked(manager)
+    manager.send_raw(ws, frame(1))
+
+    asyncio.get_running_loop().call_later(0.05, ws.gate.set)
+    await manager.drain(timeout=1.0)
+
+    assert ws.sent == [frame(0), frame(1)]
+    manager.disconnect(ws)
+
+
+async def test_drain_gives_up_after_timeout():
+    manager = ConnectionManager()
+    ws = await connect_blocked(manager)
+
+    await asyncio.wait_for(manager.drain(timeout=0.05), 1.0)
+
+    assert ws.sent == []
+    manager.disconnect(ws)
+
+
+def test_build_multi_frame_splices_serialized_updates():
+    payload = build_multi_frame([frame(1), build_multi_frame([frame(2), frame(3)])])
+    assert json.loads(payload) == {
+        "type": "multi",
+        "updates": [json.loads(frame(n)) for n in (1, 2, 3)],
+    }